@@ -1,14 +1,19 @@
 """LLM-based credit agent responsible for generating automated responses."""
 
-from typing import Dict
+from typing import AsyncIterator, Dict
 
-from app.utils.llm_client import generate_text
+from app.utils.llm_client import (
+    generate_text_async,
+    get_completion_cache,
+    stream_text_async,
+)
 
 
 class CreditAgent:
     """Generates automated messages for credit consultation and limit increase requests."""
 
     def __init__(self) -> None:
+        self.completion_cache = get_completion_cache("credit", enabled_by_default=True)
         self.system_prompt = (
             "Você é o Agente de Crédito do Banco Ágil.\n"
             "Sempre responda em português do Brasil, em TOM SIMPLES e DIRETO.\n\n"
@@ -23,19 +28,35 @@ class CreditAgent:
             "- Cite cada valor (limite atual, solicitado, máximo permitido) no máximo uma vez.\n"
         )
 
-    def build_limit_reply(self, cpf: str, limit_value: float) -> str:
-        """Generates an LLM response explaining the user's current credit limit and next possible actions."""
-        user_message = (
+    def limit_message(self, cpf: str, limit_value: float) -> str:
+        """Builds the LLM input describing a credit limit lookup."""
+        return (
             "Situação: o cliente está consultando o limite de crédito atual.\n"
             f"Dados:\n- CPF: {cpf}\n- Limite atual (numérico): {limit_value}\n\n"
             "Explique de forma rápida qual é o limite de crédito dele e diga que, "
             "se ele quiser, pode solicitar um aumento de limite ou uma entrevista de crédito."
         )
 
-        return generate_text(self.system_prompt, user_message)
+    async def build_limit_reply(self, cpf: str, limit_value: float) -> str:
+        """Generates an LLM response explaining the user's current credit limit and next possible actions."""
+        return await generate_text_async(
+            self.system_prompt,
+            self.limit_message(cpf, limit_value),
+            cache=self.completion_cache,
+            agent=type(self).__name__,
+        )
 
-    def build_increase_reply(self, data: Dict[str, str]) -> str:
-        """Generates an LLM response explaining why the credit-limit increase request was approved or denied."""
+    def stream_limit_reply(self, cpf: str, limit_value: float) -> AsyncIterator[str]:
+        """Streams the credit limit explanation token by token."""
+        return stream_text_async(
+            self.system_prompt,
+            self.limit_message(cpf, limit_value),
+            cache=self.completion_cache,
+            agent=type(self).__name__,
+        )
+
+    def increase_message(self, data: Dict[str, str]) -> str:
+        """Builds the LLM input explaining a credit-limit increase decision."""
         status = data["status"]
 
         base_instruction = (
@@ -64,6 +85,22 @@ class CreditAgent:
                 "Sugira pedir um valor menor ou tentar entrevista de crédito."
             )
 
-        user_message = base_instruction + "\n\n" + instruction
+        return base_instruction + "\n\n" + instruction
 
-        return generate_text(self.system_prompt, user_message)
+    async def build_increase_reply(self, data: Dict[str, str]) -> str:
+        """Generates an LLM response explaining why the credit-limit increase request was approved or denied."""
+        return await generate_text_async(
+            self.system_prompt,
+            self.increase_message(data),
+            cache=self.completion_cache,
+            agent=type(self).__name__,
+        )
+
+    def stream_increase_reply(self, data: Dict[str, str]) -> AsyncIterator[str]:
+        """Streams the credit-limit increase explanation token by token."""
+        return stream_text_async(
+            self.system_prompt,
+            self.increase_message(data),
+            cache=self.completion_cache,
+            agent=type(self).__name__,
+        )
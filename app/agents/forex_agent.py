@@ -1,12 +1,19 @@
 """LLM-based agent responsible for generating forex quotation messages."""
 
-from app.utils.llm_client import generate_text
+from typing import AsyncIterator
+
+from app.utils.llm_client import (
+    generate_text_async,
+    get_completion_cache,
+    stream_text_async,
+)
 
 
 class ForexAgent:
     """Generates automated responses for forex quotation requests."""
 
     def __init__(self) -> None:
+        self.completion_cache = get_completion_cache("forex")
         self.system_prompt = (
             "Você é o Agente de Câmbio do Banco Ágil.\n"
             "Responda sempre em português do Brasil, de forma simples.\n\n"
@@ -16,7 +23,7 @@ class ForexAgent:
             "- Use formato brasileiro de moeda (R$ 1.234,56).\n"
         )
 
-    def build_quote_reply(
+    def quote_message(
         self,
         base_currency: str,
         target_currency: str,
@@ -24,8 +31,8 @@ class ForexAgent:
         rate: float,
         converted_amount: float,
     ) -> str:
-        """Generates an LLM response explaining the exchange rate and converted amount."""
-        user_message = (
+        """Builds the LLM input describing a forex quote."""
+        return (
             "Situação: o cliente consultou cotação de moeda.\n"
             f"Moeda de origem: {base_currency}\n"
             f"Moeda de destino: {target_currency}\n"
@@ -37,4 +44,40 @@ class ForexAgent:
             "de cotação."
         )
 
-        return generate_text(self.system_prompt, user_message)
+    async def build_quote_reply(
+        self,
+        base_currency: str,
+        target_currency: str,
+        amount: float,
+        rate: float,
+        converted_amount: float,
+    ) -> str:
+        """Generates an LLM response explaining the exchange rate and converted amount."""
+        user_message = self.quote_message(
+            base_currency, target_currency, amount, rate, converted_amount
+        )
+        return await generate_text_async(
+            self.system_prompt,
+            user_message,
+            cache=self.completion_cache,
+            agent=type(self).__name__,
+        )
+
+    def stream_quote_reply(
+        self,
+        base_currency: str,
+        target_currency: str,
+        amount: float,
+        rate: float,
+        converted_amount: float,
+    ) -> AsyncIterator[str]:
+        """Streams the forex quote explanation token by token."""
+        user_message = self.quote_message(
+            base_currency, target_currency, amount, rate, converted_amount
+        )
+        return stream_text_async(
+            self.system_prompt,
+            user_message,
+            cache=self.completion_cache,
+            agent=type(self).__name__,
+        )
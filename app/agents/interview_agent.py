@@ -1,13 +1,19 @@
 """LLM-based agent responsible for generating credit interview explanations."""
 
-from typing import Dict, Any
-from app.utils.llm_client import generate_text
+from typing import Any, AsyncIterator, Dict
+
+from app.utils.llm_client import (
+    generate_text_async,
+    get_completion_cache,
+    stream_text_async,
+)
 
 
 class CreditInterviewAgent:
     """Generates explanations for the credit interview based on the computed score."""
 
     def __init__(self) -> None:
+        self.completion_cache = get_completion_cache("interview")
         self.system_prompt = (
             "Você é o Agente de Entrevista de Crédito do Banco Ágil.\n"
             "Sua função é APENAS explicar o score calculado pelo sistema.\n"
@@ -28,13 +34,31 @@ class CreditInterviewAgent:
             "- Não diga que o score foi calculado por você.\n"
         )
 
-    def build_reply(self, data: Dict[str, Any]) -> str:
-        """Generates a natural-language explanation of the computed credit score."""
-        user_message = (
+    def reply_message(self, data: Dict[str, Any]) -> str:
+        """Builds the LLM input asking for an explanation of the computed score."""
+        return (
             f"O score calculado foi {data['score']}. "
             "Explique esse resultado para o cliente com base nos dados fornecidos: "
             f"{data}."
         )
+
+    async def build_reply(self, data: Dict[str, Any]) -> str:
+        """Generates a natural-language explanation of the computed credit score."""
+        user_message = self.reply_message(data)
         message = self.system_prompt, user_message
         print(message)
-        return generate_text(self.system_prompt, user_message)
+        return await generate_text_async(
+            self.system_prompt,
+            user_message,
+            cache=self.completion_cache,
+            agent=type(self).__name__,
+        )
+
+    def stream_reply(self, data: Dict[str, Any]) -> AsyncIterator[str]:
+        """Streams the credit score explanation token by token."""
+        return stream_text_async(
+            self.system_prompt,
+            self.reply_message(data),
+            cache=self.completion_cache,
+            agent=type(self).__name__,
+        )
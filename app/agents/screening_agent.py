@@ -1,16 +1,66 @@
 """LLM-based screening agent responsible for authentication flow and natural-language responses."""
 
-from typing import Optional, Dict, Any
+import os
+from typing import Any, AsyncIterator, Dict, Optional
+
+from fastapi.concurrency import run_in_threadpool
 
 from app.controllers.auth_controller import AuthController
 from app.utils.auth_utils import extract_cpf_digits, normalize_birth_date
-from app.utils.llm_client import generate_text
+from app.utils.llm_client import (
+    generate_text_async,
+    get_completion_cache,
+    stream_text_async,
+)
+
+REPLY_TEMPLATES: Dict[str, str] = {
+    "ask_cpf": "Olá! Para começar o atendimento, informe o seu CPF.",
+    "cpf_invalid_format": (
+        "O CPF informado não é válido. Digite os 11 números do seu CPF. "
+        "Tentativa {failed_attempts} de {max_attempts}."
+    ),
+    "cpf_not_found": (
+        "Não encontrei nenhum cadastro com esse CPF. Confira os números e informe "
+        "o CPF novamente. Tentativa {failed_attempts} de {max_attempts}."
+    ),
+    "ask_birthdate": "Obrigado{name_suffix}! Agora informe a sua data de nascimento.",
+    "birthdate_invalid_format": (
+        "Não consegui entender a data informada. Digite a sua data de nascimento "
+        "novamente. Tentativa {failed_attempts} de {max_attempts}."
+    ),
+    "birthdate_mismatch": (
+        "A data de nascimento não confere com o nosso cadastro. Tente novamente. "
+        "Tentativa {failed_attempts} de {max_attempts}."
+    ),
+    "authenticated": (
+        "Seja bem-vindo(a){name_suffix}, autenticação realizada com sucesso! "
+        "Escolha uma das opções do menu para continuar."
+    ),
+    "already_authenticated": (
+        "Você já está autenticado(a){name_suffix}. Escolha uma das opções do menu "
+        "para continuar."
+    ),
+    "blocked": (
+        "Você excedeu o limite de {max_attempts} tentativas e não será possível "
+        "continuar o atendimento agora. Tente novamente mais tarde."
+    ),
+}
 
 
 class ScreeningAgent:
     """Handles the screening and authentication flow, generating LLM-based responses for each step."""
 
-    def __init__(self, auth_controller: Optional[AuthController] = None) -> None:
+    def __init__(
+        self,
+        auth_controller: Optional[AuthController] = None,
+        reply_mode: Optional[str] = None,
+    ) -> None:
+        self.reply_mode = reply_mode or os.getenv("SCREENING_REPLY_MODE", "template")
+        if self.reply_mode not in ("template", "llm"):
+            raise RuntimeError("SCREENING_REPLY_MODE must be 'template' or 'llm'")
+        self.completion_cache = get_completion_cache(
+            "screening", enabled_by_default=True
+        )
         self.auth = auth_controller or AuthController()
         self.max_attempts: int = 3
         self.reset()
@@ -85,10 +135,37 @@ class ScreeningAgent:
 
         return description + "\n\n" + instructions
 
-    def _reply_with_llm(self, context: Dict[str, Any]) -> str:
+    async def _reply_with_llm(self, context: Dict[str, Any]) -> str:
         """Generates the final LLM response based on the screening context."""
         user_message = self._build_llm_message(context)
-        return generate_text(self._system_prompt, user_message)
+        return await generate_text_async(
+            self._system_prompt,
+            user_message,
+            cache=self.completion_cache,
+            agent=type(self).__name__,
+        )
+
+    def _reply_with_template(self, context: Dict[str, Any]) -> Optional[str]:
+        """Fills the pre-written template for the event, or returns None when there is none."""
+        template = REPLY_TEMPLATES.get(context["event"])
+        if template is None:
+            return None
+
+        client = context.get("client")
+        client_name = client.get("nome") if client else None
+        return template.format(
+            name_suffix=f", {client_name}" if client_name else "",
+            failed_attempts=context["failed_attempts"],
+            max_attempts=context["max_attempts"],
+        )
+
+    async def _reply(self, context: Dict[str, Any]) -> str:
+        """Answers from a template in template mode, falling back to the LLM for unknown events."""
+        if self.reply_mode == "template":
+            reply = self._reply_with_template(context)
+            if reply is not None:
+                return reply
+        return await self._reply_with_llm(context)
 
     def _increment_failed(self) -> bool:
         """Increments failed attempts and returns whether the user is now blocked."""
@@ -98,8 +175,8 @@ class ScreeningAgent:
             return True
         return False
 
-    def ask(self, user_input: str) -> str:
-        """Processes the user's input according to the current authentication stage and generates an LLM reply."""
+    async def advance(self, user_input: str) -> Dict[str, Any]:
+        """Moves the authentication flow forward with the user's input and returns the resulting context."""
         raw_input = user_input.strip()
 
         if self.stage == "blocked":
@@ -112,7 +189,7 @@ class ScreeningAgent:
                 "authenticated": self.authenticated,
                 "client": self.client,
             }
-            return self._reply_with_llm(context)
+            return context
 
         if self.authenticated and self.stage == "authenticated":
             context = {
@@ -124,7 +201,7 @@ class ScreeningAgent:
                 "authenticated": self.authenticated,
                 "client": self.client,
             }
-            return self._reply_with_llm(context)
+            return context
 
         if self.stage == "ask_cpf":
 
@@ -138,7 +215,7 @@ class ScreeningAgent:
                     "authenticated": self.authenticated,
                     "client": None,
                 }
-                return self._reply_with_llm(context)
+                return context
 
             cpf_digits = extract_cpf_digits(raw_input)
 
@@ -155,9 +232,9 @@ class ScreeningAgent:
                     "authenticated": self.authenticated,
                     "client": None,
                 }
-                return self._reply_with_llm(context)
+                return context
 
-            client = self.auth.find_client_by_cpf(cpf_digits)
+            client = await run_in_threadpool(self.auth.find_client_by_cpf, cpf_digits)
             if client is None:
                 blocked = self._increment_failed()
                 event = "cpf_not_found" if not blocked else "blocked"
@@ -171,7 +248,7 @@ class ScreeningAgent:
                     "authenticated": self.authenticated,
                     "client": None,
                 }
-                return self._reply_with_llm(context)
+                return context
 
             self.cpf = cpf_digits
             self.client = client
@@ -186,7 +263,7 @@ class ScreeningAgent:
                 "authenticated": self.authenticated,
                 "client": self.client,
             }
-            return self._reply_with_llm(context)
+            return context
 
         if self.stage == "ask_birthdate":
 
@@ -200,7 +277,7 @@ class ScreeningAgent:
                     "authenticated": self.authenticated,
                     "client": self.client,
                 }
-                return self._reply_with_llm(context)
+                return context
 
             try:
                 normalized = normalize_birth_date(raw_input)
@@ -217,7 +294,7 @@ class ScreeningAgent:
                     "authenticated": self.authenticated,
                     "client": self.client,
                 }
-                return self._reply_with_llm(context)
+                return context
 
             expected = (self.client or {}).get("data_nascimento")
             if expected and normalized != expected:
@@ -233,7 +310,7 @@ class ScreeningAgent:
                     "authenticated": self.authenticated,
                     "client": self.client,
                 }
-                return self._reply_with_llm(context)
+                return context
 
             self.birth_date = normalized
             self.authenticated = True
@@ -248,7 +325,7 @@ class ScreeningAgent:
                 "authenticated": self.authenticated,
                 "client": self.client,
             }
-            return self._reply_with_llm(context)
+            return context
 
         context = {
             "state": self.stage,
@@ -259,4 +336,25 @@ class ScreeningAgent:
             "authenticated": self.authenticated,
             "client": self.client,
         }
-        return self._reply_with_llm(context)
+        return context
+
+    async def ask(self, user_input: str) -> str:
+        """Processes the user's input according to the current authentication stage and generates a reply."""
+        return await self._reply(await self.advance(user_input))
+
+    async def stream_reply(self, context: Dict[str, Any]) -> AsyncIterator[str]:
+        """Streams the reply for an advanced context, yielding a template reply in one piece."""
+        if self.reply_mode == "template":
+            reply = self._reply_with_template(context)
+            if reply is not None:
+                yield reply
+                return
+
+        user_message = self._build_llm_message(context)
+        async for token in stream_text_async(
+            self._system_prompt,
+            user_message,
+            cache=self.completion_cache,
+            agent=type(self).__name__,
+        ):
+            yield token
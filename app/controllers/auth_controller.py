@@ -1,33 +1,33 @@
 """Authentication controller responsible for validating CPF and birth date against stored client data."""
 
-from typing import Optional, Dict, List
+import os
+from typing import Optional, Dict
 from fastapi import HTTPException, status
-from app.utils.auth_utils import read_csv, clean_cpf
+from app.repositories.client_repository import ClientRepository
+from app.repositories.factory import get_client_repository
 
 
 class AuthController:
     """Provides methods to locate and authenticate clients based on CPF and birth date."""
 
-    def __init__(self) -> None:
-        self._clients: List[Dict[str, str]] = read_csv()
+    def __init__(self, clients: Optional[ClientRepository] = None) -> None:
+        if clients is None:
+            path = os.getenv("CSV_PATH")
+            if not path:
+                raise RuntimeError("CSV_PATH not set.")
+            clients = get_client_repository(path)
+
+        self._clients = clients
 
     def find_client_by_cpf(self, cpf: str) -> Optional[Dict[str, str]]:
         """Returns the client record matching the given CPF, or None if not found."""
-        target = clean_cpf(cpf)
-        for row in self._clients:
-            if clean_cpf(row["cpf"]) == target:
-                return row
-        return None
+        return self._clients.get_by_cpf(cpf)
 
     def login(self, cpf: str, birth_date: str) -> Dict[str, Dict[str, str]]:
         """Validates CPF and birth date, returning the client data if correct; raises 401 otherwise."""
-        cleaned = clean_cpf(cpf)
-        for row in self._clients:
-            if (
-                clean_cpf(row["cpf"]) == cleaned
-                and row["data_nascimento"] == birth_date
-            ):
-                return {"client": row}
+        row = self._clients.get_by_cpf(cpf)
+        if row is not None and row["data_nascimento"] == birth_date:
+            return {"client": row}
 
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
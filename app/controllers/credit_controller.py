@@ -1,12 +1,17 @@
 """Controller responsible for credit-related operations such as limit lookup and limit increase requests."""
 
+import asyncio
+import datetime
 import os
-from typing import Dict
+from collections import Counter
+from typing import AsyncIterator, Dict, Optional, Tuple
 
 from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 
 from app.services.credit_service import CreditService
 from app.agents.credit_agent import CreditAgent
+from app.utils.bulk_input import detect_format, parse_increase_requests
 
 
 class CreditController:
@@ -27,29 +32,140 @@ class CreditController:
         )
 
         self.agent = CreditAgent()
+        self.bulk_max_rows = int(os.getenv("CREDIT_BULK_MAX_ROWS", "100000"))
 
-    def get_limit(self, cpf: str) -> Dict[str, object]:
-        """Fetches the user's current credit limit and generates an LLM explanation."""
+    async def _fetch_limit(self, cpf: str) -> float:
+        """Reads the client's current limit off the event loop, mapping a missing client to 404."""
         try:
-            limit_value = self.service.get_current_limit(cpf)
+            return await run_in_threadpool(self.service.get_current_limit, cpf)
         except ValueError as exc:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Client not found",
             ) from exc
 
-        reply = self.agent.build_limit_reply(cpf, limit_value)
-        return {"limit": limit_value, "reply": reply}
+    async def _evaluate_increase(
+        self, cpf: str, requested_limit: float
+    ) -> Dict[str, str]:
+        """Evaluates an increase request off the event loop, mapping a missing client to 404."""
+        try:
+            return await run_in_threadpool(
+                self.service.evaluate_increase_request, cpf, requested_limit
+            )
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Client not found",
+            ) from exc
 
-    def request_increase(self, cpf: str, requested_limit: float) -> Dict[str, object]:
-        """Processes a limit increase request and returns both system evaluation and an LLM response."""
+    @staticmethod
+    def _parse_timestamp(name: str, value: Optional[str]) -> Optional[str]:
+        """Normalizes an ISO 8601 filter to the naive UTC format of the request log, or raises 400."""
+        if value is None:
+            return None
         try:
-            result = self.service.evaluate_increase_request(cpf, requested_limit)
+            parsed = datetime.datetime.fromisoformat(value)
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid '{name}' timestamp: {value}",
+            ) from exc
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        return parsed.isoformat()
+
+    async def get_history(
+        self,
+        cpf: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> Dict[str, object]:
+        """Returns a page of the client's increase requests within [start, end), newest first."""
+        start = self._parse_timestamp("start", start)
+        end = self._parse_timestamp("end", end)
+        invalid_cursor = HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+        if cursor is not None and not (cursor.isascii() and cursor.isdecimal()):
+            raise invalid_cursor
+
+        try:
+            await run_in_threadpool(self.service.get_client_by_cpf, cpf)
         except ValueError as exc:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Client not found",
             ) from exc
 
-        reply = self.agent.build_increase_reply(result)
+        try:
+            page = await run_in_threadpool(
+                self.service.get_request_history, cpf, start, end, cursor, limit
+            )
+        except ValueError as exc:
+            raise invalid_cursor from exc
+
+        return {"cpf": cpf, "items": page.items, "next_cursor": page.next_cursor}
+
+    async def get_stats(self) -> Dict[str, object]:
+        """Returns the running request aggregates overall, per day and per score band."""
+        return await run_in_threadpool(self.service.get_request_stats)
+
+    async def get_limit(self, cpf: str) -> Dict[str, object]:
+        """Fetches the user's current credit limit and generates an LLM explanation."""
+        limit_value = await self._fetch_limit(cpf)
+        reply = await self.agent.build_limit_reply(cpf, limit_value)
+        return {"limit": limit_value, "reply": reply}
+
+    async def stream_limit(
+        self, cpf: str
+    ) -> Tuple[Dict[str, object], AsyncIterator[str]]:
+        """Fetches the user's current credit limit and returns it with a streamed LLM explanation."""
+        limit_value = await self._fetch_limit(cpf)
+        return {"limit": limit_value}, self.agent.stream_limit_reply(cpf, limit_value)
+
+    async def request_increase(
+        self, cpf: str, requested_limit: float
+    ) -> Dict[str, object]:
+        """Processes a limit increase request and returns both system evaluation and an LLM response."""
+        result = await self._evaluate_increase(cpf, requested_limit)
+        reply = await self.agent.build_increase_reply(result)
         return {"data": result, "reply": reply}
+
+    async def stream_increase(
+        self, cpf: str, requested_limit: float
+    ) -> Tuple[Dict[str, object], AsyncIterator[str]]:
+        """Processes a limit increase request and returns the evaluation with a streamed LLM response."""
+        result = await self._evaluate_increase(cpf, requested_limit)
+        return {"data": result}, self.agent.stream_increase_reply(result)
+
+    async def request_increases_bulk(
+        self, body: str, content_type: str, with_replies: bool = False
+    ) -> Dict[str, object]:
+        """Evaluates a CSV or NDJSON batch of increase requests, optionally with one LLM reply per status."""
+        try:
+            increase_requests = parse_increase_requests(
+                body, detect_format(content_type), self.bulk_max_rows
+            )
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(exc),
+            ) from exc
+
+        results = await run_in_threadpool(
+            self.service.evaluate_increase_requests, increase_requests
+        )
+        summary = Counter(result["status"] for result in results)
+
+        replies: Dict[str, str] = {}
+        if with_replies:
+            statuses = sorted(set(summary) - {"client_not_found"})
+            texts = await asyncio.gather(
+                *(self.agent.build_increase_reply({"status": s}) for s in statuses)
+            )
+            replies = dict(zip(statuses, texts))
+
+        return {"results": results, "summary": dict(summary), "replies": replies}
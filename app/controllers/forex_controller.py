@@ -1,10 +1,11 @@
 """Controller responsible for handling forex quotation requests."""
 
-from typing import Dict
+from typing import AsyncIterator, Dict, List, Tuple
 
 from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 
-from app.services.forex_service import ForexService
+from app.services.forex_service import ForexService, UnknownCurrencyError
 from app.agents.forex_agent import ForexAgent
 
 
@@ -13,27 +14,42 @@ class ForexController:
         self.service = ForexService()
         self.agent = ForexAgent()
 
-    def get_quote(self, base: str, target: str, amount: float) -> Dict[str, object]:
+    @staticmethod
+    def _unknown_currency(pair: str) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Par de moedas inválido ou não encontrado: {pair}.",
+        )
+
+    @staticmethod
+    def _upstream_unavailable() -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Não foi possível consultar a cotação no momento. Tente novamente mais tarde.",
+        )
+
+    async def _fetch_quote(
+        self, base: str, target: str, amount: float
+    ) -> Dict[str, float]:
         try:
-            data = self.service.get_quote(base=base, target=target, amount=amount)
+            data = await run_in_threadpool(
+                self.service.get_quote, base=base, target=target, amount=amount
+            )
+        except UnknownCurrencyError as exc:
+            raise self._unknown_currency(f"{base.upper()}/{target.upper()}") from exc
         except RuntimeError as exc:
-            msg = str(exc).lower()
-
-            if "404" in msg or "not found" in msg:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Par de moedas inválido ou não encontrado: {base.upper()}/{target.upper()}.",
-                ) from exc
+            raise self._upstream_unavailable() from exc
 
-            raise HTTPException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
-                detail="Não foi possível consultar a cotação no momento. Tente novamente mais tarde.",
-            ) from exc
+        return data
 
+    async def get_quote(
+        self, base: str, target: str, amount: float
+    ) -> Dict[str, object]:
+        data = await self._fetch_quote(base, target, amount)
         rate = data["rate"]
         converted_amount = data["converted_amount"]
 
-        reply = self.agent.build_quote_reply(
+        reply = await self.agent.build_quote_reply(
             base_currency=base,
             target_currency=target,
             amount=amount,
@@ -46,3 +62,48 @@ class ForexController:
             "converted_amount": converted_amount,
             "reply": reply,
         }
+
+    async def stream_quote(
+        self, base: str, target: str, amount: float
+    ) -> Tuple[Dict[str, object], AsyncIterator[str]]:
+        data = await self._fetch_quote(base, target, amount)
+        rate = data["rate"]
+        converted_amount = data["converted_amount"]
+
+        tokens = self.agent.stream_quote_reply(
+            base_currency=base,
+            target_currency=target,
+            amount=amount,
+            rate=rate,
+            converted_amount=converted_amount,
+        )
+        return {"rate": rate, "converted_amount": converted_amount}, tokens
+
+    async def get_quotes(
+        self, quotes: List[Dict[str, object]]
+    ) -> List[Dict[str, object]]:
+        bases = [quote["base"] for quote in quotes]
+        targets = [quote["target"] for quote in quotes]
+        amounts = [quote["amount"] for quote in quotes]
+
+        try:
+            data = await run_in_threadpool(
+                self.service.get_quotes, bases, targets, amounts
+            )
+        except UnknownCurrencyError as exc:
+            raise self._unknown_currency(", ".join(exc.codes)) from exc
+        except RuntimeError as exc:
+            raise self._upstream_unavailable() from exc
+
+        return [
+            {
+                "base": base.upper(),
+                "target": target.upper(),
+                "amount": amount,
+                "rate": rate,
+                "converted_amount": converted,
+            }
+            for base, target, amount, rate, converted in zip(
+                bases, targets, amounts, data["rates"], data["converted_amounts"]
+            )
+        ]
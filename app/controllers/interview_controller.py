@@ -1,10 +1,14 @@
 """Controller responsible for handling credit interview logic and generating explanations via LLM."""
 
 import os
+from typing import Any, AsyncIterator, Dict, Tuple
+
 from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 
 from app.services.interview_service import InterviewService
 from app.agents.interview_agent import CreditInterviewAgent
+from app.utils.bulk_input import detect_format, parse_interview_applicants
 
 
 class InterviewController:
@@ -15,8 +19,9 @@ class InterviewController:
 
         self.service = InterviewService(clients_csv_path=clients_csv)
         self.agent = CreditInterviewAgent()
+        self.batch_max_rows = int(os.getenv("INTERVIEW_BATCH_MAX_ROWS", "100000"))
 
-    def run_interview(
+    async def _score_client(
         self,
         cpf: str,
         monthly_income: float,
@@ -24,8 +29,8 @@ class InterviewController:
         job_type: str,
         dependents_count: int,
         has_debt: bool,
-    ):
-        """Calculates the credit score, updates the client record, and generates an LLM explanation."""
+    ) -> Tuple[float, Dict[str, Any]]:
+        """Calculates and stores the client's score, returning it with the data the agent explains."""
         score = self.service.calculate_score(
             monthly_income,
             monthly_expenses,
@@ -35,7 +40,9 @@ class InterviewController:
         )
 
         try:
-            updated = self.service.update_client_score(cpf, score)
+            updated = await run_in_threadpool(
+                self.service.update_client_score, cpf, score
+            )
         except FileNotFoundError as exc:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -57,7 +64,65 @@ class InterviewController:
             "numero_dependentes": dependents_count,
             "tem_dividas": has_debt,
         }
+        return score, interview_result
 
-        reply_text = self.agent.build_reply(interview_result)
+    async def run_interview(
+        self,
+        cpf: str,
+        monthly_income: float,
+        monthly_expenses: float,
+        job_type: str,
+        dependents_count: int,
+        has_debt: bool,
+    ):
+        """Calculates the credit score, updates the client record, and generates an LLM explanation."""
+        score, interview_result = await self._score_client(
+            cpf, monthly_income, monthly_expenses, job_type, dependents_count, has_debt
+        )
+
+        reply_text = await self.agent.build_reply(interview_result)
 
         return {"score": score, "reply": reply_text}
+
+    async def stream_interview(
+        self,
+        cpf: str,
+        monthly_income: float,
+        monthly_expenses: float,
+        job_type: str,
+        dependents_count: int,
+        has_debt: bool,
+    ) -> Tuple[Dict[str, object], AsyncIterator[str]]:
+        """Calculates and stores the credit score, returning it with a streamed LLM explanation."""
+        score, interview_result = await self._score_client(
+            cpf, monthly_income, monthly_expenses, job_type, dependents_count, has_debt
+        )
+        return {"score": score}, self.agent.stream_reply(interview_result)
+
+    async def run_batch(self, body: str, content_type: str) -> Dict[str, object]:
+        """Scores a CSV or NDJSON file of applicants in one vectorized pass, without LLM replies."""
+        try:
+            columns = parse_interview_applicants(
+                body, detect_format(content_type), self.batch_max_rows
+            )
+            scores = await run_in_threadpool(
+                self.service.calculate_scores,
+                columns["monthly_income"],
+                columns["monthly_expenses"],
+                columns["job_type"],
+                columns["dependents_count"],
+                columns["has_debt"],
+            )
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(exc),
+            ) from exc
+
+        return {
+            "version": self.service.scorer.config.version,
+            "results": [
+                {"cpf": cpf, "score": score}
+                for cpf, score in zip(columns["cpf"], scores)
+            ],
+        }
@@ -0,0 +1,236 @@
+"""Opt-in ASGI middleware that profiles single live requests on an admin's demand."""
+
+import cProfile
+import hmac
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter
+from pathlib import Path
+from typing import Callable, List, Optional
+from urllib.parse import parse_qs
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+PROFILE_HEADER = "x-profile"
+PROFILE_TOKEN_HEADER = "x-profile-token"
+PROFILE_QUERY_PARAM = "profile"
+PROFILE_MODES = ("cprofile", "sample")
+MAX_SAMPLE_HZ = 1000.0
+
+
+class StackSampler:
+    """Samples the stacks of every thread at a fixed rate into folded flamegraph lines.
+
+    Unlike cProfile, which only sees the event loop thread, sampling also
+    captures sync endpoints and agents running in the threadpool.
+    """
+
+    def __init__(self, hz: float) -> None:
+        self._interval = 1 / min(max(hz, 1.0), MAX_SAMPLE_HZ)
+        self._stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="request-profiler", daemon=True
+        )
+
+    def start(self) -> None:
+        """Starts sampling in a background thread."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops sampling and waits for the sampler thread."""
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while True:
+            self._sample(own_id)
+            if self._stop.wait(self._interval):
+                return
+
+    def _sample(self, own_id: int) -> None:
+        """Counts the current stack of every thread but the sampler, rooted at the thread name."""
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id:
+                continue
+            stack: List[str] = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(
+                    f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+                )
+                frame = frame.f_back
+            stack.append(names.get(thread_id, str(thread_id)))
+            self._stacks[";".join(reversed(stack))] += 1
+
+    def write(self, path: Path) -> None:
+        """Writes one "frame;frame;frame count" line per distinct stack."""
+        with path.open("w", encoding="utf-8") as f:
+            for stack, count in self._stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class ProfilingMiddleware:
+    """Runs a request under cProfile or a stack sampler when it carries the admin token.
+
+    A request opts in with the X-Profile header or the profile query parameter
+    ("1" or "cprofile" for cProfile, "sample" for the stack sampler) and must
+    send PROFILING_ADMIN_TOKEN in X-Profile-Token. At most one request is
+    profiled at a time and at most one per PROFILING_MIN_INTERVAL_SECONDS;
+    others run normally. The output is written under PROFILING_OUTPUT_DIR,
+    keeping the newest PROFILING_MAX_FILES files, and its path is returned in
+    the X-Profile-Path header. cProfile also records other requests served by
+    the event loop meanwhile, so profiles are best taken on a quiet instance.
+    """
+
+    def __init__(self, app: ASGIApp, admin_token: Optional[str] = None) -> None:
+        self.app = app
+        self._admin_token = admin_token or os.getenv("PROFILING_ADMIN_TOKEN", "")
+        self._min_interval = float(os.getenv("PROFILING_MIN_INTERVAL_SECONDS", "10"))
+        self._sample_hz = float(os.getenv("PROFILING_SAMPLE_HZ", "100"))
+        self._max_files = int(os.getenv("PROFILING_MAX_FILES", "100"))
+        self._output_dir = Path(
+            os.getenv(
+                "PROFILING_OUTPUT_DIR",
+                str(Path(tempfile.gettempdir()) / "banco_agil_profiles"),
+            )
+        )
+        self._lock = threading.Lock()
+        self._last_started = float("-inf")
+
+    def _requested_mode(self, scope: Scope) -> Optional[str]:
+        """Returns the profiling mode the request asks for with a valid token, or None."""
+        headers = dict(scope.get("headers") or [])
+        value = headers.get(PROFILE_HEADER.encode(), b"").decode("latin-1")
+        if not value:
+            query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+            value = (query.get(PROFILE_QUERY_PARAM) or [""])[0]
+        value = value.lower()
+        if value not in ("1", "true") + PROFILE_MODES:
+            return None
+
+        token = headers.get(PROFILE_TOKEN_HEADER.encode(), b"")
+        if not self._admin_token or not hmac.compare_digest(
+            token, self._admin_token.encode()
+        ):
+            return None
+        return value if value in PROFILE_MODES else "cprofile"
+
+    def _acquire_slot(self) -> bool:
+        """Claims the single profiling slot unless one is running or the interval has not passed."""
+        if not self._lock.acquire(blocking=False):
+            return False
+        now = time.monotonic()
+        if now - self._last_started < self._min_interval:
+            self._lock.release()
+            return False
+        self._last_started = now
+        return True
+
+    def _output_path(self, scope: Scope, mode: str) -> Path:
+        """Names the profile after the matched route template, so path parameters such as CPFs never appear."""
+        template = getattr(scope.get("route"), "path", "unmatched")
+        route = re.sub(r"[^A-Za-z0-9]+", "_", template).strip("_") or "root"
+        suffix = "pstats" if mode == "cprofile" else "folded"
+        name = (
+            f"{time.strftime('%Y%m%dT%H%M%S')}-{scope['method'].lower()}-"
+            f"{route[:60]}-{uuid.uuid4().hex[:8]}.{suffix}"
+        )
+        return self._output_dir / name
+
+    def _prune(self) -> None:
+        """Deletes the oldest profiles beyond PROFILING_MAX_FILES."""
+        files = sorted(
+            [*self._output_dir.glob("*.pstats"), *self._output_dir.glob("*.folded")],
+            key=lambda p: p.stat().st_mtime,
+        )
+        for path in files[: max(len(files) - self._max_files, 0)]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        mode = self._requested_mode(scope)
+        if mode is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not self._acquire_slot():
+            await self.app(scope, receive, self._with_header(send, b"rate_limited"))
+            return
+
+        try:
+            try:
+                self._output_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as exc:
+                print("PROFILING ERROR:", exc)
+                await self.app(scope, receive, send)
+                return
+
+            # The route is only matched inside the app, so the name is picked on first use.
+            path: Optional[Path] = None
+
+            def output_path() -> Path:
+                nonlocal path
+                if path is None:
+                    path = self._output_path(scope, mode)
+                return path
+
+            send = self._with_header(
+                send, b"profiled", lambda: str(output_path()).encode()
+            )
+            if mode == "cprofile":
+                profiler = cProfile.Profile()
+                profiler.enable()
+                try:
+                    await self.app(scope, receive, send)
+                finally:
+                    profiler.disable()
+                    self._save(lambda: profiler.dump_stats(str(output_path())))
+            else:
+                sampler = StackSampler(self._sample_hz)
+                sampler.start()
+                try:
+                    await self.app(scope, receive, send)
+                finally:
+                    sampler.stop()
+                    self._save(lambda: sampler.write(output_path()))
+        finally:
+            self._lock.release()
+
+    def _save(self, write: Callable[[], None]) -> None:
+        """Writes a profile and prunes old ones, logging instead of failing the request."""
+        try:
+            write()
+            self._prune()
+        except Exception as exc:
+            print("PROFILING ERROR:", exc)
+
+    @staticmethod
+    def _with_header(
+        send: Send, status: bytes, path: Optional[Callable[[], bytes]] = None
+    ) -> Send:
+        """Wraps send to add the profiling status, and the output path, to the response headers."""
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-profile-status", status))
+                if path is not None:
+                    headers.append((b"x-profile-path", path()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        return send_wrapper
@@ -1,6 +1,6 @@
 """Pydantic schemas for credit limit and limit increase operations."""
 
-from typing import Dict
+from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -23,3 +23,41 @@ class CreditIncreaseResponse(BaseModel):
 
     data: Dict[str, str]
     reply: str
+
+
+class CreditBulkIncreaseResponse(BaseModel):
+    """Response model for a bulk evaluation: one result per input row, status counts and optional replies."""
+
+    results: List[Dict[str, str]]
+    summary: Dict[str, int]
+    replies: Dict[str, str] = {}
+
+
+class CreditHistoryResponse(BaseModel):
+    """Response model for one page of a client's increase requests, newest first."""
+
+    cpf: str
+    items: List[Dict[str, str]]
+    next_cursor: Optional[str] = None
+
+
+class CreditStatsBucket(BaseModel):
+    """Request counts, status rates and average amounts for one group of requests."""
+
+    requests: int
+    approved: int
+    rejected: int
+    requested_below_current: int
+    approval_rate: float
+    rejection_rate: float
+    below_current_rate: float
+    avg_requested: float
+    avg_granted: float
+
+
+class CreditStatsResponse(BaseModel):
+    """Response model for request analytics overall, per UTC day and per score band."""
+
+    overall: CreditStatsBucket
+    by_day: Dict[str, CreditStatsBucket]
+    by_score_band: Dict[str, CreditStatsBucket]
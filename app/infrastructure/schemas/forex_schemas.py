@@ -1,6 +1,8 @@
 """Pydantic schemas for forex quotation operations."""
 
-from pydantic import BaseModel
+from typing import List
+
+from pydantic import BaseModel, Field
 
 
 class FxQuoteRequest(BaseModel):
@@ -17,3 +19,25 @@ class FxQuoteResponse(BaseModel):
     rate: float
     converted_amount: float
     reply: str
+
+
+class FxBatchQuoteRequest(BaseModel):
+    """Request model for pricing many currency pairs at once."""
+
+    quotes: List[FxQuoteRequest] = Field(min_length=1, max_length=10000)
+
+
+class FxBatchQuoteItem(BaseModel):
+    """One priced currency pair of a batch quote."""
+
+    base: str
+    target: str
+    amount: float
+    rate: float
+    converted_amount: float
+
+
+class FxBatchQuoteResponse(BaseModel):
+    """Response model containing every priced pair, in request order, without LLM text."""
+
+    quotes: List[FxBatchQuoteItem]
@@ -1,5 +1,7 @@
 """Pydantic schemas for credit interview requests and responses."""
 
+from typing import List
+
 from pydantic import BaseModel
 
 
@@ -19,3 +21,17 @@ class CreditInterviewResponse(BaseModel):
 
     score: float
     reply: str
+
+
+class InterviewBatchItem(BaseModel):
+    """Score of one applicant of a batch, with its CPF when the input had one."""
+
+    cpf: str
+    score: float
+
+
+class InterviewBatchResponse(BaseModel):
+    """Response model listing batch scores in input order and the scoring config version used."""
+
+    version: str
+    results: List[InterviewBatchItem]
@@ -13,3 +13,5 @@ class ScreeningResponse(BaseModel):
     """Response returned by the screening agent."""
 
     reply: str
+    authenticated: bool = False
+    session_id: str
@@ -0,0 +1,160 @@
+"""Write-ahead journal of client field updates applied on top of the clients CSV."""
+
+import json
+import os
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Sequence, Tuple
+
+from app.utils.metrics import CSV_IO_DURATION
+
+JournalEntry = Dict[str, str]
+
+
+def fsync_directory(path: Path) -> None:
+    """Flushes a directory entry so that renames inside it survive a crash."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class ClientJournal:
+    """Appends one JSON line per field update and rotates the log out for compaction."""
+
+    def __init__(self, csv_path: Path, fsync: bool = True) -> None:
+        self.path = csv_path.with_name(csv_path.name + ".journal")
+        self.compacting_path = csv_path.with_name(csv_path.name + ".journal.compacting")
+        self._fsync = fsync
+
+    @staticmethod
+    def _read_records(f: BinaryIO, offset: int) -> Tuple[List[JournalEntry], int]:
+        """Parses complete records from offset, skipping torn ones, and returns the end offset."""
+        entries: List[JournalEntry] = []
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            offset += len(line)
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                continue
+        return entries, offset
+
+    def _open(self, path: Path) -> Optional[BinaryIO]:
+        try:
+            return path.open("rb")
+        except FileNotFoundError:
+            return None
+
+    def recover(self) -> Tuple[List[JournalEntry], Tuple[int, int]]:
+        """Returns every pending entry, oldest first, and the live journal position read up to.
+
+        The live journal is opened before the rotated one is read, so a concurrent
+        rotation can only make entries appear twice, never go missing; replaying
+        a set-field sequence twice yields the same state.
+        """
+        live = self._open(self.path)
+        try:
+            inode = os.fstat(live.fileno()).st_ino if live is not None else 0
+            entries: List[JournalEntry] = []
+            compacting = self._open(self.compacting_path)
+            if compacting is not None:
+                with compacting:
+                    entries, _ = self._read_records(compacting, 0)
+
+            offset = 0
+            if live is not None:
+                live_entries, offset = self._read_records(live, 0)
+                entries.extend(live_entries)
+            return entries, (inode, offset)
+        finally:
+            if live is not None:
+                live.close()
+
+    def read_from(
+        self, inode: int, offset: int
+    ) -> Optional[Tuple[List[JournalEntry], Tuple[int, int]]]:
+        """Returns entries appended to the live journal after a position, or None if it was rotated.
+
+        An inode of 0 means no live journal existed at the last read, so any
+        journal found now was created afterwards and is read from the start.
+        """
+        live = self._open(self.path)
+        if live is None:
+            return None if inode else ([], (0, 0))
+
+        with live:
+            current = os.fstat(live.fileno()).st_ino
+            if inode and current != inode:
+                return None
+            entries, end = self._read_records(live, offset if inode else 0)
+            return entries, (current, end)
+
+    def append(self, cpf: str, field: str, value: str) -> None:
+        """Durably appends one field update, starting a fresh line after a torn record."""
+        self.append_many([(cpf, field, value)])
+
+    def append_many(self, updates: Sequence[Tuple[str, str, str]]) -> None:
+        """Durably appends (cpf, field, value) updates with a single write and fsync."""
+        record = "".join(
+            json.dumps({"cpf": cpf, "field": field, "value": value}) + "\n"
+            for cpf, field, value in updates
+        )
+        with CSV_IO_DURATION.time(operation="journal_append", file=self.path.name):
+            with self.path.open("ab+") as f:
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        record = "\n" + record
+                f.write(record.encode("utf-8"))
+                f.flush()
+                if self._fsync:
+                    os.fsync(f.fileno())
+
+    def rotate(self) -> bool:
+        """Moves the live journal aside for compaction, returning False when it is empty."""
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            return False
+
+        if self.compacting_path.exists():
+            with self.path.open("rb") as src, self.compacting_path.open("ab") as dst:
+                dst.write(src.read())
+                dst.flush()
+                os.fsync(dst.fileno())
+            os.remove(self.path)
+        else:
+            os.replace(self.path, self.compacting_path)
+
+        fsync_directory(self.path.parent)
+        return True
+
+    def discard_compacted(self) -> None:
+        """Deletes the rotated journal once its entries are part of the CSV."""
+        try:
+            os.remove(self.compacting_path)
+        except FileNotFoundError:
+            return
+        fsync_directory(self.path.parent)
+
+
+def apply_entries(
+    rows_by_cpf: Dict[str, Dict[str, str]],
+    fieldnames: List[str],
+    entries: Sequence[JournalEntry],
+) -> None:
+    """Replays journal entries onto indexed rows, ignoring CPFs no longer present."""
+    for entry in entries:
+        row = rows_by_cpf.get(entry.get("cpf", ""))
+        field = entry.get("field")
+        if row is None or not field:
+            continue
+        if field not in fieldnames:
+            fieldnames.append(field)
+        row[field] = entry.get("value", "")
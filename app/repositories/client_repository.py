@@ -0,0 +1,315 @@
+"""Client repository interface and its CSV implementation indexed in memory by normalized CPF."""
+
+import csv
+import os
+import threading
+from abc import ABC, abstractmethod
+from contextlib import ExitStack
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.repositories.client_journal import (
+    ClientJournal,
+    apply_entries,
+    fsync_directory,
+)
+from app.utils.auth_utils import clean_cpf
+from app.utils.csv_cache import Signature, csv_cache
+from app.utils.locks import LockStripes, file_lock
+from app.utils.metrics import CSV_IO_DURATION
+
+PERSISTENCE_MODES = ("rewrite", "journal")
+
+
+def write_csv_atomically(
+    path: Path, fieldnames: Sequence[str], rows: Sequence[Dict[str, str]]
+) -> None:
+    """Writes rows to a temporary sibling file and renames it over the target."""
+    with CSV_IO_DURATION.time(operation="rewrite", file=path.name):
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with tmp_path.open("w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp_path, path)
+        fsync_directory(path.parent)
+
+
+class ClientRepository(ABC):
+    """Storage-agnostic access to client records keyed by CPF."""
+
+    @abstractmethod
+    def list_all(self) -> List[Dict[str, str]]:
+        """Returns copies of all client records."""
+
+    @abstractmethod
+    def get_by_cpf(self, cpf: str) -> Optional[Dict[str, str]]:
+        """Returns a copy of the client record for the given CPF, or None if not found."""
+
+    @abstractmethod
+    def update_field(self, cpf: str, field: str, value: str) -> Dict[str, str]:
+        """Sets one field of a client record, persists it and returns the updated record."""
+
+    def update_many(self, updates: Sequence[Tuple[str, str, str]]) -> None:
+        """Applies (cpf, field, value) updates in order; backends override this to persist them at once."""
+        for cpf, field, value in updates:
+            self.update_field(cpf, field, value)
+
+
+class CsvClientRepository(ClientRepository):
+    """Keeps the clients CSV in memory with an O(1) CPF index and persists field updates.
+
+    In "rewrite" mode every update atomically rewrites the CSV. In "journal" mode
+    updates are appended to a write-ahead journal and a background thread folds
+    the journal into the CSV once it reaches the compaction threshold or interval.
+
+    Updates to the same CPF are serialized by a striped in-process lock. Across
+    processes, rewrites and compactions take an exclusive flock on a sibling
+    ".lock" file and re-read the file under it, while journal appends take a
+    shared one, so updates to different clients can proceed in parallel.
+    """
+
+    def __init__(
+        self,
+        csv_path: str,
+        persistence: str = "rewrite",
+        compact_threshold: int = 1000,
+        compact_interval: float = 30.0,
+    ) -> None:
+        if persistence not in PERSISTENCE_MODES:
+            raise ValueError(f"Unknown persistence mode: {persistence}")
+
+        self._csv_path = Path(csv_path)
+        self._persistence = persistence
+        self._journal = ClientJournal(self._csv_path)
+        self._journal_position: Tuple[int, int] = (0, 0)
+        self._lock_path = self._csv_path.with_name(self._csv_path.name + ".lock")
+        self._stripes = LockStripes()
+        self._compact_threshold = compact_threshold
+        self._compact_interval = compact_interval
+        self._pending_entries = 0
+        self._compactor: Optional[threading.Thread] = None
+        self._compact_requested = threading.Event()
+        self._compact_lock = threading.Lock()
+
+        self._lock = threading.RLock()
+        self._rows: List[Dict[str, str]] = []
+        self._fieldnames: List[str] = []
+        self._index: Dict[str, Dict[str, str]] = {}
+        self._signature: Optional[Signature] = None
+
+    @property
+    def csv_path(self) -> Path:
+        """Returns the path of the backing CSV file."""
+        return self._csv_path
+
+    @property
+    def persistence(self) -> str:
+        """Returns the persistence mode of this repository."""
+        return self._persistence
+
+    def _refresh(self) -> None:
+        """Rebuilds the CPF index when the backing file changed since the last load."""
+        snapshot = csv_cache.get(self._csv_path)
+        if snapshot.signature == self._signature:
+            if self._persistence != "journal" or self._catch_up_journal():
+                return
+
+        rows = [dict(row) for row in snapshot.rows]
+        index: Dict[str, Dict[str, str]] = {}
+        for row in rows:
+            index.setdefault(clean_cpf(row.get("cpf", "")), row)
+
+        fieldnames = list(snapshot.fieldnames)
+        if self._persistence == "journal":
+            entries, self._journal_position = self._journal.recover()
+            apply_entries(index, fieldnames, entries)
+            self._pending_entries = len(entries)
+
+        self._rows = rows
+        self._fieldnames = fieldnames
+        self._index = index
+        self._signature = snapshot.signature
+
+    def _catch_up_journal(self) -> bool:
+        """Applies journal entries appended since the last read, including other processes'.
+
+        Returns False when the journal was rotated meanwhile and a full reload is needed.
+        """
+        result = self._journal.read_from(*self._journal_position)
+        if result is None:
+            return False
+
+        entries, self._journal_position = result
+        apply_entries(self._index, self._fieldnames, entries)
+        return True
+
+    def _write(self) -> None:
+        """Writes every row back to the CSV file and publishes them to the shared CSV cache."""
+        csv_cache.invalidate(self._csv_path)
+        write_csv_atomically(self._csv_path, self._fieldnames, self._rows)
+
+        snapshot = csv_cache.put(self._csv_path, self._fieldnames, self._rows)
+        self._signature = snapshot.signature
+
+    def list_all(self) -> List[Dict[str, str]]:
+        """Returns copies of all client records in file order."""
+        with self._lock:
+            self._refresh()
+            return [dict(row) for row in self._rows]
+
+    def get_by_cpf(self, cpf: str) -> Optional[Dict[str, str]]:
+        """Returns a copy of the client record for the given CPF, or None if not found."""
+        with self._lock:
+            self._refresh()
+            row = self._index.get(clean_cpf(cpf))
+            return dict(row) if row is not None else None
+
+    def update_field(self, cpf: str, field: str, value: str) -> Dict[str, str]:
+        """Sets one field of a client record, persists it and returns the updated record."""
+        key = clean_cpf(cpf)
+        with self._stripes.for_key(key):
+            if self._persistence == "journal":
+                return self._update_journaled(key, field, value)
+            return self._update_rewriting(key, field, value)
+
+    def update_many(self, updates: Sequence[Tuple[str, str, str]]) -> None:
+        """Applies (cpf, field, value) updates in order with one rewrite or one journal write.
+
+        Raises ValueError before persisting anything when a CPF is unknown.
+        """
+        keyed = [(clean_cpf(cpf), field, value) for cpf, field, value in updates]
+        if not keyed:
+            return
+
+        with ExitStack() as stack:
+            for lock in self._stripes.for_keys(key for key, _, _ in keyed):
+                stack.enter_context(lock)
+            if self._persistence == "journal":
+                self._update_many_journaled(keyed)
+            else:
+                self._update_many_rewriting(keyed)
+
+    def _check_known(self, keyed: Sequence[Tuple[str, str, str]]) -> None:
+        if any(key not in self._index for key, _, _ in keyed):
+            raise ValueError("Client not found")
+
+    def _update_many_rewriting(self, keyed: Sequence[Tuple[str, str, str]]) -> None:
+        with file_lock(self._lock_path), self._lock:
+            self._refresh()
+            self._check_known(keyed)
+            for key, field, value in keyed:
+                self._set_field(key, field, value)
+            self._write()
+
+    def _update_many_journaled(self, keyed: Sequence[Tuple[str, str, str]]) -> None:
+        with self._lock:
+            self._refresh()
+            self._check_known(keyed)
+
+        with file_lock(self._lock_path, exclusive=False):
+            self._journal.append_many(keyed)
+
+        with self._lock:
+            for key, field, value in keyed:
+                self._set_field(key, field, value)
+            self._pending_entries += len(keyed)
+
+        self._schedule_compaction()
+
+    def _set_field(self, key: str, field: str, value: str) -> Dict[str, str]:
+        row = self._index.get(key)
+        if row is None:
+            raise ValueError("Client not found")
+
+        if field not in self._fieldnames:
+            self._fieldnames.append(field)
+
+        row[field] = value
+        return row
+
+    def _update_rewriting(self, key: str, field: str, value: str) -> Dict[str, str]:
+        """Re-reads, updates and rewrites the CSV while holding the exclusive file lock."""
+        with file_lock(self._lock_path), self._lock:
+            self._refresh()
+            row = self._set_field(key, field, value)
+            self._write()
+            return dict(row)
+
+    def _update_journaled(self, key: str, field: str, value: str) -> Dict[str, str]:
+        """Appends the update to the journal under the shared file lock, then applies it in memory."""
+        with self._lock:
+            self._refresh()
+            if key not in self._index:
+                raise ValueError("Client not found")
+
+        with file_lock(self._lock_path, exclusive=False):
+            self._journal.append(key, field, value)
+
+        with self._lock:
+            row = self._set_field(key, field, value)
+            self._pending_entries += 1
+            updated = dict(row)
+
+        self._schedule_compaction()
+        return updated
+
+    def _schedule_compaction(self) -> None:
+        """Starts the compactor thread on first use and wakes it at the threshold."""
+        if self._compactor is None:
+            self._compactor = threading.Thread(
+                target=self._compact_loop,
+                name=f"compactor-{self._csv_path.name}",
+                daemon=True,
+            )
+            self._compactor.start()
+
+        if self._pending_entries >= self._compact_threshold:
+            self._compact_requested.set()
+
+    def _compact_loop(self) -> None:
+        while True:
+            self._compact_requested.wait(self._compact_interval)
+            self._compact_requested.clear()
+            try:
+                self.compact()
+            except OSError as exc:
+                print("JOURNAL COMPACTION ERROR:", exc)
+
+    def compact(self) -> None:
+        """Folds pending journal entries into the CSV through an atomic rename."""
+        with self._compact_lock, file_lock(self._lock_path):
+            with self._lock:
+                self._refresh()
+                if not self._journal.rotate():
+                    return
+                fieldnames = list(self._fieldnames)
+                rows = [dict(row) for row in self._rows]
+                self._pending_entries = 0
+                self._journal_position = (0, 0)
+
+            write_csv_atomically(self._csv_path, fieldnames, rows)
+
+            with self._lock:
+                snapshot = csv_cache.put(self._csv_path, fieldnames, rows)
+                self._signature = snapshot.signature
+                self._journal.discard_compacted()
+
+
+@lru_cache(maxsize=None)
+def _repository_for(resolved_path: str) -> CsvClientRepository:
+    return CsvClientRepository(
+        resolved_path,
+        persistence=os.getenv("CLIENTS_PERSISTENCE_MODE", "rewrite"),
+        compact_threshold=int(os.getenv("CLIENTS_JOURNAL_COMPACT_THRESHOLD", "1000")),
+        compact_interval=float(os.getenv("CLIENTS_JOURNAL_COMPACT_INTERVAL", "30")),
+    )
+
+
+def get_csv_client_repository(csv_path: str) -> CsvClientRepository:
+    """Returns the process-wide CSV repository shared by every caller of the same file."""
+    return _repository_for(str(Path(csv_path).resolve()))
@@ -0,0 +1,213 @@
+"""Credit request log repository interface and its CSV implementation."""
+
+import csv
+import io
+import os
+import threading
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from app.repositories.request_log_index import RequestLogIndex
+from app.utils.metrics import CSV_IO_DURATION
+
+REQUEST_FIELDNAMES: List[str] = [
+    "cpf_cliente",
+    "data_hora_solicitacao",
+    "limite_atual",
+    "novo_limite_solicitado",
+    "status_pedido",
+]
+
+
+class HistoryPage(NamedTuple):
+    """One page of a client's request history, newest first, and the cursor of the next page."""
+
+    items: List[Dict[str, str]]
+    next_cursor: Optional[str]
+
+
+class LogTail(NamedTuple):
+    """Request records stored after a log position, oldest first, and the position just past them.
+
+    restarted is true when the log no longer contains the given position, for
+    example because the file was replaced, and the rows start from its beginning.
+    """
+
+    rows: List[Dict[str, str]]
+    position: str
+    restarted: bool
+
+
+class CreditRequestRepository(ABC):
+    """Storage-agnostic, append-only log of credit limit increase requests."""
+
+    @abstractmethod
+    def append(self, row: Dict[str, object]) -> None:
+        """Appends one request record with the REQUEST_FIELDNAMES keys."""
+
+    def append_many(self, rows: Sequence[Dict[str, object]]) -> None:
+        """Appends several request records; backends override this to write them at once."""
+        for row in rows:
+            self.append(row)
+
+    @abstractmethod
+    def history(
+        self,
+        cpf: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> HistoryPage:
+        """Returns the CPF's requests with start <= timestamp < end, newest first, after the cursor.
+
+        Raises ValueError for a malformed cursor.
+        """
+
+    @abstractmethod
+    def read_since(self, position: Optional[str], limit: int = 10000) -> LogTail:
+        """Returns up to limit records stored after position, or from the start when it is None.
+
+        Records appended by other processes are included, so callers can keep
+        derived state current by passing back the returned position.
+        """
+
+    def flush(self) -> None:
+        """Blocks until every appended record has been handed to storage."""
+
+    def close(self) -> None:
+        """Flushes pending records and releases background resources."""
+        self.flush()
+
+
+class CsvCreditRequestRepository(CreditRequestRepository):
+    """Appends credit requests to a CSV file, writing the header on first use.
+
+    History lookups go through a RequestLogIndex built on first use and then
+    extended by every append, so they read only the rows of the requested page.
+    """
+
+    def __init__(self, csv_path: str, fsync: bool = False) -> None:
+        self._csv_path = Path(csv_path)
+        self._fsync = fsync
+        self._lock = threading.Lock()
+        self._index = RequestLogIndex(self._csv_path)
+
+    @property
+    def csv_path(self) -> Path:
+        """Returns the path of the backing CSV file."""
+        return self._csv_path
+
+    def append(self, row: Dict[str, object]) -> None:
+        """Appends one request record to the CSV file."""
+        self.append_many([row])
+
+    def append_many(self, rows: Sequence[Dict[str, object]]) -> None:
+        """Appends request records to the CSV file with a single open and write."""
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=REQUEST_FIELDNAMES)
+
+        def encode(write) -> bytes:
+            buffer.seek(0)
+            buffer.truncate()
+            write()
+            return buffer.getvalue().encode("utf-8")
+
+        lines = [encode(lambda row=row: writer.writerow(row)) for row in rows]
+
+        with self._lock:
+            with CSV_IO_DURATION.time(operation="append", file=self._csv_path.name):
+                with self._csv_path.open("ab") as f:
+                    start = os.fstat(f.fileno()).st_size
+                    header = encode(writer.writeheader) if start == 0 else b""
+                    payload = header + b"".join(lines)
+                    f.write(payload)
+                    f.flush()
+                    if self._fsync:
+                        os.fsync(f.fileno())
+                    end = os.fstat(f.fileno()).st_size
+
+            if not self._index.built:
+                return
+            if self._index.size == start and end == start + len(payload):
+                self._index.add_appended(
+                    REQUEST_FIELDNAMES,
+                    rows,
+                    [len(line) for line in lines],
+                    start,
+                    len(header),
+                )
+            else:
+                self._index.catch_up()
+
+    def history(
+        self,
+        cpf: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> HistoryPage:
+        """Returns a page of the CPF's requests, newest first; the cursor is a position in its index."""
+        before = int(cursor) if cursor else None
+        if before is not None and before < 0:
+            raise ValueError("Invalid cursor")
+        with self._lock:
+            with CSV_IO_DURATION.time(operation="index_scan", file=self._csv_path.name):
+                self._index.catch_up()
+            offsets, next_position = self._index.select(cpf, start, end, before, limit)
+            with CSV_IO_DURATION.time(
+                operation="history_read", file=self._csv_path.name
+            ):
+                items = self._index.read_rows(offsets)
+
+        return HistoryPage(
+            items, str(next_position) if next_position is not None else None
+        )
+
+    def read_since(self, position: Optional[str], limit: int = 10000) -> LogTail:
+        """Reads complete rows after position, an "inode:offset" pair, skipping a torn last line."""
+        inode, offset = (int(part) for part in (position or "0:0").split(":"))
+        try:
+            stat = os.stat(self._csv_path)
+        except FileNotFoundError:
+            return LogTail([], "0:0", offset > 0)
+
+        restarted = position is not None and (
+            stat.st_ino != inode or stat.st_size < offset
+        )
+        if restarted:
+            offset = 0
+
+        rows: List[Dict[str, str]] = []
+        with CSV_IO_DURATION.time(operation="tail_read", file=self._csv_path.name):
+            with self._csv_path.open("rb") as f:
+                header = f.readline()
+                if not header.endswith(b"\n"):
+                    return LogTail([], f"{stat.st_ino}:0", restarted)
+                fieldnames = next(csv.reader([header.decode("utf-8")]))
+                offset = max(offset, len(header))
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b"\n") or len(rows) >= limit:
+                        break
+                    offset += len(line)
+                    values = next(csv.reader([line.decode("utf-8")]), [])
+                    if values:
+                        rows.append(dict(zip(fieldnames, values)))
+
+        return LogTail(rows, f"{stat.st_ino}:{offset}", restarted)
+
+
+@lru_cache(maxsize=None)
+def _repository_for(resolved_path: str) -> CsvCreditRequestRepository:
+    return CsvCreditRequestRepository(
+        resolved_path, fsync=os.getenv("CREDIT_REQUESTS_FSYNC", "0") == "1"
+    )
+
+
+def get_csv_credit_request_repository(csv_path: str) -> CsvCreditRequestRepository:
+    """Returns the process-wide CSV request log shared by every caller of the same file."""
+    return _repository_for(str(Path(csv_path).resolve()))
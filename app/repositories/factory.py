@@ -0,0 +1,96 @@
+"""Selects the storage backend for client and credit request repositories."""
+
+import os
+import threading
+from typing import Dict, Optional
+
+from app.repositories.client_repository import (
+    ClientRepository,
+    get_csv_client_repository,
+)
+from app.repositories.credit_request_repository import (
+    CreditRequestRepository,
+    get_csv_credit_request_repository,
+)
+from app.repositories.request_log_writer import BatchedCreditRequestRepository
+from app.repositories.sqlite_repository import (
+    SqliteClientRepository,
+    SqliteCreditRequestRepository,
+    get_sqlite_database,
+)
+
+STORAGE_BACKENDS = ("csv", "sqlite")
+
+_request_repositories: Dict[str, CreditRequestRepository] = {}
+_request_repositories_lock = threading.Lock()
+
+
+def get_storage_backend() -> str:
+    """Returns the backend configured by STORAGE_BACKEND, defaulting to CSV."""
+    backend = os.getenv("STORAGE_BACKEND", "csv").lower()
+    if backend not in STORAGE_BACKENDS:
+        raise RuntimeError(f"Unknown STORAGE_BACKEND: {backend}")
+    return backend
+
+
+def get_sqlite_db_path() -> str:
+    """Returns the SQLite database file configured by SQLITE_DB_PATH."""
+    return os.getenv("SQLITE_DB_PATH", "data/banco_agil.db")
+
+
+def get_client_repository(clients_csv_path: str) -> ClientRepository:
+    """Returns the client repository for the configured backend."""
+    if get_storage_backend() == "sqlite":
+        return SqliteClientRepository(get_sqlite_database(get_sqlite_db_path()))
+    return get_csv_client_repository(clients_csv_path)
+
+
+def _build_credit_request_repository(requests_csv_path: str) -> CreditRequestRepository:
+    repository: CreditRequestRepository
+    if get_storage_backend() == "sqlite":
+        repository = SqliteCreditRequestRepository(
+            get_sqlite_database(get_sqlite_db_path())
+        )
+    else:
+        repository = get_csv_credit_request_repository(requests_csv_path)
+
+    if os.getenv("CREDIT_REQUESTS_BATCH_WRITES", "0") == "1":
+        repository = BatchedCreditRequestRepository(
+            repository,
+            max_batch=int(os.getenv("CREDIT_REQUESTS_BATCH_SIZE", "256")),
+            max_delay=float(os.getenv("CREDIT_REQUESTS_BATCH_DELAY_MS", "50")) / 1000,
+            max_queue=int(os.getenv("CREDIT_REQUESTS_QUEUE_SIZE", "10000")),
+        )
+    return repository
+
+
+def get_credit_request_repository(requests_csv_path: str) -> CreditRequestRepository:
+    """Returns the shared credit request log repository for the configured backend."""
+    key = (
+        get_sqlite_db_path()
+        if get_storage_backend() == "sqlite"
+        else os.path.realpath(requests_csv_path)
+    )
+    with _request_repositories_lock:
+        repository = _request_repositories.get(key)
+        if repository is None:
+            repository = _build_credit_request_repository(requests_csv_path)
+            _request_repositories[key] = repository
+        return repository
+
+
+def close_repositories() -> None:
+    """Flushes and closes every shared credit request log; called on application shutdown."""
+    with _request_repositories_lock:
+        repositories = list(_request_repositories.values())
+        _request_repositories.clear()
+
+    error: Optional[Exception] = None
+    for repository in repositories:
+        try:
+            repository.close()
+        except Exception as exc:
+            print("REQUEST LOG CLOSE ERROR:", exc)
+            error = error or exc
+    if error is not None:
+        raise error
@@ -0,0 +1,138 @@
+"""In-memory index from CPF to the byte offsets of its rows in the credit request log CSV."""
+
+import csv
+import os
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Sequence, Tuple
+
+from app.utils.auth_utils import clean_cpf
+
+IndexEntry = Tuple[str, int]
+
+
+class RequestLogIndex:
+    """Maps each normalized CPF to (timestamp, byte offset) pairs in log order.
+
+    The index is built with one streaming pass on first use. After that it only
+    reads bytes past the last indexed offset, so appends by this process or by
+    others cost work proportional to the new rows, never to the whole log.
+    """
+
+    def __init__(self, csv_path: Path) -> None:
+        self._csv_path = csv_path
+        self._entries: Dict[str, List[IndexEntry]] = {}
+        self._fieldnames: List[str] = []
+        self._inode: Optional[int] = None
+        self._size = 0
+        self.built = False
+
+    @property
+    def size(self) -> int:
+        """Returns the file size up to which rows are indexed."""
+        return self._size
+
+    @property
+    def fieldnames(self) -> List[str]:
+        """Returns the header of the indexed file."""
+        return self._fieldnames
+
+    def _reset(self) -> None:
+        self._entries = {}
+        self._fieldnames = []
+        self._inode = None
+        self._size = 0
+
+    def catch_up(self) -> None:
+        """Indexes rows appended since the last call, rebuilding if the file was replaced or truncated."""
+        try:
+            stat = os.stat(self._csv_path)
+        except FileNotFoundError:
+            self._reset()
+            self.built = True
+            return
+
+        if stat.st_ino != self._inode or stat.st_size < self._size:
+            self._reset()
+            self._inode = stat.st_ino
+
+        if stat.st_size > self._size:
+            with self._csv_path.open("rb") as f:
+                self._scan(f)
+        self.built = True
+
+    def _scan(self, f: BinaryIO) -> None:
+        """Indexes complete lines from the indexed size on, leaving a torn last line for later."""
+        f.seek(self._size)
+        offset = self._size
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            values = next(csv.reader([line.decode("utf-8")]), [])
+            if not self._fieldnames:
+                self._fieldnames = values
+            elif values:
+                self._add(values, offset)
+            offset += len(line)
+        self._size = offset
+
+    def _add(self, values: Sequence[str], offset: int) -> None:
+        row = dict(zip(self._fieldnames, values))
+        self._entries.setdefault(clean_cpf(row.get("cpf_cliente", "")), []).append(
+            (row.get("data_hora_solicitacao", ""), offset)
+        )
+
+    def add_appended(
+        self,
+        fieldnames: List[str],
+        rows: Sequence[Dict[str, object]],
+        line_lengths: Sequence[int],
+        start: int,
+        header_length: int = 0,
+    ) -> None:
+        """Indexes rows this process just wrote at start, without reading them back."""
+        if header_length:
+            self._fieldnames = list(fieldnames)
+        offset = start + header_length
+        for row, length in zip(rows, line_lengths):
+            self._entries.setdefault(clean_cpf(str(row["cpf_cliente"])), []).append(
+                (str(row["data_hora_solicitacao"]), offset)
+            )
+            offset += length
+        self._size = offset
+
+    def select(
+        self,
+        cpf: str,
+        start: Optional[str],
+        end: Optional[str],
+        before: Optional[int],
+        limit: int,
+    ) -> Tuple[List[int], Optional[int]]:
+        """Returns offsets of the CPF's newest rows within [start, end) below position before.
+
+        The second value is the cursor for the next page, or None on the last one.
+        """
+        entries = self._entries.get(clean_cpf(cpf), [])
+        position = len(entries) if before is None else min(before, len(entries))
+
+        offsets: List[int] = []
+        while position > 0 and len(offsets) < limit:
+            position -= 1
+            requested_at, offset = entries[position]
+            if start is not None and requested_at < start:
+                continue
+            if end is not None and requested_at >= end:
+                continue
+            offsets.append(offset)
+
+        return offsets, (position if position > 0 and len(offsets) == limit else None)
+
+    def read_rows(self, offsets: Sequence[int]) -> List[Dict[str, str]]:
+        """Reads the rows at the given offsets with one open and a seek per row."""
+        rows = []
+        with self._csv_path.open("rb") as f:
+            for offset in offsets:
+                f.seek(offset)
+                values = next(csv.reader([f.readline().decode("utf-8")]), [])
+                rows.append(dict(zip(self._fieldnames, values)))
+        return rows
@@ -0,0 +1,164 @@
+"""Group-commit writer that batches credit request log appends on a background thread."""
+
+import queue
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+
+from app.repositories.credit_request_repository import (
+    CreditRequestRepository,
+    HistoryPage,
+    LogTail,
+)
+
+_STOP = object()
+
+
+class BatchedCreditRequestRepository(CreditRequestRepository):
+    """Queues appended rows and commits them to the wrapped repository in batches.
+
+    A batch is written when it reaches max_batch rows or when max_delay seconds
+    have passed since its first row. The queue is bounded, so callers block
+    instead of growing memory when storage falls behind. Rows of a failed batch
+    are kept and retried alone with exponential backoff, leaving the queue to
+    fill up meanwhile, and the last write error is raised from flush() and
+    close() until a retry succeeds.
+    """
+
+    def __init__(
+        self,
+        inner: CreditRequestRepository,
+        max_batch: int = 256,
+        max_delay: float = 0.05,
+        max_queue: int = 10000,
+        max_retry_delay: float = 5.0,
+    ) -> None:
+        self._inner = inner
+        self._max_batch = max_batch
+        self._max_delay = max_delay
+        self._max_retry_delay = max_retry_delay
+        self._queue: "queue.Queue[object]" = queue.Queue(maxsize=max_queue)
+        self._pending: List[Dict[str, object]] = []
+        self._error: Optional[Exception] = None
+        self._closed = False
+        self._stopping = threading.Event()
+        self._progress = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._run, name="credit-request-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def inner(self) -> CreditRequestRepository:
+        """Returns the repository that receives the batches."""
+        return self._inner
+
+    def append(self, row: Dict[str, object]) -> None:
+        """Enqueues one request record, blocking while the queue is full."""
+        if self._closed:
+            raise RuntimeError("Credit request log writer is closed")
+        self._queue.put(row)
+
+    def append_many(self, rows: Sequence[Dict[str, object]]) -> None:
+        """Enqueues several request records."""
+        for row in rows:
+            self.append(row)
+
+    def history(
+        self,
+        cpf: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> HistoryPage:
+        """Commits queued records, then reads the page from the wrapped repository."""
+        self.flush()
+        return self._inner.history(cpf, start, end, cursor, limit)
+
+    def read_since(self, position: Optional[str], limit: int = 10000) -> LogTail:
+        """Reads from the wrapped repository; records still queued show up on a later call."""
+        return self._inner.read_since(position, limit)
+
+    def flush(self) -> None:
+        """Blocks until every queued record is written, raising instead while writes are failing."""
+        with self._progress:
+            self._progress.wait_for(
+                lambda: self._error is not None or not self._queue.unfinished_tasks
+            )
+        self._raise_for_error()
+
+    def close(self) -> None:
+        """Commits pending records and stops the writer thread; raises if some could not be written."""
+        if self._closed:
+            return
+        self._closed = True
+        self._stopping.set()
+        self._queue.put(_STOP)
+        self._thread.join()
+        try:
+            self._raise_for_error()
+        finally:
+            self._inner.close()
+
+    def _raise_for_error(self) -> None:
+        error = self._error
+        if error is not None:
+            raise RuntimeError(
+                f"{len(self._pending)} credit request log records not written"
+            ) from error
+
+    def _collect_batch(self, first: object) -> List[object]:
+        """Gathers queued items until the batch is full, the delay expires or a stop arrives."""
+        batch = [first]
+        deadline = time.monotonic() + self._max_delay
+        while len(batch) < self._max_batch and batch[-1] is not _STOP:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, rows: List[Dict[str, object]]) -> None:
+        """Writes failed rows from earlier batches plus new ones, keeping them all if it fails."""
+        rows = self._pending + rows
+        if not rows:
+            return
+        try:
+            self._inner.append_many(rows)
+        except Exception as exc:
+            print("REQUEST LOG WRITE ERROR:", exc)
+            self._pending = rows
+            self._error = exc
+        else:
+            self._pending = []
+            self._error = None
+        finally:
+            with self._progress:
+                self._progress.notify_all()
+
+    def _run(self) -> None:
+        retry_delay = self._max_delay
+        while True:
+            if self._pending and not self._stopping.is_set():
+                # Leave the queue alone while storage fails, so append() blocks once it is full.
+                self._stopping.wait(retry_delay)
+                self._write([])
+                retry_delay = min(retry_delay * 2, self._max_retry_delay)
+                continue
+            retry_delay = self._max_delay
+
+            batch = self._collect_batch(self._queue.get())
+            try:
+                self._write([item for item in batch if item is not _STOP])
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+                with self._progress:
+                    self._progress.notify_all()
+
+            if batch[-1] is _STOP:
+                return
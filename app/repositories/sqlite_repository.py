@@ -0,0 +1,307 @@
+"""SQLite implementations of the client and credit request repositories."""
+
+import argparse
+import csv
+import os
+import sqlite3
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.repositories.client_repository import ClientRepository
+from app.repositories.credit_request_repository import (
+    REQUEST_FIELDNAMES,
+    CreditRequestRepository,
+    HistoryPage,
+    LogTail,
+)
+from app.utils.auth_utils import clean_cpf
+
+CLIENT_COLUMNS: List[str] = [
+    "cpf",
+    "data_nascimento",
+    "nome",
+    "limite_atual",
+    "score",
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS clientes (
+    cpf TEXT PRIMARY KEY,
+    data_nascimento TEXT,
+    nome TEXT,
+    limite_atual TEXT,
+    score TEXT
+);
+
+CREATE TABLE IF NOT EXISTS solicitacoes_aumento_limite (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    cpf_cliente TEXT NOT NULL,
+    data_hora_solicitacao TEXT NOT NULL,
+    limite_atual TEXT,
+    novo_limite_solicitado TEXT,
+    status_pedido TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_solicitacoes_cpf_data
+    ON solicitacoes_aumento_limite (cpf_cliente, data_hora_solicitacao);
+
+CREATE INDEX IF NOT EXISTS idx_solicitacoes_cpf_id
+    ON solicitacoes_aumento_limite (cpf_cliente, id);
+"""
+
+
+def _request_values(row: Dict[str, object]) -> List[str]:
+    """Returns a request record's column values, with the client CPF reduced to digits."""
+    values = {name: str(row.get(name, "")) for name in REQUEST_FIELDNAMES}
+    values["cpf_cliente"] = clean_cpf(values["cpf_cliente"])
+    return [values[name] for name in REQUEST_FIELDNAMES]
+
+
+class SqliteDatabase:
+    """Opens one WAL-mode connection per thread to a SQLite file and creates the schema."""
+
+    def __init__(self, db_path: str, busy_timeout_ms: int = 5000) -> None:
+        self.db_path = Path(db_path)
+        self._busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+        self.connection().executescript(SCHEMA)
+
+    def connection(self) -> sqlite3.Connection:
+        """Returns the calling thread's connection, opening it on first use."""
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+        if conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={self._busy_timeout_ms}")
+            self._local.conn = conn
+        return conn
+
+
+class SqliteClientRepository(ClientRepository):
+    """Reads and updates clients by CPF primary key."""
+
+    def __init__(self, db: SqliteDatabase) -> None:
+        self._db = db
+
+    def list_all(self) -> List[Dict[str, str]]:
+        """Returns all client records in import order."""
+        cursor = self._db.connection().execute(
+            f"SELECT {', '.join(CLIENT_COLUMNS)} FROM clientes ORDER BY rowid"
+        )
+        return [dict(row) for row in cursor]
+
+    def get_by_cpf(self, cpf: str) -> Optional[Dict[str, str]]:
+        """Returns the client record for the given CPF, or None if not found."""
+        row = (
+            self._db.connection()
+            .execute(
+                f"SELECT {', '.join(CLIENT_COLUMNS)} FROM clientes WHERE cpf = ?",
+                (clean_cpf(cpf),),
+            )
+            .fetchone()
+        )
+        return dict(row) if row is not None else None
+
+    def update_field(self, cpf: str, field: str, value: str) -> Dict[str, str]:
+        """Sets one column of a client row and returns the updated record."""
+        if field not in CLIENT_COLUMNS or field == "cpf":
+            raise ValueError(f"Unknown client field: {field}")
+
+        key = clean_cpf(cpf)
+        row = (
+            self._db.connection()
+            .execute(
+                f"UPDATE clientes SET {field} = ? WHERE cpf = ? "
+                f"RETURNING {', '.join(CLIENT_COLUMNS)}",
+                (value, key),
+            )
+            .fetchone()
+        )
+        if row is None:
+            raise ValueError("Client not found")
+        return dict(row)
+
+    def update_many(self, updates: Sequence[Tuple[str, str, str]]) -> None:
+        """Applies (cpf, field, value) updates in one transaction, rolling back if a CPF is unknown."""
+        for _, field, _ in updates:
+            if field not in CLIENT_COLUMNS or field == "cpf":
+                raise ValueError(f"Unknown client field: {field}")
+
+        conn = self._db.connection()
+        conn.execute("BEGIN")
+        try:
+            for cpf, field, value in updates:
+                cursor = conn.execute(
+                    f"UPDATE clientes SET {field} = ? WHERE cpf = ?",
+                    (value, clean_cpf(cpf)),
+                )
+                if cursor.rowcount == 0:
+                    raise ValueError("Client not found")
+        except (sqlite3.Error, ValueError):
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+
+class SqliteCreditRequestRepository(CreditRequestRepository):
+    """Appends credit requests to an indexed SQLite table."""
+
+    def __init__(self, db: SqliteDatabase) -> None:
+        self._db = db
+
+    def append(self, row: Dict[str, object]) -> None:
+        """Inserts one request record."""
+        self.append_many([row])
+
+    def append_many(self, rows: Sequence[Dict[str, object]]) -> None:
+        """Inserts request records in a single transaction."""
+        conn = self._db.connection()
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(
+                f"INSERT INTO solicitacoes_aumento_limite ({', '.join(REQUEST_FIELDNAMES)}) "
+                f"VALUES ({', '.join('?' for _ in REQUEST_FIELDNAMES)})",
+                [_request_values(row) for row in rows],
+            )
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def history(
+        self,
+        cpf: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> HistoryPage:
+        """Returns a page of the CPF's requests, newest first; the cursor is the last row id seen."""
+        clauses = ["cpf_cliente = ?"]
+        params: List[object] = [clean_cpf(cpf)]
+        if start is not None:
+            clauses.append("data_hora_solicitacao >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append("data_hora_solicitacao < ?")
+            params.append(end)
+        if cursor:
+            before = int(cursor)
+            if before < 0:
+                raise ValueError("Invalid cursor")
+            clauses.append("id < ?")
+            params.append(before)
+
+        rows = (
+            self._db.connection()
+            .execute(
+                f"SELECT id, {', '.join(REQUEST_FIELDNAMES)} "
+                f"FROM solicitacoes_aumento_limite WHERE {' AND '.join(clauses)} "
+                "ORDER BY id DESC LIMIT ?",
+                params + [limit],
+            )
+            .fetchall()
+        )
+        items = [{name: row[name] for name in REQUEST_FIELDNAMES} for row in rows]
+        next_cursor = str(rows[-1]["id"]) if len(rows) == limit else None
+        return HistoryPage(items, next_cursor)
+
+    def read_since(self, position: Optional[str], limit: int = 10000) -> LogTail:
+        """Reads records with an id above position, the last row id seen."""
+        after = int(position) if position else 0
+        conn = self._db.connection()
+        last_id = conn.execute(
+            "SELECT max(id) FROM solicitacoes_aumento_limite"
+        ).fetchone()[0]
+        restarted = after > (last_id or 0)
+        if restarted:
+            after = 0
+
+        rows = conn.execute(
+            f"SELECT id, {', '.join(REQUEST_FIELDNAMES)} "
+            "FROM solicitacoes_aumento_limite WHERE id > ? ORDER BY id LIMIT ?",
+            (after, limit),
+        ).fetchall()
+        items = [{name: row[name] for name in REQUEST_FIELDNAMES} for row in rows]
+        return LogTail(items, str(rows[-1]["id"] if rows else after), restarted)
+
+
+def import_csv(
+    db: SqliteDatabase,
+    clients_csv_path: str,
+    requests_csv_path: Optional[str] = None,
+) -> Dict[str, int]:
+    """Loads clients (upserting by CPF) and, if the table is empty, the request log from CSV."""
+    conn = db.connection()
+    imported = {"clients": 0, "requests": 0}
+
+    with Path(clients_csv_path).open("r", encoding="utf-8", newline="") as f:
+        clients = [
+            [clean_cpf(row.get("cpf", ""))]
+            + [row.get(column, "") for column in CLIENT_COLUMNS[1:]]
+            for row in csv.DictReader(f)
+        ]
+
+    conn.execute("BEGIN")
+    conn.executemany(
+        f"INSERT OR REPLACE INTO clientes ({', '.join(CLIENT_COLUMNS)}) "
+        f"VALUES ({', '.join('?' for _ in CLIENT_COLUMNS)})",
+        clients,
+    )
+    imported["clients"] = len(clients)
+
+    requests_path = Path(requests_csv_path) if requests_csv_path else None
+    has_requests = conn.execute(
+        "SELECT 1 FROM solicitacoes_aumento_limite LIMIT 1"
+    ).fetchone()
+    if requests_path is not None and requests_path.exists() and not has_requests:
+        with requests_path.open("r", encoding="utf-8", newline="") as f:
+            requests = [_request_values(row) for row in csv.DictReader(f)]
+        conn.executemany(
+            f"INSERT INTO solicitacoes_aumento_limite ({', '.join(REQUEST_FIELDNAMES)}) "
+            f"VALUES ({', '.join('?' for _ in REQUEST_FIELDNAMES)})",
+            requests,
+        )
+        imported["requests"] = len(requests)
+
+    conn.execute("COMMIT")
+    return imported
+
+
+@lru_cache(maxsize=None)
+def get_sqlite_database(db_path: str) -> SqliteDatabase:
+    """Returns the process-wide database handle for the given file."""
+    return SqliteDatabase(db_path)
+
+
+def main() -> None:
+    """Imports the CSV data files into the SQLite database configured by the environment."""
+    parser = argparse.ArgumentParser(description="Import CSV data into SQLite.")
+    parser.add_argument(
+        "--db", default=os.getenv("SQLITE_DB_PATH", "data/banco_agil.db")
+    )
+    parser.add_argument(
+        "--clients", default=os.getenv("CLIENTS_CSV_PATH", "data/clientes.csv")
+    )
+    parser.add_argument(
+        "--requests",
+        default=os.getenv(
+            "CREDIT_REQUESTS_CSV_PATH", "data/solicitacoes_aumento_limite.csv"
+        ),
+    )
+    args = parser.parse_args()
+
+    imported = import_csv(get_sqlite_database(args.db), args.clients, args.requests)
+    print(
+        f"Imported {imported['clients']} clients and "
+        f"{imported['requests']} credit requests into {args.db}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,20 @@
 """Routes for credit limit lookup and limit increase requests."""
 
-from fastapi import APIRouter
+from typing import Optional
+
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import StreamingResponse
 
 from app.controllers.credit_controller import CreditController
 from app.infrastructure.schemas.credit_schemas import (
     CreditLimitResponse,
     CreditIncreaseRequest,
     CreditIncreaseResponse,
+    CreditBulkIncreaseResponse,
+    CreditHistoryResponse,
+    CreditStatsResponse,
 )
+from app.utils.sse import sse_response
 
 router = APIRouter(prefix="/credit", tags=["credit"])
 
@@ -15,14 +22,64 @@ controller = CreditController()
 
 
 @router.get("/limit/{cpf}", response_model=CreditLimitResponse)
-def get_credit_limit(cpf: str) -> CreditLimitResponse:
+async def get_credit_limit(cpf: str) -> CreditLimitResponse:
     """Returns the user's current credit limit along with an LLM-generated explanation."""
-    result = controller.get_limit(cpf)
+    result = await controller.get_limit(cpf)
     return CreditLimitResponse(**result)
 
 
+@router.get("/limit/{cpf}/stream")
+async def stream_credit_limit(cpf: str) -> StreamingResponse:
+    """Streams the user's current credit limit as SSE: a meta event, reply tokens, then done."""
+    meta, tokens = await controller.stream_limit(cpf)
+    return sse_response(meta, tokens)
+
+
 @router.post("/increase", response_model=CreditIncreaseResponse)
-def request_credit_increase(payload: CreditIncreaseRequest) -> CreditIncreaseResponse:
+async def request_credit_increase(
+    payload: CreditIncreaseRequest,
+) -> CreditIncreaseResponse:
     """Evaluates a credit limit increase request and returns the decision with an LLM explanation."""
-    result = controller.request_increase(payload.cpf, payload.requested_limit)
+    result = await controller.request_increase(payload.cpf, payload.requested_limit)
     return CreditIncreaseResponse(**result)
+
+
+@router.post("/increase/stream")
+async def stream_credit_increase(payload: CreditIncreaseRequest) -> StreamingResponse:
+    """Evaluates a credit limit increase request and streams the decision and explanation as SSE."""
+    meta, tokens = await controller.stream_increase(
+        payload.cpf, payload.requested_limit
+    )
+    return sse_response(meta, tokens)
+
+
+@router.post("/increase/bulk", response_model=CreditBulkIncreaseResponse)
+async def request_credit_increases_bulk(
+    request: Request, replies: bool = False
+) -> CreditBulkIncreaseResponse:
+    """Evaluates a CSV (text/csv) or NDJSON (application/x-ndjson) batch of limit increase requests."""
+    body = (await request.body()).decode("utf-8-sig")
+    result = await controller.request_increases_bulk(
+        body, request.headers.get("content-type", "text/csv"), with_replies=replies
+    )
+    return CreditBulkIncreaseResponse(**result)
+
+
+@router.get("/history/{cpf}", response_model=CreditHistoryResponse)
+async def get_credit_history(
+    cpf: str,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+) -> CreditHistoryResponse:
+    """Returns the client's increase requests with start <= timestamp < end, newest first, paginated by cursor."""
+    result = await controller.get_history(cpf, start, end, cursor, limit)
+    return CreditHistoryResponse(**result)
+
+
+@router.get("/stats", response_model=CreditStatsResponse)
+async def get_credit_stats() -> CreditStatsResponse:
+    """Returns approval, rejection and below-current rates and average amounts per day and score band."""
+    result = await controller.get_stats()
+    return CreditStatsResponse(**result)
@@ -1,9 +1,16 @@
 """Routes for forex quotation operations."""
 
 from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
 
 from app.controllers.forex_controller import ForexController
-from app.infrastructure.schemas.forex_schemas import FxQuoteRequest, FxQuoteResponse
+from app.infrastructure.schemas.forex_schemas import (
+    FxBatchQuoteRequest,
+    FxBatchQuoteResponse,
+    FxQuoteRequest,
+    FxQuoteResponse,
+)
+from app.utils.sse import sse_response
 
 router = APIRouter(prefix="/forex", tags=["forex"])
 
@@ -11,11 +18,31 @@ controller = ForexController()
 
 
 @router.post("/quote", response_model=FxQuoteResponse)
-def get_fx_quote(payload: FxQuoteRequest) -> FxQuoteResponse:
+async def get_fx_quote(payload: FxQuoteRequest) -> FxQuoteResponse:
     """Returns the exchange rate, converted amount, and an LLM-generated explanation for the forex quote."""
-    result = controller.get_quote(
+    result = await controller.get_quote(
         base=payload.base,
         target=payload.target,
         amount=payload.amount,
     )
     return FxQuoteResponse(**result)
+
+
+@router.post("/quote/stream")
+async def stream_fx_quote(payload: FxQuoteRequest) -> StreamingResponse:
+    """Streams the exchange rate, converted amount and explanation as SSE."""
+    meta, tokens = await controller.stream_quote(
+        base=payload.base,
+        target=payload.target,
+        amount=payload.amount,
+    )
+    return sse_response(meta, tokens)
+
+
+@router.post("/quotes", response_model=FxBatchQuoteResponse)
+async def get_fx_quotes(payload: FxBatchQuoteRequest) -> FxBatchQuoteResponse:
+    """Prices many currency pairs from one cached rate vector, without LLM explanations."""
+    quotes = await controller.get_quotes(
+        [quote.model_dump() for quote in payload.quotes]
+    )
+    return FxBatchQuoteResponse(quotes=quotes)
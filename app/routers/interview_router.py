@@ -1,12 +1,15 @@
 """Routes for running the credit interview and generating score explanations."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
 
 from app.controllers.interview_controller import InterviewController
 from app.infrastructure.schemas.interview_schemas import (
     CreditInterviewRequest,
     CreditInterviewResponse,
+    InterviewBatchResponse,
 )
+from app.utils.sse import sse_response
 
 router = APIRouter(prefix="/interview", tags=["interview"])
 
@@ -14,9 +17,11 @@ controller = InterviewController()
 
 
 @router.post("", response_model=CreditInterviewResponse)
-def run_credit_interview(payload: CreditInterviewRequest) -> CreditInterviewResponse:
+async def run_credit_interview(
+    payload: CreditInterviewRequest,
+) -> CreditInterviewResponse:
     """Executes the credit interview, computes the score, and returns an LLM-generated explanation."""
-    result = controller.run_interview(
+    result = await controller.run_interview(
         cpf=payload.cpf,
         monthly_income=payload.monthly_income,
         monthly_expenses=payload.monthly_expenses,
@@ -25,3 +30,27 @@ def run_credit_interview(payload: CreditInterviewRequest) -> CreditInterviewResp
         has_debt=payload.has_debt,
     )
     return CreditInterviewResponse(**result)
+
+
+@router.post("/stream")
+async def stream_credit_interview(payload: CreditInterviewRequest) -> StreamingResponse:
+    """Executes the credit interview and streams the score and its explanation as SSE."""
+    meta, tokens = await controller.stream_interview(
+        cpf=payload.cpf,
+        monthly_income=payload.monthly_income,
+        monthly_expenses=payload.monthly_expenses,
+        job_type=payload.job_type,
+        dependents_count=payload.dependents_count,
+        has_debt=payload.has_debt,
+    )
+    return sse_response(meta, tokens)
+
+
+@router.post("/batch", response_model=InterviewBatchResponse)
+async def run_credit_interview_batch(request: Request) -> InterviewBatchResponse:
+    """Scores a CSV (text/csv) or NDJSON (application/x-ndjson) file of applicants in one pass."""
+    body = (await request.body()).decode("utf-8-sig")
+    result = await controller.run_batch(
+        body, request.headers.get("content-type", "text/csv")
+    )
+    return InterviewBatchResponse(**result)
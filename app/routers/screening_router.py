@@ -1,27 +1,85 @@
-"""Routes for handling screening chat interactions and agent state management."""
+"""Routes for handling screening chat interactions and per-session agent state management."""
 
-from fastapi import APIRouter
+import os
+import uuid
+from typing import Optional
+
+from fastapi import APIRouter, Cookie, Depends, Header, Response
+from fastapi.responses import StreamingResponse
 
 from app.agents.screening_agent import ScreeningAgent
+from app.controllers.auth_controller import AuthController
 from app.infrastructure.schemas.screening_schemas import (
     ScreeningRequest,
     ScreeningResponse,
 )
+from app.utils.session_store import SessionStore
+from app.utils.sse import sse_response
+
+SESSION_HEADER = "X-Session-Id"
+SESSION_COOKIE = "screening_session"
+MAX_SESSION_ID_LENGTH = 128
 
 router = APIRouter(prefix="/screening", tags=["screening"])
 
-agent = ScreeningAgent()
+auth_controller = AuthController()
+
+sessions: SessionStore[ScreeningAgent] = SessionStore(
+    ttl_seconds=float(os.getenv("SCREENING_SESSION_TTL_SECONDS", "1800")),
+    max_entries=int(os.getenv("SCREENING_SESSION_MAX_ENTRIES", "10000")),
+)
+
+
+def resolve_session_id(
+    response: Response,
+    x_session_id: Optional[str] = Header(default=None),
+    screening_session: Optional[str] = Cookie(default=None),
+) -> str:
+    """Returns the caller's session id from header or cookie, issuing a new one when absent."""
+    session_id = x_session_id or screening_session
+    if not session_id or len(session_id) > MAX_SESSION_ID_LENGTH:
+        session_id = uuid.uuid4().hex
+
+    response.headers[SESSION_HEADER] = session_id
+    response.set_cookie(SESSION_COOKIE, session_id, httponly=True, samesite="lax")
+    return session_id
+
+
+def get_agent(session_id: str) -> ScreeningAgent:
+    """Returns the screening agent holding the state of the given session."""
+    return sessions.get_or_create(session_id, lambda: ScreeningAgent(auth_controller))
 
 
 @router.post("/chat", response_model=ScreeningResponse)
-def chat(payload: ScreeningRequest) -> ScreeningResponse:
-    """Processes a user message through the screening agent and returns the generated reply."""
-    reply = agent.ask(payload.message)
-    return ScreeningResponse(reply=reply, authenticated=agent.authenticated)
+async def chat(
+    payload: ScreeningRequest, session_id: str = Depends(resolve_session_id)
+) -> ScreeningResponse:
+    """Processes a user message through the session's screening agent and returns the generated reply."""
+    agent = get_agent(session_id)
+    reply = await agent.ask(payload.message)
+    return ScreeningResponse(
+        reply=reply, authenticated=agent.authenticated, session_id=session_id
+    )
+
+
+@router.post("/chat/stream")
+async def chat_stream(
+    payload: ScreeningRequest, session_id: str = Depends(resolve_session_id)
+) -> StreamingResponse:
+    """Advances the session's screening flow and streams the reply as SSE."""
+    agent = get_agent(session_id)
+    context = await agent.advance(payload.message)
+    meta = {"authenticated": agent.authenticated, "session_id": session_id}
+
+    response = sse_response(
+        meta, agent.stream_reply(context), headers={SESSION_HEADER: session_id}
+    )
+    response.set_cookie(SESSION_COOKIE, session_id, httponly=True, samesite="lax")
+    return response
 
 
 @router.post("/reset")
-def reset() -> dict:
-    """Resets the internal state of the screening agent, clearing authentication and attempts."""
-    agent.reset()
-    return {"message": "Screening agent reset successfully."}
+def reset(session_id: str = Depends(resolve_session_id)) -> dict:
+    """Resets the caller's screening session, clearing authentication and attempts."""
+    sessions.discard(session_id)
+    return {"message": "Screening agent reset successfully.", "session_id": session_id}
@@ -0,0 +1,198 @@
+"""Running aggregates of credit increase requests per day and per score band."""
+
+import threading
+import weakref
+from typing import Callable, Dict, Mapping, Optional
+
+from app.repositories.client_repository import ClientRepository
+from app.repositories.credit_request_repository import CreditRequestRepository
+from app.services.score_limit_table import ScoreLimitTable
+from app.utils.auth_utils import clean_cpf
+
+TAIL_BATCH_SIZE = 10000
+
+
+def _parse_amount(value: object) -> float:
+    try:
+        return float(str(value).replace(",", "."))
+    except ValueError:
+        return 0.0
+
+
+def _parse_score(value: object) -> Optional[float]:
+    try:
+        return float(str(value).replace(",", "."))
+    except ValueError:
+        return None
+
+
+def _all_client_bands(
+    clients: ClientRepository, score_limits: ScoreLimitTable
+) -> Callable[[str], str]:
+    """Maps CPFs to score bands with one pass over every client, for reading the whole log."""
+    scores: Dict[str, Optional[float]] = {}
+    for client in clients.list_all():
+        scores.setdefault(
+            clean_cpf(client.get("cpf", "")), _parse_score(client.get("score"))
+        )
+    return lambda cpf: score_limits.band_label_for(scores.get(clean_cpf(cpf)))
+
+
+def _client_bands(
+    clients: ClientRepository, score_limits: ScoreLimitTable
+) -> Callable[[str], str]:
+    """Maps CPFs to score bands with memoized indexed lookups, for reading a short tail."""
+    bands: Dict[str, str] = {}
+
+    def band_for(cpf: str) -> str:
+        key = clean_cpf(cpf)
+        if key not in bands:
+            client = clients.get_by_cpf(key)
+            bands[key] = score_limits.band_label_for(
+                _parse_score(client.get("score")) if client else None
+            )
+        return bands[key]
+
+    return band_for
+
+
+class RequestAggregate:
+    """Counts requests by status and sums requested and granted amounts for one bucket."""
+
+    __slots__ = (
+        "requests",
+        "approved",
+        "rejected",
+        "below_current",
+        "requested_sum",
+        "granted_sum",
+    )
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.approved = 0
+        self.rejected = 0
+        self.below_current = 0
+        self.requested_sum = 0.0
+        self.granted_sum = 0.0
+
+    def add(self, status: str, requested_limit: float) -> None:
+        """Counts one request; an approved request grants the amount it asked for."""
+        self.requests += 1
+        self.requested_sum += requested_limit
+        if status == "approved":
+            self.approved += 1
+            self.granted_sum += requested_limit
+        elif status == "rejected":
+            self.rejected += 1
+        elif status == "requested_below_current":
+            self.below_current += 1
+
+    def to_dict(self) -> Dict[str, float]:
+        """Returns the counts with status rates and average requested and granted amounts."""
+        total = self.requests or 1
+        return {
+            "requests": self.requests,
+            "approved": self.approved,
+            "rejected": self.rejected,
+            "requested_below_current": self.below_current,
+            "approval_rate": self.approved / total,
+            "rejection_rate": self.rejected / total,
+            "below_current_rate": self.below_current / total,
+            "avg_requested": self.requested_sum / total,
+            "avg_granted": self.granted_sum / (self.approved or 1),
+        }
+
+
+class CreditAnalytics:
+    """Keeps request aggregates overall, per UTC day and per score band for one request log.
+
+    The aggregates cover the log up to a saved position. Every snapshot first
+    adds the rows appended since then, by this process, other workers or
+    batch jobs alike, so a dashboard refresh reads only the new tail. The log
+    does not store the score at request time, so rows are placed in the band
+    of the client's score when they are first read.
+    """
+
+    def __init__(
+        self,
+        requests: CreditRequestRepository,
+        clients: ClientRepository,
+        score_limits: ScoreLimitTable,
+    ) -> None:
+        self._requests = requests
+        self._clients = clients
+        self._score_limits = score_limits
+        self._lock = threading.Lock()
+        self._position: Optional[str] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self._overall = RequestAggregate()
+        self._by_day: Dict[str, RequestAggregate] = {}
+        self._by_band: Dict[str, RequestAggregate] = {}
+
+    def _add(self, row: Mapping[str, object], band: str) -> None:
+        status = str(row.get("status_pedido", ""))
+        requested_limit = _parse_amount(row.get("novo_limite_solicitado", 0))
+        day = str(row.get("data_hora_solicitacao", ""))[:10] or "unknown"
+
+        self._overall.add(status, requested_limit)
+        self._by_day.setdefault(day, RequestAggregate()).add(status, requested_limit)
+        self._by_band.setdefault(band, RequestAggregate()).add(status, requested_limit)
+
+    def catch_up(self) -> int:
+        """Adds the rows appended to the log since the last call and returns how many were read."""
+        count = 0
+        with self._lock:
+            band_for = (
+                _all_client_bands(self._clients, self._score_limits)
+                if self._position is None
+                else _client_bands(self._clients, self._score_limits)
+            )
+            while True:
+                tail = self._requests.read_since(self._position, TAIL_BATCH_SIZE)
+                if tail.restarted:
+                    self._reset()
+                    band_for = _all_client_bands(self._clients, self._score_limits)
+                for row in tail.rows:
+                    self._add(row, band_for(str(row.get("cpf_cliente", ""))))
+                count += len(tail.rows)
+                self._position = tail.position
+                if len(tail.rows) < TAIL_BATCH_SIZE:
+                    return count
+
+    def snapshot(self) -> Dict[str, object]:
+        """Catches up with the log, then returns the aggregates as plain dictionaries."""
+        self.catch_up()
+        with self._lock:
+            return {
+                "overall": self._overall.to_dict(),
+                "by_day": {
+                    day: self._by_day[day].to_dict() for day in sorted(self._by_day)
+                },
+                "by_score_band": {
+                    band: self._by_band[band].to_dict()
+                    for band in sorted(self._by_band)
+                },
+            }
+
+
+_analytics: "weakref.WeakKeyDictionary[CreditRequestRepository, CreditAnalytics]" = (
+    weakref.WeakKeyDictionary()
+)
+_analytics_lock = threading.Lock()
+
+
+def get_credit_analytics(
+    requests: CreditRequestRepository,
+    clients: ClientRepository,
+    score_limits: ScoreLimitTable,
+) -> CreditAnalytics:
+    """Returns the analytics of a request log, shared by every service using it."""
+    with _analytics_lock:
+        analytics = _analytics.get(requests)
+        if analytics is None:
+            analytics = CreditAnalytics(requests, clients, score_limits)
+            _analytics[requests] = analytics
+        return analytics
@@ -1,9 +1,24 @@
 """Service layer for credit operations such as limits, scores, and increase requests."""
 
-import csv
 import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.repositories.client_repository import ClientRepository
+from app.repositories.credit_request_repository import (
+    CreditRequestRepository,
+    HistoryPage,
+)
+from app.repositories.factory import (
+    get_client_repository,
+    get_credit_request_repository,
+)
+from app.services.credit_analytics import get_credit_analytics
+from app.services.score_limit_table import get_score_limit_table
+from app.utils.auth_utils import clean_cpf
+from app.utils.csv_cache import csv_cache
 
 
 class CreditService:
@@ -14,22 +29,26 @@ class CreditService:
         clients_csv_path: str,
         score_limits_csv_path: str,
         requests_csv_path: str,
+        clients: Optional[ClientRepository] = None,
+        requests: Optional[CreditRequestRepository] = None,
     ) -> None:
         self.clients_csv_path = Path(clients_csv_path)
         self.score_limits_csv_path = Path(score_limits_csv_path)
         self.requests_csv_path = Path(requests_csv_path)
+        self.clients = clients or get_client_repository(clients_csv_path)
+        self.requests = requests or get_credit_request_repository(requests_csv_path)
+        self.score_limits = get_score_limit_table(score_limits_csv_path)
+        self.analytics = get_credit_analytics(
+            self.requests, self.clients, self.score_limits
+        )
 
     def read_clients(self) -> List[Dict[str, str]]:
         """Reads and returns all client records from the clients CSV file."""
-        with self.clients_csv_path.open("r", encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f)
-            return list(reader)
+        return self.clients.list_all()
 
-    def read_score_limits(self) -> List[Dict[str, str]]:
-        """Reads and returns all score-to-limit rules from the score limits CSV file."""
-        with self.score_limits_csv_path.open("r", encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f)
-            return list(reader)
+    def read_score_limits(self) -> Sequence[Mapping[str, str]]:
+        """Returns an immutable snapshot of the score-to-limit rules from the score limits CSV file."""
+        return csv_cache.get(self.score_limits_csv_path).rows
 
     def normalize_cpf(self, cpf: str) -> str:
         """Removes all non-digit characters from a CPF string."""
@@ -37,28 +56,29 @@ class CreditService:
 
     def get_client_by_cpf(self, cpf: str) -> Dict[str, str]:
         """Finds and returns a client record by CPF, raising ValueError if not found."""
-        target = self.normalize_cpf(cpf)
-        clients = self.read_clients()
-        for row in clients:
-            row_cpf = self.normalize_cpf(row.get("cpf", ""))
-            if row_cpf == target:
-                return row
-        raise ValueError("Client not found")
+        client = self.clients.get_by_cpf(cpf)
+        if client is None:
+            raise ValueError("Client not found")
+        return client
 
     def get_current_limit(self, cpf: str) -> float:
         """Returns the client's current credit limit as a float, raising if missing."""
-        client = self.get_client_by_cpf(cpf)
+        return self._parse_limit(self.get_client_by_cpf(cpf))
 
+    def get_current_score(self, cpf: str) -> float:
+        """Returns the client's current score as a float, raising if missing."""
+        return self._parse_score(self.get_client_by_cpf(cpf))
+
+    def _parse_limit(self, client: Dict[str, str]) -> float:
+        """Parses the 'limite_atual' field of a client record, raising if missing."""
         if "limite_atual" not in client or client["limite_atual"] in (None, ""):
             raise ValueError(f"Missing 'limite_atual' for client: {client}")
 
         raw = str(client["limite_atual"]).replace(",", ".")
         return float(raw)
 
-    def get_current_score(self, cpf: str) -> float:
-        """Returns the client's current score as a float, raising if missing."""
-        client = self.get_client_by_cpf(cpf)
-
+    def _parse_score(self, client: Dict[str, str]) -> float:
+        """Parses the 'score' field of a client record, raising if missing."""
         if "score" not in client or client["score"] in (None, ""):
             raise ValueError(f"Missing 'score' for client: {client}")
 
@@ -67,17 +87,7 @@ class CreditService:
 
     def get_max_allowed_limit(self, score: float) -> float:
         """Determines the maximum credit limit allowed for the given score based on score rules."""
-        rows = self.read_score_limits()
-
-        for row in rows:
-            min_score = float(row.get("score_min", 0))
-            max_score = float(row.get("score_max", 0))
-            max_limit = float(row.get("limite_maximo", 0))
-
-            if min_score <= score <= max_score:
-                return max_limit
-
-        return 0.0
+        return self.score_limits.max_limit_for(score)
 
     def append_request(
         self,
@@ -86,35 +96,54 @@ class CreditService:
         requested_limit: float,
         status: str,
     ) -> None:
-        """Appends a credit limit increase request record to the requests CSV file."""
-        fieldnames = [
-            "cpf_cliente",
-            "data_hora_solicitacao",
-            "limite_atual",
-            "novo_limite_solicitado",
-            "status_pedido",
-        ]
-
-        exists = self.requests_csv_path.exists()
-        with self.requests_csv_path.open("a", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            if not exists:
-                writer.writeheader()
-            writer.writerow(
-                {
-                    "cpf_cliente": cpf,
-                    "data_hora_solicitacao": datetime.datetime.utcnow().isoformat(),
-                    "limite_atual": current_limit,
-                    "novo_limite_solicitado": requested_limit,
-                    "status_pedido": status,
-                }
+        """Appends a credit limit increase request record to the request log."""
+        self.requests.append(
+            self._request_row(
+                cpf,
+                current_limit,
+                requested_limit,
+                status,
+                datetime.datetime.utcnow().isoformat(),
             )
+        )
+
+    def get_request_stats(self) -> Dict[str, object]:
+        """Returns request rates and average amounts overall, per day and per score band."""
+        return self.analytics.snapshot()
+
+    def get_request_history(
+        self,
+        cpf: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> HistoryPage:
+        """Returns a page of the client's increase requests, newest first, raising ValueError for a bad cursor."""
+        return self.requests.history(clean_cpf(cpf), start, end, cursor, limit)
+
+    @staticmethod
+    def _request_row(
+        cpf: str,
+        current_limit: float,
+        requested_limit: float,
+        status: str,
+        requested_at: str,
+    ) -> Dict[str, object]:
+        return {
+            "cpf_cliente": cpf,
+            "data_hora_solicitacao": requested_at,
+            "limite_atual": current_limit,
+            "novo_limite_solicitado": requested_limit,
+            "status_pedido": status,
+        }
 
     def evaluate_increase_request(
         self, cpf: str, requested_limit: float
     ) -> Dict[str, str]:
         """Evaluates a credit limit increase request and returns a summary including status and limits."""
-        current_limit = self.get_current_limit(cpf)
+        client = self.get_client_by_cpf(cpf)
+        current_limit = self._parse_limit(client)
 
         if requested_limit < current_limit:
             status = "requested_below_current"
@@ -130,7 +159,7 @@ class CreditService:
                 "status": status,
             }
 
-        score = self.get_current_score(cpf)
+        score = self._parse_score(client)
         max_allowed = self.get_max_allowed_limit(score)
 
         status = "rejected"
@@ -152,22 +181,110 @@ class CreditService:
 
     def update_client_limit(self, cpf: str, new_limit: float) -> None:
         """Updates the client's current limit in the clients, raising if client is not found."""
-        clients = self.read_clients()
-        target = self.normalize_cpf(cpf)
-
-        updated = False
-        for row in clients:
-            row_cpf = self.normalize_cpf(row.get("cpf", ""))
-            if row_cpf == target:
-                row["limite_atual"] = f"{new_limit:.2f}"
-                updated = True
-                break
-
-        if not updated:
-            raise ValueError("Client not found when trying to update limit")
-
-        fieldnames = list(clients[0].keys())
-        with self.clients_csv_path.open("w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(clients)
+        try:
+            self.clients.update_field(cpf, "limite_atual", f"{new_limit:.2f}")
+        except ValueError as exc:
+            raise ValueError("Client not found when trying to update limit") from exc
+
+    def evaluate_increase_requests(
+        self, increase_requests: Sequence[Tuple[str, float]]
+    ) -> List[Dict[str, str]]:
+        """Evaluates many (cpf, requested_limit) pairs as if evaluate_increase_request ran on each in order.
+
+        Requests are decided in rounds holding at most one occurrence per CPF, so a
+        repeated CPF sees the limit approved by its earlier requests. Each round is
+        decided with array operations, then all log rows and limit updates are
+        persisted in one batch each. Unknown CPFs get the "client_not_found" status
+        and, like the single endpoint, are not logged.
+        """
+        clients: Dict[str, Dict[str, str]] = {}
+        for client in self.clients.list_all():
+            clients.setdefault(clean_cpf(client.get("cpf", "")), client)
+
+        current_limits: Dict[str, float] = {}
+        scores: Dict[str, float] = {}
+        rounds: List[List[int]] = []
+        occurrences: Dict[str, int] = {}
+        results: List[Optional[Dict[str, str]]] = [None] * len(increase_requests)
+        log_rows: List[Optional[Dict[str, object]]] = [None] * len(increase_requests)
+        requested_at = datetime.datetime.utcnow().isoformat()
+
+        for i, (cpf, requested_limit) in enumerate(increase_requests):
+            key = clean_cpf(cpf)
+            if key not in current_limits:
+                try:
+                    current_limits[key] = self._parse_limit(clients[key])
+                except (KeyError, ValueError):
+                    results[i] = self._not_found_result(cpf, requested_limit)
+                    continue
+                try:
+                    scores[key] = self._parse_score(clients[key])
+                except ValueError:
+                    scores[key] = float("nan")
+
+            occurrence = occurrences.get(key, 0)
+            occurrences[key] = occurrence + 1
+            if occurrence == len(rounds):
+                rounds.append([])
+            rounds[occurrence].append(i)
+
+        approved_limits: Dict[str, float] = {}
+        for positions in rounds:
+            keys = [clean_cpf(increase_requests[i][0]) for i in positions]
+            requested = np.array(
+                [increase_requests[i][1] for i in positions], dtype=float
+            )
+            current = np.array([current_limits[key] for key in keys])
+            round_scores = np.array([scores[key] for key in keys])
+
+            below = requested < current
+            max_allowed = np.where(
+                below, current, self.score_limits.max_limits_for(round_scores)
+            )
+            approved = ~below & (requested <= max_allowed)
+            unscored = ~below & np.isnan(round_scores)
+
+            for j, i in enumerate(positions):
+                cpf, requested_limit = increase_requests[i]
+                if unscored[j]:
+                    results[i] = self._not_found_result(cpf, requested_limit)
+                    continue
+
+                if below[j]:
+                    status = "requested_below_current"
+                elif approved[j]:
+                    status = "approved"
+                    approved_limits[keys[j]] = requested_limit
+                else:
+                    status = "rejected"
+
+                results[i] = {
+                    "cpf": cpf,
+                    "current_limit": f"{current[j]:.2f}",
+                    "requested_limit": f"{requested_limit:.2f}",
+                    "max_allowed_limit": f"{max_allowed[j]:.2f}",
+                    "status": status,
+                }
+                log_rows[i] = self._request_row(
+                    cpf, float(current[j]), requested_limit, status, requested_at
+                )
+                if approved[j]:
+                    # The single path re-reads the stored, two-decimal limit.
+                    current_limits[keys[j]] = float(f"{requested[j]:.2f}")
+
+        self.requests.append_many([row for row in log_rows if row is not None])
+        self.clients.update_many(
+            [
+                (key, "limite_atual", f"{limit:.2f}")
+                for key, limit in approved_limits.items()
+            ]
+        )
+        return results
+
+    @staticmethod
+    def _not_found_result(cpf: str, requested_limit: float) -> Dict[str, str]:
+        return {
+            "cpf": cpf,
+            "requested_limit": f"{requested_limit:.2f}",
+            "status": "client_not_found",
+        }
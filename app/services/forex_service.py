@@ -1,35 +1,230 @@
 """Service responsible for fetching forex rates from an external API."""
 
-from typing import Dict
+import os
+import threading
+import time
+from functools import lru_cache
+from typing import Callable, Dict, Generic, List, NamedTuple, Optional, Tuple, TypeVar
 
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.utils.metrics import FOREX_HTTP_DURATION
+
+T = TypeVar("T")
+
+ANCHOR_CURRENCY = "EUR"
+
+
+class UnknownCurrencyError(RuntimeError):
+    """Raised when requested currency codes are not quoted by the FX API."""
+
+    def __init__(self, codes: List[str]) -> None:
+        self.codes = sorted(set(codes))
+        super().__init__(
+            f"Currencies not found in FX API rates: {', '.join(self.codes)}"
+        )
+
+
+class RateVector(NamedTuple):
+    """Rates of every supported currency against the anchor currency, sorted by code."""
+
+    codes: np.ndarray
+    rates: np.ndarray
+    by_code: Dict[str, float]
+
+    @classmethod
+    def from_rates(cls, rates: Dict[str, float]) -> "RateVector":
+        codes = sorted(rates)
+        return cls(
+            codes=np.array(codes),
+            rates=np.array([rates[code] for code in codes], dtype=np.float64),
+            by_code=dict(rates),
+        )
+
+    def cross_rate(self, base: str, target: str) -> float:
+        """Returns how many target units one base unit buys, derived through the anchor."""
+        base_rate = self.by_code.get(base)
+        target_rate = self.by_code.get(target)
+        if base_rate is None or target_rate is None:
+            raise UnknownCurrencyError(
+                [code for code in (base, target) if code not in self.by_code]
+            )
+        return target_rate / base_rate
+
+    def positions(self, currencies: List[str]) -> np.ndarray:
+        """Maps currency codes to their positions, raising for any code that is not quoted."""
+        if not len(self.codes):
+            raise UnknownCurrencyError(currencies)
+        wanted = np.array(currencies)
+        positions = np.searchsorted(self.codes, wanted)
+        clipped = np.minimum(positions, len(self.codes) - 1)
+        unknown = self.codes[clipped] != wanted
+        if unknown.any():
+            raise UnknownCurrencyError(wanted[unknown].tolist())
+        return positions
+
+
+@lru_cache(maxsize=1)
+def get_http_session() -> requests.Session:
+    """Creates and returns a cached keep-alive session with a sized connection pool and retries."""
+    pool_size = int(os.getenv("FOREX_POOL_SIZE", "10"))
+    retry = Retry(
+        total=int(os.getenv("FOREX_RETRIES", "2")),
+        backoff_factor=float(os.getenv("FOREX_RETRY_BACKOFF", "0.2")),
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def close_http_session() -> None:
+    """Closes the pooled session, if it was created; called on application shutdown."""
+    if get_http_session.cache_info().currsize:
+        get_http_session().close()
+        get_http_session.cache_clear()
+
+
+class _Flight(Generic[T]):
+    """One in-progress load that concurrent callers for the same key wait on."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Optional[T] = None
+        self.error: Optional[BaseException] = None
+
+
+class RateCache(Generic[T]):
+    """TTL cache keyed by currency, collapsing concurrent misses for a key into one load."""
+
+    def __init__(self, ttl_seconds: float = 3600.0) -> None:
+        self._ttl = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[float, T]] = {}
+        self._in_flight: Dict[str, _Flight[T]] = {}
+
+    def get(self, key: str, loader: Callable[[], T]) -> T:
+        """Returns the cached rates for key, calling loader once per expiry across all threads."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+
+            flight = self._in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight[T]()
+                self._in_flight[key] = flight
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = loader()
+            with self._lock:
+                self._entries[key] = (time.monotonic() + self._ttl, flight.value)
+            return flight.value
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            flight.done.set()
+
+    def invalidate(self, key: str) -> None:
+        """Drops the cached rates for key."""
+        with self._lock:
+            self._entries.pop(key, None)
 
 
 class ForexService:
-    """Provides forex quotation data using the Frankfurter API."""
+    """Provides forex quotation data using the Frankfurter API.
+
+    Only the anchor currency's rate vector is fetched; every other pair is
+    computed locally as a cross rate, so one upstream call serves all quotes.
+    """
 
     BASE_URL = "https://api.frankfurter.app/latest"
 
-    def get_quote(self, base: str, target: str, amount: float) -> Dict[str, float]:
-        """Fetches the exchange calculates the converted amount for the given currencies."""
-        params = {"from": base.upper(), "to": target.upper()}
+    def __init__(
+        self,
+        rate_cache: Optional[RateCache[RateVector]] = None,
+        base_url: Optional[str] = None,
+    ) -> None:
+        self.base_url = base_url or os.getenv("FOREX_API_URL", self.BASE_URL)
+        self.timeout = (
+            float(os.getenv("FOREX_CONNECT_TIMEOUT", "3")),
+            float(os.getenv("FOREX_TIMEOUT", "10")),
+        )
+        self.rate_cache = rate_cache or RateCache[RateVector](
+            ttl_seconds=float(os.getenv("FOREX_RATE_TTL_SECONDS", "3600"))
+        )
+
+    def _fetch_rates(self) -> RateVector:
+        """Fetches every rate quoted against the anchor currency."""
+        params = {"from": ANCHOR_CURRENCY}
+        started = time.perf_counter()
         try:
-            resp = requests.get(self.BASE_URL, params=params, timeout=10)
+            resp = get_http_session().get(
+                self.base_url, params=params, timeout=self.timeout
+            )
         except requests.RequestException as exc:
+            FOREX_HTTP_DURATION.observe(
+                time.perf_counter() - started, outcome="network_error"
+            )
             raise RuntimeError(f"Error calling FX API: {exc}") from exc
+        FOREX_HTTP_DURATION.observe(
+            time.perf_counter() - started, outcome=str(resp.status_code)
+        )
 
         if resp.status_code != 200:
             raise RuntimeError(f"FX API error: {resp.status_code} - {resp.text}")
 
         data = resp.json()
-        rates = data.get("rates") or {}
-        rate = rates.get(target.upper())
-        if rate is None:
-            raise RuntimeError("Target currency not supported by FX API")
+        rates = {code: float(rate) for code, rate in (data.get("rates") or {}).items()}
+        rates[ANCHOR_CURRENCY] = 1.0
+        return RateVector.from_rates(rates)
 
-        converted = float(rate) * float(amount)
+    def get_rate_vector(self) -> RateVector:
+        """Returns the anchor rate vector, served from the cache when fresh."""
+        return self.rate_cache.get(ANCHOR_CURRENCY, self._fetch_rates)
+
+    def get_quote(self, base: str, target: str, amount: float) -> Dict[str, float]:
+        """Fetches the exchange calculates the converted amount for the given currencies."""
+        rate = self.get_rate_vector().cross_rate(base.upper(), target.upper())
+        converted = rate * float(amount)
 
         return {
-            "rate": float(rate),
+            "rate": rate,
             "converted_amount": converted,
         }
+
+    def get_quotes(
+        self, bases: List[str], targets: List[str], amounts: List[float]
+    ) -> Dict[str, List[float]]:
+        """Prices many currency pairs in one vectorized pass over the cached rate vector."""
+        vector = self.get_rate_vector()
+        positions = vector.positions([code.upper() for code in bases + targets])
+        base_positions, target_positions = (
+            positions[: len(bases)],
+            positions[len(bases) :],
+        )
+
+        rates = vector.rates[target_positions] / vector.rates[base_positions]
+        converted = rates * np.asarray(amounts, dtype=np.float64)
+
+        return {"rates": rates.tolist(), "converted_amounts": converted.tolist()}
@@ -0,0 +1,158 @@
+"""Versioned interview scoring configuration compiled into scalar and vectorized scorers."""
+
+import json
+import os
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Sequence, Union
+
+import numpy as np
+
+Number = Union[int, float]
+
+
+class ScoringConfig(NamedTuple):
+    """Weights of the interview score formula.
+
+    score = income / (expenses + 1) * income_weight + employment + dependents + debt,
+    clamped to [0, 1000] and rounded to two decimals. dependents_weights[n] applies
+    to n dependents (counts below zero use the first entry) and dependents_default
+    to any count beyond the list.
+    """
+
+    version: str
+    income_weight: Number
+    employment_weights: Dict[str, Number]
+    dependents_weights: List[Number]
+    dependents_default: Number
+    debt_weight: Number
+    no_debt_weight: Number
+
+
+SCORING_CONFIGS: Dict[str, ScoringConfig] = {
+    "v1": ScoringConfig(
+        version="v1",
+        income_weight=30,
+        employment_weights={
+            "formal": 300,
+            "autônomo": 200,
+            "autonomo": 200,
+            "desempregado": 0,
+        },
+        dependents_weights=[100, 80, 60],
+        dependents_default=30,
+        debt_weight=-100,
+        no_debt_weight=100,
+    ),
+}
+
+
+class CompiledScorer:
+    """Scores one applicant or arrays of applicants with identical results for both paths.
+
+    The weighted sum is vectorized; clamping and rounding run per element with
+    Python's min/max/round so that every score, including its int-or-float type,
+    matches the scalar formula exactly.
+    """
+
+    def __init__(self, config: ScoringConfig) -> None:
+        self.config = config
+        self._dependents_table = np.array(
+            list(config.dependents_weights) + [config.dependents_default]
+        )
+
+    def _employment_weight(self, job_type: str) -> Number:
+        return self.config.employment_weights.get(job_type.lower(), 0)
+
+    def _dependents_weight(self, dependents_count: int) -> Number:
+        weights = self.config.dependents_weights
+        if dependents_count <= 0:
+            return weights[0]
+        if dependents_count < len(weights):
+            return weights[dependents_count]
+        return self.config.dependents_default
+
+    @staticmethod
+    def _finish(score: float) -> Number:
+        return round(max(0, min(1000, score)), 2)
+
+    def score(
+        self,
+        monthly_income: float,
+        monthly_expenses: float,
+        job_type: str,
+        dependents_count: int,
+        has_debt: bool,
+    ) -> Number:
+        """Scores a single applicant."""
+        config = self.config
+        debt_weight = config.debt_weight if has_debt else config.no_debt_weight
+
+        base = (monthly_income / (monthly_expenses + 1)) * config.income_weight
+
+        score = (
+            base
+            + self._employment_weight(job_type)
+            + self._dependents_weight(dependents_count)
+            + debt_weight
+        )
+
+        return self._finish(score)
+
+    def score_many(
+        self,
+        monthly_incomes: Sequence[float],
+        monthly_expenses: Sequence[float],
+        job_types: Sequence[str],
+        dependents_counts: Sequence[int],
+        has_debts: Sequence[bool],
+    ) -> List[Number]:
+        """Scores many applicants in one pass over NumPy arrays, raising ValueError on expenses of -1."""
+        config = self.config
+        incomes = np.asarray(monthly_incomes, dtype=np.float64)
+        denominators = np.asarray(monthly_expenses, dtype=np.float64) + 1
+        if (denominators == 0).any():
+            raise ValueError("monthly_expenses must not be -1")
+
+        employment = np.array(
+            [self._employment_weight(job_type) for job_type in job_types]
+        )
+        dependents = self._dependents_table[
+            np.clip(
+                np.asarray(dependents_counts, dtype=np.int64),
+                0,
+                len(config.dependents_weights),
+            )
+        ]
+        debt = np.where(
+            np.asarray(has_debts, dtype=bool),
+            config.debt_weight,
+            config.no_debt_weight,
+        )
+
+        base = (incomes / denominators) * config.income_weight
+        scores = base + employment + dependents + debt
+
+        return [self._finish(score) for score in scores.tolist()]
+
+
+def load_scoring_config(version: str, path: str = "") -> ScoringConfig:
+    """Returns a built-in config by version, or loads one from a JSON file when a path is given."""
+    if path:
+        with open(path, "r", encoding="utf-8") as f:
+            return ScoringConfig(**json.load(f))
+
+    try:
+        return SCORING_CONFIGS[version]
+    except KeyError as exc:
+        raise RuntimeError(f"Unknown scoring config version: {version}") from exc
+
+
+@lru_cache(maxsize=None)
+def get_scorer(version: str = "", path: str = "") -> CompiledScorer:
+    """Returns the compiled scorer for SCORING_CONFIG_VERSION or SCORING_CONFIG_PATH."""
+    return CompiledScorer(
+        load_scoring_config(
+            version or os.getenv("SCORING_CONFIG_VERSION", "v1"),
+            path or os.getenv("SCORING_CONFIG_PATH", ""),
+        )
+    )
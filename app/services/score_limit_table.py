@@ -0,0 +1,132 @@
+"""Compiled score-to-limit decision table with bisect lookup and mtime-based hot reload."""
+
+import bisect
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Mapping, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from app.utils.csv_cache import Signature, csv_cache
+
+
+class CompiledBands(NamedTuple):
+    """Immutable, sorted boundary arrays for the score bands."""
+
+    mins: Tuple[float, ...]
+    maxs: Tuple[float, ...]
+    limits: Tuple[float, ...]
+
+
+def compile_bands(rows: Iterable[Mapping[str, str]]) -> CompiledBands:
+    """Sorts and validates score rules, raising ValueError on inverted, overlapping or gapped bands."""
+    bands = sorted(
+        (
+            float(row.get("score_min", 0)),
+            float(row.get("score_max", 0)),
+            float(row.get("limite_maximo", 0)),
+        )
+        for row in rows
+    )
+
+    for min_score, max_score, _ in bands:
+        if min_score > max_score:
+            raise ValueError(f"Invalid score band: {min_score} > {max_score}")
+
+    for (_, prev_max, _), (next_min, _, _) in zip(bands, bands[1:]):
+        if next_min <= prev_max:
+            raise ValueError(f"Overlapping score bands at {prev_max} and {next_min}")
+        if next_min - prev_max > 1:
+            raise ValueError(f"Gap between score bands {prev_max} and {next_min}")
+
+    return CompiledBands(
+        mins=tuple(band[0] for band in bands),
+        maxs=tuple(band[1] for band in bands),
+        limits=tuple(band[2] for band in bands),
+    )
+
+
+class ScoreLimitTable:
+    """Serves maximum limits per score from compiled bands, reloading only when the file changes."""
+
+    def __init__(self, csv_path: str, check_interval: float = 1.0) -> None:
+        self._csv_path = Path(csv_path)
+        self._check_interval = check_interval
+        self._lock = threading.Lock()
+        self._bands: Optional[CompiledBands] = None
+        self._signature: Optional[Signature] = None
+        self._next_check = 0.0
+
+    def _maybe_reload(self) -> CompiledBands:
+        """Recompiles the table when the file changed, checking at most once per interval."""
+        now = time.monotonic()
+        bands = self._bands
+        if bands is not None and now < self._next_check:
+            return bands
+
+        with self._lock:
+            if self._bands is not None and now < self._next_check:
+                return self._bands
+
+            self._next_check = now + self._check_interval
+            snapshot = csv_cache.get(self._csv_path)
+            if self._bands is not None and snapshot.signature == self._signature:
+                return self._bands
+
+            try:
+                compiled = compile_bands(snapshot.rows)
+            except ValueError as exc:
+                if self._bands is None:
+                    raise
+                print("SCORE TABLE RELOAD ERROR:", exc)
+                return self._bands
+
+            self._bands = compiled
+            self._signature = snapshot.signature
+            return compiled
+
+    def bands(self) -> CompiledBands:
+        """Returns the currently compiled bands."""
+        return self._maybe_reload()
+
+    def max_limit_for(self, score: float) -> float:
+        """Returns the maximum limit of the band containing the score, or 0.0 if none matches."""
+        bands = self._maybe_reload()
+        i = bisect.bisect_right(bands.mins, score) - 1
+        if i >= 0 and score <= bands.maxs[i]:
+            return bands.limits[i]
+        return 0.0
+
+    def band_label_for(self, score: Optional[float]) -> str:
+        """Returns the "min-max" label of the band containing the score, or "unknown" if none matches."""
+        if score is None or score != score:
+            return "unknown"
+        bands = self._maybe_reload()
+        i = bisect.bisect_right(bands.mins, score) - 1
+        if i >= 0 and score <= bands.maxs[i]:
+            return f"{bands.mins[i]:g}-{bands.maxs[i]:g}"
+        return "unknown"
+
+    def max_limits_for(self, scores: np.ndarray) -> np.ndarray:
+        """Vectorized max_limit_for: looks every score up with one searchsorted over the bands."""
+        bands = self._maybe_reload()
+        if not bands.mins:
+            return np.zeros(len(scores))
+
+        mins = np.asarray(bands.mins)
+        positions = np.searchsorted(mins, scores, side="right") - 1
+        clipped = np.clip(positions, 0, None)
+        matched = (positions >= 0) & (scores <= np.asarray(bands.maxs)[clipped])
+        return np.where(matched, np.asarray(bands.limits)[clipped], 0.0)
+
+
+@lru_cache(maxsize=None)
+def _table_for(resolved_path: str) -> ScoreLimitTable:
+    return ScoreLimitTable(resolved_path)
+
+
+def get_score_limit_table(csv_path: str) -> ScoreLimitTable:
+    """Returns the process-wide compiled table for the given score limits CSV file."""
+    return _table_for(str(Path(csv_path).resolve()))
@@ -1,12 +1,12 @@
 """Utility functions for CPF cleaning, date normalization, and CSV reading."""
 
-import csv
 import os
-from pathlib import Path
-from typing import Optional
+from typing import Mapping, Optional, Sequence
 from datetime import datetime
 from dotenv import load_dotenv
 
+from app.utils.csv_cache import csv_cache
+
 load_dotenv()
 
 
@@ -48,15 +48,10 @@ def normalize_birth_date(raw_birth_date: str) -> str:
     raise TypeError("Formato de data inválido.")
 
 
-def read_csv(path: Optional[str] = None):
-    """Reads a CSV file from the given path or CSV_PATH env var and returns its rows as dictionaries."""
+def read_csv(path: Optional[str] = None) -> Sequence[Mapping[str, str]]:
+    """Returns an immutable, cached snapshot of the rows of the given CSV or CSV_PATH env var."""
     path = path or os.getenv("CSV_PATH")
     if not path:
         raise RuntimeError("CSV_PATH not set.")
 
-    file = Path(path)
-    if not file.exists():
-        raise FileNotFoundError(f"CSV not found: {path}")
-
-    with file.open("r", encoding="utf-8") as f:
-        return list(csv.DictReader(f))
+    return csv_cache.get(path).rows
@@ -0,0 +1,127 @@
+"""Parsing of CSV and NDJSON request bodies for bulk endpoints and command-line tools."""
+
+import csv
+import io
+import json
+from typing import Dict, List, Sequence, Tuple
+
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/jsonl", "application/json")
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+
+def detect_format(content_type_or_suffix: str) -> str:
+    """Maps a Content-Type header or a file suffix to "csv" or "ndjson"."""
+    value = content_type_or_suffix.split(";", 1)[0].strip().lower()
+    if value in NDJSON_MEDIA_TYPES or value in NDJSON_SUFFIXES:
+        return "ndjson"
+    return "csv"
+
+
+def parse_records(
+    body: str, fmt: str, required: Sequence[str], max_rows: int = 100000
+) -> List[Dict[str, str]]:
+    """Parses CSV (with a header) or NDJSON into string records, raising ValueError naming the bad row."""
+    if fmt == "ndjson":
+        records = []
+        for line in body.splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as exc:
+                raise ValueError(f"Row {len(records) + 1}: invalid JSON") from exc
+            if not isinstance(record, dict):
+                raise ValueError(f"Row {len(records) + 1}: expected a JSON object")
+            records.append({key: str(value) for key, value in record.items()})
+    else:
+        reader = csv.DictReader(io.StringIO(body))
+        missing = [name for name in required if name not in (reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f"Missing CSV columns: {', '.join(missing)}")
+        records = list(reader)
+
+    if len(records) > max_rows:
+        raise ValueError(f"Too many rows: the limit is {max_rows}")
+
+    for row_number, record in enumerate(records, start=1):
+        for name in required:
+            if record.get(name) in (None, ""):
+                raise ValueError(f"Row {row_number}: missing '{name}'")
+    return records
+
+
+def parse_float(record: Dict[str, str], name: str, row_number: int) -> float:
+    """Parses a numeric field accepting a decimal comma, raising ValueError naming the row."""
+    try:
+        return float(str(record[name]).replace(",", "."))
+    except ValueError as exc:
+        raise ValueError(f"Row {row_number}: '{name}' is not a number") from exc
+
+
+def parse_increase_requests(
+    body: str, fmt: str, max_rows: int = 100000
+) -> List[Tuple[str, float]]:
+    """Parses bulk credit increase requests with "cpf" and positive "requested_limit" fields."""
+    records = parse_records(body, fmt, ("cpf", "requested_limit"), max_rows)
+
+    increase_requests = []
+    for row_number, record in enumerate(records, start=1):
+        requested_limit = parse_float(record, "requested_limit", row_number)
+        if requested_limit <= 0:
+            raise ValueError(f"Row {row_number}: 'requested_limit' must be positive")
+        increase_requests.append((record["cpf"], requested_limit))
+    return increase_requests
+
+
+TRUE_VALUES = ("true", "1", "sim", "s", "yes")
+FALSE_VALUES = ("false", "0", "não", "nao", "n", "no")
+
+
+def parse_bool(record: Dict[str, str], name: str, row_number: int) -> bool:
+    """Parses a yes/no field in English or Portuguese, raising ValueError naming the row."""
+    value = str(record[name]).strip().lower()
+    if value in TRUE_VALUES:
+        return True
+    if value in FALSE_VALUES:
+        return False
+    raise ValueError(f"Row {row_number}: '{name}' must be true or false")
+
+
+def parse_int(record: Dict[str, str], name: str, row_number: int) -> int:
+    """Parses an integer field, raising ValueError naming the row."""
+    try:
+        return int(str(record[name]).strip())
+    except ValueError as exc:
+        raise ValueError(f"Row {row_number}: '{name}' is not an integer") from exc
+
+
+INTERVIEW_FIELDS = (
+    "monthly_income",
+    "monthly_expenses",
+    "job_type",
+    "dependents_count",
+    "has_debt",
+)
+
+
+def parse_interview_applicants(
+    body: str, fmt: str, max_rows: int = 100000
+) -> Dict[str, list]:
+    """Parses interview applicants into column lists keyed by field name, plus optional "cpf"."""
+    records = parse_records(body, fmt, INTERVIEW_FIELDS, max_rows)
+
+    columns: Dict[str, list] = {name: [] for name in ("cpf",) + INTERVIEW_FIELDS}
+    for row_number, record in enumerate(records, start=1):
+        columns["cpf"].append(record.get("cpf") or "")
+        columns["monthly_income"].append(
+            parse_float(record, "monthly_income", row_number)
+        )
+        columns["monthly_expenses"].append(
+            parse_float(record, "monthly_expenses", row_number)
+        )
+        columns["job_type"].append(record["job_type"])
+        columns["dependents_count"].append(
+            parse_int(record, "dependents_count", row_number)
+        )
+        columns["has_debt"].append(parse_bool(record, "has_debt", row_number))
+    return columns
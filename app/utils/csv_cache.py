@@ -0,0 +1,96 @@
+"""Process-wide cache of parsed CSV files revalidated by inode, mtime and size."""
+
+import csv
+import os
+import threading
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, NamedTuple, Sequence, Tuple, Union
+
+from app.utils.metrics import CSV_IO_DURATION
+
+PathLike = Union[str, Path]
+Signature = Tuple[int, int, int]
+
+
+class CsvSnapshot(NamedTuple):
+    """Immutable parsed content of a CSV file at a given file signature."""
+
+    signature: Signature
+    fieldnames: Tuple[str, ...]
+    rows: Tuple[Mapping[str, str], ...]
+
+
+def file_signature(path: PathLike) -> Signature:
+    """Returns the (inode, mtime_ns, size) triple used to detect file changes."""
+    st = os.stat(path)
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _freeze(
+    signature: Signature, fieldnames: Sequence[str], rows: Iterable[Mapping[str, str]]
+) -> CsvSnapshot:
+    return CsvSnapshot(
+        signature=signature,
+        fieldnames=tuple(fieldnames),
+        rows=tuple(MappingProxyType(dict(row)) for row in rows),
+    )
+
+
+class CsvCache:
+    """Hands out immutable snapshots of CSV files, re-parsing only when the file changed."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[str, CsvSnapshot] = {}
+
+    @staticmethod
+    def _key(path: PathLike) -> str:
+        return str(Path(path).resolve())
+
+    def get(self, path: PathLike) -> CsvSnapshot:
+        """Returns the snapshot for the file, raising FileNotFoundError if it does not exist."""
+        key = self._key(path)
+        if not os.path.exists(key):
+            raise FileNotFoundError(f"CSV not found: {path}")
+
+        signature = file_signature(key)
+        cached = self._entries.get(key)
+        if cached is not None and cached.signature == signature:
+            return cached
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached.signature == signature:
+                return cached
+
+            with CSV_IO_DURATION.time(operation="read", file=Path(key).name):
+                with open(key, "r", encoding="utf-8", newline="") as f:
+                    reader = csv.DictReader(f)
+                    rows = list(reader)
+                    fieldnames = list(reader.fieldnames or [])
+
+            snapshot = _freeze(signature, fieldnames, rows)
+            self._entries[key] = snapshot
+            return snapshot
+
+    def put(
+        self,
+        path: PathLike,
+        fieldnames: Sequence[str],
+        rows: Iterable[Mapping[str, str]],
+    ) -> CsvSnapshot:
+        """Stores the content just written to the file, so the writer's own update needs no re-parse."""
+        key = self._key(path)
+        snapshot = _freeze(file_signature(key), fieldnames, rows)
+        with self._lock:
+            self._entries[key] = snapshot
+        return snapshot
+
+    def invalidate(self, path: PathLike) -> None:
+        """Drops the cached snapshot for the file."""
+        with self._lock:
+            self._entries.pop(self._key(path), None)
+
+
+csv_cache = CsvCache()
@@ -1,46 +1,312 @@
-"""Utility functions for initializing the Groq client and generating LLM text responses."""
+"""Utility functions for initializing the Groq clients and generating LLM text responses."""
 
+import hashlib
+import json
 import os
+import threading
+import time
+from collections import OrderedDict
 from functools import lru_cache
-from groq import Groq, GroqError
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
+import httpx
+from groq import AsyncGroq, DefaultAsyncHttpxClient, GroqError
 
-@lru_cache(maxsize=1)
-def get_client() -> Groq:
-    """Creates and returns a cached Groq client instance using the API key."""
+from app.utils.llm_usage import LlmCallRecord, record_cache_hit
+
+FALLBACK_REPLY = (
+    "Não consegui gerar uma resposta com o modelo de IA agora. "
+    "Tente novamente mais tarde."
+)
+
+TEMPERATURE = 0.4
+
+
+class CompletionCache:
+    """Bounded LRU cache of completions with TTL expiry, hit/miss counters and optional JSON persistence."""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600.0,
+        persist_path: Optional[str] = None,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._persist_path = Path(persist_path) if persist_path else None
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    @staticmethod
+    def make_key(model: str, temperature: float, system: str, user: str) -> str:
+        """Fingerprints everything that determines a completion."""
+        payload = json.dumps([model, temperature, system, user], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns the cached completion, counting a hit or a miss."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: str, text: str) -> None:
+        """Stores a completion, evicting the least recently used entries beyond the cap."""
+        with self._lock:
+            self._entries[key] = (time.time() + self._ttl, text)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the entry count and hit/miss counters."""
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def _load(self) -> None:
+        if self._persist_path is None or not self._persist_path.exists():
+            return
+        try:
+            data = json.loads(self._persist_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            print("LLM CACHE LOAD ERROR:", exc)
+            return
+
+        now = time.time()
+        for key, expires_at, text in data:
+            if expires_at > now:
+                self._entries[key] = (expires_at, text)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def save(self) -> None:
+        """Writes the live entries to the persistence file, if one is configured."""
+        if self._persist_path is None:
+            return
+
+        with self._lock:
+            data = [[key, exp, text] for key, (exp, text) in self._entries.items()]
+
+        self._persist_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._persist_path.with_name(self._persist_path.name + ".tmp")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, self._persist_path)
+
+
+_completion_caches: Dict[str, CompletionCache] = {}
+_completion_caches_lock = threading.Lock()
+
+
+def get_completion_cache(
+    name: str, enabled_by_default: bool = False
+) -> Optional[CompletionCache]:
+    """Returns the named agent's completion cache, or None when caching is disabled for it.
+
+    LLM_CACHE_<NAME>_ENABLED, _MAX_ENTRIES and _TTL_SECONDS override the global
+    LLM_CACHE_* settings; LLM_CACHE_DIR enables persistence to <dir>/<name>.json.
+    """
+    prefix = f"LLM_CACHE_{name.upper()}_"
+
+    def setting(key: str, default: str) -> str:
+        return os.getenv(prefix + key, os.getenv("LLM_CACHE_" + key, default))
+
+    if setting("ENABLED", "1" if enabled_by_default else "0") != "1":
+        return None
+
+    with _completion_caches_lock:
+        cache = _completion_caches.get(name)
+        if cache is None:
+            cache_dir = os.getenv("LLM_CACHE_DIR")
+            cache = CompletionCache(
+                max_entries=int(setting("MAX_ENTRIES", "1024")),
+                ttl_seconds=float(setting("TTL_SECONDS", "3600")),
+                persist_path=(
+                    str(Path(cache_dir) / f"{name}.json") if cache_dir else None
+                ),
+            )
+            _completion_caches[name] = cache
+        return cache
+
+
+def save_completion_caches() -> None:
+    """Persists every configured completion cache; called on application shutdown."""
+    with _completion_caches_lock:
+        caches = list(_completion_caches.values())
+    for cache in caches:
+        try:
+            cache.save()
+        except OSError as exc:
+            print("LLM CACHE SAVE ERROR:", exc)
+
+
+def _get_api_key() -> str:
     api_key = os.getenv("GROQ_API_KEY")
     if not api_key:
         raise RuntimeError("GROQ_API_KEY is not set")
+    return api_key
 
-    return Groq(api_key=api_key)
 
+def _get_model_name() -> str:
+    return os.getenv("GROQ_MODEL_NAME", "llama-3.1-8b-instant")
 
-def generate_text(system_message: str, user_message: str) -> str:
-    """Sends a chat completion request to Groq and returns the generated text response."""
-    client = get_client()
 
-    model_name = os.getenv("GROQ_MODEL_NAME", "llama-3.1-8b-instant")
-
-    messages = [
+def _build_messages(system_message: str, user_message: str) -> List[Dict[str, str]]:
+    return [
         {"role": "system", "content": system_message},
         {"role": "user", "content": user_message},
     ]
 
+
+@lru_cache(maxsize=1)
+def get_async_client() -> AsyncGroq:
+    """Creates and returns a cached AsyncGroq client backed by a sized keep-alive connection pool."""
+    http_client = DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=int(os.getenv("GROQ_MAX_CONNECTIONS", "1000")),
+            max_keepalive_connections=int(os.getenv("GROQ_MAX_KEEPALIVE", "100")),
+            keepalive_expiry=float(os.getenv("GROQ_KEEPALIVE_EXPIRY", "30")),
+        ),
+        timeout=httpx.Timeout(
+            float(os.getenv("GROQ_TIMEOUT_SECONDS", "30")),
+            connect=float(os.getenv("GROQ_CONNECT_TIMEOUT_SECONDS", "5")),
+        ),
+    )
+    return AsyncGroq(
+        api_key=_get_api_key(),
+        http_client=http_client,
+        max_retries=int(os.getenv("GROQ_MAX_RETRIES", "2")),
+    )
+
+
+async def close_async_client() -> None:
+    """Closes the pooled async client, if it was created; called on application shutdown."""
+    if get_async_client.cache_info().currsize:
+        await get_async_client().close()
+        get_async_client.cache_clear()
+
+
+async def generate_text_async(
+    system_message: str,
+    user_message: str,
+    cache: Optional[CompletionCache] = None,
+    agent: str = "unknown",
+) -> str:
+    """Awaits a chat completion from Groq without blocking a worker thread and returns its text.
+
+    When a cache is given, identical prompts are answered from it and successful
+    completions are stored in it; the fallback reply is never cached. Usage,
+    latency and failures are accounted to the given agent name.
+    """
+    model_name = _get_model_name()
+    key = None
+    if cache is not None:
+        key = cache.make_key(model_name, TEMPERATURE, system_message, user_message)
+        cached = cache.get(key)
+        if cached is not None:
+            record_cache_hit(agent)
+            return cached
+
+    client = get_async_client()
+    record = LlmCallRecord(agent, model_name, "generate")
+
     try:
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model=model_name,
-            messages=messages,
-            temperature=0.4,
+            messages=_build_messages(system_message, user_message),
+            temperature=TEMPERATURE,
         )
 
         chat_msg = response.choices[0].message
-        content = chat_msg.content or ""
-
-        return content.strip()
+        content = (chat_msg.content or "").strip()
 
     except GroqError as exc:
         print("LLM ERROR:", exc)
-        return (
-            "Não consegui gerar uma resposta com o modelo de IA agora. "
-            "Tente novamente mais tarde."
+        record.finish("error", exc)
+        return FALLBACK_REPLY
+
+    record.set_usage(response.usage)
+    record.finish("ok")
+
+    if cache is not None and key is not None and content:
+        cache.put(key, content)
+    return content
+
+
+async def stream_text_async(
+    system_message: str,
+    user_message: str,
+    cache: Optional[CompletionCache] = None,
+    agent: str = "unknown",
+) -> AsyncIterator[str]:
+    """Yields the completion text as Groq streams it, so callers can render from the first token.
+
+    A cached completion is yielded in one piece. If the request fails before any
+    token arrived the fallback reply is yielded instead; a failure mid-stream
+    ends the stream early and nothing is cached. Time to first token and the
+    usage block of the final chunk are accounted to the given agent name.
+    """
+    model_name = _get_model_name()
+    key = None
+    if cache is not None:
+        key = cache.make_key(model_name, TEMPERATURE, system_message, user_message)
+        cached = cache.get(key)
+        if cached is not None:
+            record_cache_hit(agent)
+            yield cached
+            return
+
+    client = get_async_client()
+    parts: List[str] = []
+    record = LlmCallRecord(agent, model_name, "stream")
+    outcome = "cancelled"
+    error: Optional[GroqError] = None
+
+    try:
+        stream = await client.chat.completions.create(
+            model=model_name,
+            messages=_build_messages(system_message, user_message),
+            temperature=TEMPERATURE,
+            stream=True,
         )
+
+        async for chunk in stream:
+            x_groq = getattr(chunk, "x_groq", None)
+            record.set_usage(
+                getattr(chunk, "usage", None) or getattr(x_groq, "usage", None)
+            )
+            if not chunk.choices:
+                continue
+            token = chunk.choices[0].delta.content
+            if not token:
+                continue
+            if not parts:
+                token = token.lstrip()
+                if not token:
+                    continue
+                record.first_token()
+            parts.append(token)
+            yield token
+        outcome = "ok"
+
+    except GroqError as exc:
+        print("LLM ERROR:", exc)
+        outcome, error = "error", exc
+        if not parts:
+            yield FALLBACK_REPLY
+        return
+
+    finally:
+        record.finish(outcome, error)
+
+    content = "".join(parts).strip()
+    if cache is not None and key is not None and content:
+        cache.put(key, content)
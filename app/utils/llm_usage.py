@@ -0,0 +1,100 @@
+"""Per-agent accounting of Groq token usage, latency and failures, exported through the metrics registry."""
+
+import time
+from typing import Optional
+
+from app.utils.metrics import LLM_LATENCY_BUCKETS, LLM_REQUEST_DURATION, registry
+
+LLM_CALLS = registry.counter(
+    "llm_calls_total",
+    "Groq chat completion calls by calling agent, model, call type and outcome.",
+    ("agent", "model", "operation", "outcome"),
+)
+LLM_FAILURES = registry.counter(
+    "llm_failures_total",
+    "Groq chat completion calls that raised, by calling agent, model and error type.",
+    ("agent", "model", "error"),
+)
+LLM_PROMPT_TOKENS = registry.counter(
+    "llm_prompt_tokens_total",
+    "Prompt tokens billed by Groq, by calling agent and model.",
+    ("agent", "model"),
+)
+LLM_COMPLETION_TOKENS = registry.counter(
+    "llm_completion_tokens_total",
+    "Completion tokens billed by Groq, by calling agent and model.",
+    ("agent", "model"),
+)
+LLM_TIME_TO_FIRST_TOKEN = registry.histogram(
+    "llm_time_to_first_token_seconds",
+    "Time from sending a streamed completion request to its first content token.",
+    ("agent", "model"),
+    buckets=LLM_LATENCY_BUCKETS,
+)
+LLM_CACHE_HITS = registry.counter(
+    "llm_cache_hits_total",
+    "Completions answered from the agent's completion cache without calling Groq.",
+    ("agent",),
+)
+
+
+class LlmCallRecord:
+    """Collects the timing and usage of one Groq call and records them when it finishes."""
+
+    def __init__(self, agent: str, model: str, operation: str) -> None:
+        self.agent = agent
+        self.model = model
+        self.operation = operation
+        self.started = time.perf_counter()
+        self.first_token_at: Optional[float] = None
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    def first_token(self) -> None:
+        """Marks the arrival of the first content token, once."""
+        if self.first_token_at is None:
+            self.first_token_at = time.perf_counter()
+
+    def set_usage(self, usage: object) -> None:
+        """Keeps the token counts of a Groq usage block, ignoring a missing one."""
+        if usage is None:
+            return
+        self.prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+        self.completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+
+    def finish(self, outcome: str, error: Optional[BaseException] = None) -> None:
+        """Records latency, the call outcome, tokens, time to first token and any failure."""
+        LLM_REQUEST_DURATION.observe(
+            time.perf_counter() - self.started,
+            agent=self.agent,
+            model=self.model,
+            operation=self.operation,
+            outcome=outcome,
+        )
+        LLM_CALLS.inc(
+            agent=self.agent,
+            model=self.model,
+            operation=self.operation,
+            outcome=outcome,
+        )
+        if self.prompt_tokens:
+            LLM_PROMPT_TOKENS.inc(
+                self.prompt_tokens, agent=self.agent, model=self.model
+            )
+        if self.completion_tokens:
+            LLM_COMPLETION_TOKENS.inc(
+                self.completion_tokens, agent=self.agent, model=self.model
+            )
+        if self.first_token_at is not None:
+            LLM_TIME_TO_FIRST_TOKEN.observe(
+                self.first_token_at - self.started, agent=self.agent, model=self.model
+            )
+        if error is not None:
+            LLM_FAILURES.inc(
+                agent=self.agent, model=self.model, error=type(error).__name__
+            )
+
+
+def record_cache_hit(agent: str) -> None:
+    """Counts a completion served from the agent's cache."""
+    LLM_CACHE_HITS.inc(agent=agent)
@@ -0,0 +1,47 @@
+"""Cross-process advisory file locks and per-key lock striping."""
+
+import threading
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, List, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows has no fcntl; cross-process locking is skipped there.
+    fcntl = None
+
+
+@contextmanager
+def file_lock(path: Union[str, Path], exclusive: bool = True) -> Iterator[None]:
+    """Holds an flock on the given lock file for the duration of the block.
+
+    flock locks belong to the open file description, so two threads of the same
+    process that each enter this block also exclude each other.
+    """
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class LockStripes:
+    """Maps keys onto a fixed pool of locks so that distinct keys rarely contend."""
+
+    def __init__(self, stripes: int = 64) -> None:
+        self._locks: List[threading.Lock] = [threading.Lock() for _ in range(stripes)]
+
+    def _position(self, key: str) -> int:
+        return zlib.crc32(key.encode("utf-8")) % len(self._locks)
+
+    def for_key(self, key: str) -> threading.Lock:
+        """Returns the lock guarding the given key."""
+        return self._locks[self._position(key)]
+
+    def for_keys(self, keys: Iterable[str]) -> List[threading.Lock]:
+        """Returns the distinct locks guarding the keys in a fixed order, so holders cannot deadlock."""
+        return [self._locks[i] for i in sorted({self._position(key) for key in keys})]
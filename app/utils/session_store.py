@@ -0,0 +1,48 @@
+"""In-memory per-session state store with TTL expiry and an LRU size cap."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class SessionStore(Generic[T]):
+    """Keeps one state object per session id, evicting idle and least recently used sessions."""
+
+    def __init__(self, ttl_seconds: float = 1800.0, max_entries: int = 10000) -> None:
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, T]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self, now: float) -> None:
+        """Drops expired sessions from the LRU end, then trims to the size cap."""
+        while self._entries:
+            session_id, (last_seen, _) = next(iter(self._entries.items()))
+            if now - last_seen < self._ttl and len(self._entries) <= self._max_entries:
+                break
+            del self._entries[session_id]
+
+    def get_or_create(self, session_id: str, factory: Callable[[], T]) -> T:
+        """Returns the session's state, creating it with the factory when missing or expired."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is not None and now - entry[0] < self._ttl:
+                state = entry[1]
+            else:
+                state = factory()
+            self._entries[session_id] = (now, state)
+            self._entries.move_to_end(session_id)
+            self._evict(now)
+            return state
+
+    def discard(self, session_id: str) -> None:
+        """Removes the session's state."""
+        with self._lock:
+            self._entries.pop(session_id, None)
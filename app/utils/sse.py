@@ -0,0 +1,42 @@
+"""Server-sent events helpers for streaming agent replies."""
+
+import json
+from typing import Any, AsyncIterator, Dict, Optional
+
+from fastapi.responses import StreamingResponse
+
+
+def format_event(event: str, data: Any) -> str:
+    """Encodes one SSE event; data is JSON so that newlines inside tokens survive framing."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def reply_events(
+    meta: Dict[str, Any], tokens: AsyncIterator[str]
+) -> AsyncIterator[str]:
+    """Emits a meta event with the structured result, one token event per chunk and a done event."""
+    yield format_event("meta", meta)
+
+    parts = []
+    async for token in tokens:
+        parts.append(token)
+        yield format_event("token", token)
+
+    yield format_event("done", {"reply": "".join(parts).strip()})
+
+
+def sse_response(
+    meta: Dict[str, Any],
+    tokens: AsyncIterator[str],
+    headers: Optional[Dict[str, str]] = None,
+) -> StreamingResponse:
+    """Wraps a reply stream in an unbuffered text/event-stream response."""
+    return StreamingResponse(
+        reply_events(meta, tokens),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+            **(headers or {}),
+        },
+    )
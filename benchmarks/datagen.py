@@ -0,0 +1,147 @@
+"""Synthetic data generator for the clients file, the score bands and the credit request log.
+
+Usage: python -m benchmarks.datagen --out /tmp/bench-data --clients 1000000 --requests 5000000
+"""
+
+import argparse
+import csv
+import datetime
+import random
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+from app.repositories.credit_request_repository import REQUEST_FIELDNAMES
+
+CLIENT_FIELDNAMES = ["cpf", "data_nascimento", "nome", "limite_atual", "score"]
+SCORE_FIELDNAMES = ["score_min", "score_max", "limite_maximo"]
+REQUEST_STATUSES = ["approved", "rejected", "requested_below_current"]
+FIRST_NAMES = ["Ana", "Bruno", "Carla", "Diego", "Elisa", "Fábio", "Gabriela", "Hugo"]
+LAST_NAMES = ["Silva", "Souza", "Oliveira", "Santos", "Pereira", "Lima", "Costa"]
+MAX_SCORE = 1000
+CHUNK_ROWS = 10000
+
+
+def client_cpf(index: int) -> str:
+    """Returns the unique 11-digit CPF of the index-th synthetic client."""
+    return f"{10000000000 + index:011d}"
+
+
+def client_birth_date(index: int) -> str:
+    """Returns the deterministic birth date of the index-th synthetic client."""
+    day = datetime.date(1950, 1, 1) + datetime.timedelta(days=(index * 7919) % 20000)
+    return day.isoformat()
+
+
+def _write_rows(path: Path, fieldnames: List[str], rows) -> int:
+    """Streams rows to a CSV file in chunks, so memory stays flat for millions of rows."""
+    count = 0
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        chunk: List[Dict[str, object]] = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) == CHUNK_ROWS:
+                writer.writerows(chunk)
+                count += len(chunk)
+                chunk = []
+        writer.writerows(chunk)
+        count += len(chunk)
+    return count
+
+
+def generate_clients(path: Path, count: int, seed: int = 0) -> int:
+    """Writes count clients with unique CPFs, random names, limits and scores."""
+    rng = random.Random(seed)
+
+    def rows():
+        for i in range(count):
+            yield {
+                "cpf": client_cpf(i),
+                "data_nascimento": client_birth_date(i),
+                "nome": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                "limite_atual": f"{rng.randrange(5, 300) * 100:.2f}",
+                "score": str(rng.randint(0, MAX_SCORE)),
+            }
+
+    return _write_rows(path, CLIENT_FIELDNAMES, rows())
+
+
+def generate_score_limits(path: Path, bands: int = 4) -> int:
+    """Writes contiguous score bands covering 0..MAX_SCORE with increasing limits."""
+    width = (MAX_SCORE + 1) / bands
+
+    def rows():
+        for i in range(bands):
+            yield {
+                "score_min": round(i * width),
+                "score_max": round((i + 1) * width) - 1,
+                "limite_maximo": 1000 * (i + 1) ** 2,
+            }
+
+    return _write_rows(path, SCORE_FIELDNAMES, rows())
+
+
+def generate_request_log(
+    path: Path, count: int, clients: int, seed: int = 0, days: int = 365
+) -> int:
+    """Writes count increase requests for random clients, in timestamp order over the given days."""
+    rng = random.Random(seed + 1)
+    start = datetime.datetime(2025, 1, 1)
+    step = datetime.timedelta(days=days) / max(count, 1)
+
+    def rows():
+        for i in range(count):
+            current = rng.randrange(5, 300) * 100
+            yield {
+                "cpf_cliente": client_cpf(rng.randrange(clients)),
+                "data_hora_solicitacao": (start + step * i).isoformat(),
+                "limite_atual": float(current),
+                "novo_limite_solicitado": float(current + rng.randrange(-20, 60) * 100),
+                "status_pedido": rng.choice(REQUEST_STATUSES),
+            }
+
+    return _write_rows(path, REQUEST_FIELDNAMES, rows())
+
+
+def generate_dataset(
+    out_dir: Path, clients: int, requests: int, bands: int = 4, seed: int = 0
+) -> Dict[str, Path]:
+    """Writes the three data files into out_dir and returns their paths."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths = {
+        "clients": out_dir / "clientes.csv",
+        "score_limits": out_dir / "score_limite.csv",
+        "requests": out_dir / "solicitacoes_aumento_limite.csv",
+    }
+    generate_clients(paths["clients"], clients, seed)
+    generate_score_limits(paths["score_limits"], bands)
+    generate_request_log(paths["requests"], requests, clients, seed)
+    return paths
+
+
+def main() -> int:
+    """Generates a dataset and returns a process exit code."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--out", type=Path, required=True)
+    parser.add_argument("--clients", type=int, default=10000)
+    parser.add_argument("--requests", type=int, default=10000)
+    parser.add_argument("--bands", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.clients < 1 or args.bands < 1 or args.requests < 0:
+        print("--clients and --bands must be positive, --requests non-negative")
+        return 1
+
+    paths = generate_dataset(
+        args.out, args.clients, args.requests, args.bands, args.seed
+    )
+    for name, path in paths.items():
+        print(f"{name}: {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
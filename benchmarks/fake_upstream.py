@@ -0,0 +1,238 @@
+"""Local stand-in for the Groq chat completions API and the Frankfurter /latest endpoint.
+
+Usage: python -m benchmarks.fake_upstream --port 8900 --latency lognormal --latency-ms 400 --rate-limit 0.02
+
+Point the API at it with GROQ_BASE_URL=http://127.0.0.1:8900 and
+FOREX_API_URL=http://127.0.0.1:8900/latest, plus any non-empty GROQ_API_KEY.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import AsyncIterator, Dict, List, NamedTuple
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "exponential", "lognormal")
+
+RATES_PER_EUR: Dict[str, float] = {
+    "AUD": 1.6512,
+    "BRL": 6.2418,
+    "CAD": 1.5007,
+    "CHF": 0.9402,
+    "CNY": 7.8103,
+    "GBP": 0.8551,
+    "JPY": 163.12,
+    "MXN": 20.113,
+    "USD": 1.0832,
+}
+
+REPLY_WORDS = (
+    "Olá! Analisei a sua solicitação com base nas informações disponíveis e "
+    "preparei um resumo claro para você. Se tiver outras dúvidas sobre limite, "
+    "câmbio ou a sua entrevista de crédito, é só perguntar."
+).split(" ")
+
+
+class UpstreamConfig(NamedTuple):
+    """Latency and failure behaviour of the fake upstream."""
+
+    latency: str = "lognormal"
+    latency_ms: float = 300.0
+    jitter: float = 0.5
+    token_delay_ms: float = 15.0
+    reply_tokens: int = 40
+    rate_limit: float = 0.0
+    retry_after: float = 1.0
+    fx_latency_ms: float = 20.0
+
+
+def sample_latency(distribution: str, mean_ms: float, jitter: float) -> float:
+    """Draws one delay in seconds with the given mean; jitter is the relative spread."""
+    if mean_ms <= 0:
+        return 0.0
+    if distribution == "fixed":
+        delay = mean_ms
+    elif distribution == "uniform":
+        delay = random.uniform(mean_ms * (1 - jitter), mean_ms * (1 + jitter))
+    elif distribution == "exponential":
+        delay = random.expovariate(1 / mean_ms)
+    else:
+        # mu is chosen so that the lognormal mean equals mean_ms.
+        sigma = max(jitter, 1e-6)
+        delay = random.lognormvariate(math.log(mean_ms) - sigma * sigma / 2, sigma)
+    return max(delay, 0.0) / 1000
+
+
+def _rate_limited(config: UpstreamConfig) -> JSONResponse:
+    return JSONResponse(
+        status_code=429,
+        headers={"retry-after": f"{config.retry_after:g}"},
+        content={
+            "error": {
+                "message": "Rate limit reached for model. Please try again later.",
+                "type": "tokens",
+                "code": "rate_limit_exceeded",
+            }
+        },
+    )
+
+
+def _reply_tokens(count: int) -> List[str]:
+    words = [REPLY_WORDS[i % len(REPLY_WORDS)] for i in range(max(count, 1))]
+    return [words[0]] + [" " + word for word in words[1:]]
+
+
+def _prompt_tokens(messages: List[Dict[str, str]]) -> int:
+    return sum(len(str(m.get("content", "")).split()) for m in messages) + 4
+
+
+def create_app(config: UpstreamConfig) -> FastAPI:
+    """Builds the fake upstream application for the given behaviour."""
+    app = FastAPI()
+    counters: Counter = Counter()
+    counters_lock = threading.Lock()
+
+    def count(key: str) -> None:
+        with counters_lock:
+            counters[key] += 1
+
+    @app.post("/openai/v1/chat/completions")
+    async def chat_completions(request: Request):
+        payload = await request.json()
+        count("chat_completions")
+        if config.rate_limit and random.random() < config.rate_limit:
+            count("chat_completions_429")
+            return _rate_limited(config)
+
+        model = payload.get("model", "llama-3.1-8b-instant")
+        tokens = _reply_tokens(config.reply_tokens)
+        prompt_tokens = _prompt_tokens(payload.get("messages") or [])
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        created = int(time.time())
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": len(tokens),
+            "total_tokens": prompt_tokens + len(tokens),
+        }
+
+        await asyncio.sleep(
+            sample_latency(config.latency, config.latency_ms, config.jitter)
+        )
+
+        if not payload.get("stream"):
+            return {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": "".join(tokens)},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": usage,
+            }
+
+        def chunk(delta: Dict[str, str], finish_reason=None, **extra) -> str:
+            body = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [
+                    {"index": 0, "delta": delta, "finish_reason": finish_reason}
+                ],
+                **extra,
+            }
+            return f"data: {json.dumps(body, ensure_ascii=False)}\n\n"
+
+        async def events() -> AsyncIterator[str]:
+            yield chunk({"role": "assistant", "content": ""})
+            for token in tokens:
+                await asyncio.sleep(config.token_delay_ms / 1000)
+                yield chunk({"content": token})
+            yield chunk({}, "stop", x_groq={"usage": usage})
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    @app.get("/latest")
+    async def latest(request: Request):
+        count("fx_latest")
+        await asyncio.sleep(
+            sample_latency(config.latency, config.fx_latency_ms, config.jitter)
+        )
+
+        base = request.query_params.get("from", "EUR").upper()
+        per_eur = dict(RATES_PER_EUR, EUR=1.0)
+        if base not in per_eur:
+            return JSONResponse(status_code=404, content={"message": "not found"})
+
+        wanted = request.query_params.get("to")
+        codes = wanted.upper().split(",") if wanted else sorted(per_eur)
+        rates = {
+            code: round(per_eur[code] / per_eur[base], 6)
+            for code in codes
+            if code in per_eur and code != base
+        }
+        return {
+            "amount": 1.0,
+            "base": base,
+            "date": time.strftime("%Y-%m-%d"),
+            "rates": rates,
+        }
+
+    @app.get("/__stats")
+    async def stats() -> Dict[str, int]:
+        with counters_lock:
+            return dict(counters)
+
+    return app
+
+
+def main() -> None:
+    """Serves the fake upstream until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency", choices=LATENCY_DISTRIBUTIONS, default="lognormal")
+    parser.add_argument("--latency-ms", type=float, default=300.0)
+    parser.add_argument("--jitter", type=float, default=0.5)
+    parser.add_argument("--token-delay-ms", type=float, default=15.0)
+    parser.add_argument("--reply-tokens", type=int, default=40)
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=0.0,
+        help="share of completions answered 429",
+    )
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--fx-latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    config = UpstreamConfig(
+        latency=args.latency,
+        latency_ms=args.latency_ms,
+        jitter=args.jitter,
+        token_delay_ms=args.token_delay_ms,
+        reply_tokens=args.reply_tokens,
+        rate_limit=args.rate_limit,
+        retry_after=args.retry_after,
+        fx_latency_ms=args.fx_latency_ms,
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+"""Open-loop load driver that runs chat scripts against the API and reports latency and errors.
+
+Usage: python -m benchmarks.loadtest --base-url http://127.0.0.1:8000 --rps 50 --duration 60
+
+Run the API against benchmarks.fake_upstream and a generated dataset, since
+credit and interview scripts update client limits and scores:
+
+    python -m benchmarks.datagen --out /tmp/bench-data --clients 10000 --requests 0
+    python -m benchmarks.fake_upstream --port 8900 &
+    GROQ_API_KEY=fake GROQ_BASE_URL=http://127.0.0.1:8900 \\
+        FOREX_API_URL=http://127.0.0.1:8900/latest \\
+        CSV_PATH=/tmp/bench-data/clientes.csv CLIENTS_CSV_PATH=/tmp/bench-data/clientes.csv \\
+        CREDIT_REQUESTS_CSV_PATH=/tmp/bench-data/solicitacoes_aumento_limite.csv \\
+        uvicorn main:app --port 8000
+    python -m benchmarks.loadtest --clients-csv /tmp/bench-data/clientes.csv --rps 50
+"""
+
+import argparse
+import asyncio
+import csv
+import datetime
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Optional
+
+import httpx
+
+from benchmarks.microbench import percentile
+
+SCENARIOS = ("screening", "credit", "interview", "forex")
+CURRENCIES = ["BRL", "USD", "EUR", "GBP", "JPY", "CAD"]
+JOB_TYPES = ["formal", "autônomo", "desempregado"]
+
+
+class Client(NamedTuple):
+    """Credentials and limit of one client the scripts act as."""
+
+    cpf: str
+    birth_date: str
+    limit: float
+
+
+class Sample(NamedTuple):
+    """Outcome of one HTTP request."""
+
+    name: str
+    latency: float
+    ok: bool
+
+
+class LoadRun:
+    """Issues scripted requests through one pooled client and collects their samples."""
+
+    def __init__(
+        self, http: httpx.AsyncClient, clients: List[Client], rng: random.Random
+    ) -> None:
+        self.http = http
+        self.clients = clients
+        self.rng = rng
+        self.samples: List[Sample] = []
+
+    async def call(
+        self,
+        method: str,
+        path: str,
+        name: str,
+        scheduled: Optional[float] = None,
+        **kwargs,
+    ) -> Optional[httpx.Response]:
+        """Sends one request, recording its latency and whether it returned a 2xx.
+
+        Latency is measured from scheduled when given, so time spent waiting
+        for a free connection or a busy event loop counts against the server.
+        """
+        started = time.perf_counter() if scheduled is None else scheduled
+        try:
+            response = await self.http.request(method, path, **kwargs)
+        except httpx.HTTPError:
+            self.samples.append(Sample(name, time.perf_counter() - started, False))
+            return None
+        ok = response.is_success
+        self.samples.append(Sample(name, time.perf_counter() - started, ok))
+        return response if ok else None
+
+    async def screening(self, scheduled: float) -> None:
+        """Greets the screening agent, then authenticates with CPF and birth date."""
+        client = self.rng.choice(self.clients)
+        birth = datetime.date.fromisoformat(client.birth_date).strftime("%d/%m/%Y")
+        headers: Dict[str, str] = {}
+        for message in ("Olá", client.cpf, birth):
+            response = await self.call(
+                "POST",
+                "/screening/chat",
+                "POST /screening/chat",
+                scheduled,
+                json={"message": message},
+                headers=headers,
+            )
+            if response is None:
+                return
+            scheduled = None
+            headers = {"X-Session-Id": response.headers.get("X-Session-Id", "")}
+        await self.call(
+            "POST", "/screening/reset", "POST /screening/reset", headers=headers
+        )
+
+    async def credit(self, scheduled: float) -> None:
+        """Looks up the limit, then asks for an increase around it."""
+        client = self.rng.choice(self.clients)
+        response = await self.call(
+            "GET", f"/credit/limit/{client.cpf}", "GET /credit/limit/{cpf}", scheduled
+        )
+        limit = response.json().get("limit", client.limit) if response else client.limit
+        await self.call(
+            "POST",
+            "/credit/increase",
+            "POST /credit/increase",
+            json={
+                "cpf": client.cpf,
+                "requested_limit": round(
+                    max(limit, 100.0) * self.rng.uniform(0.8, 1.6), 2
+                ),
+            },
+        )
+
+    async def interview(self, scheduled: float) -> None:
+        """Submits one credit interview with random answers."""
+        client = self.rng.choice(self.clients)
+        income = self.rng.randrange(1000, 20000)
+        await self.call(
+            "POST",
+            "/interview",
+            "POST /interview",
+            scheduled,
+            json={
+                "cpf": client.cpf,
+                "monthly_income": income,
+                "monthly_expenses": self.rng.randrange(500, income + 1000),
+                "job_type": self.rng.choice(JOB_TYPES),
+                "dependents_count": self.rng.randint(0, 4),
+                "has_debt": self.rng.random() < 0.3,
+            },
+        )
+
+    async def forex(self, scheduled: float) -> None:
+        """Quotes one random currency pair."""
+        base, target = self.rng.sample(CURRENCIES, 2)
+        await self.call(
+            "POST",
+            "/forex/quote",
+            "POST /forex/quote",
+            scheduled,
+            json={
+                "base": base,
+                "target": target,
+                "amount": self.rng.randrange(1, 5000),
+            },
+        )
+
+
+def load_clients(path: Path, limit: int = 10000) -> List[Client]:
+    """Reads up to limit clients from a clients CSV."""
+    clients = []
+    with path.open("r", encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            clients.append(
+                Client(
+                    row["cpf"],
+                    row["data_nascimento"],
+                    float(row.get("limite_atual") or 0),
+                )
+            )
+            if len(clients) >= limit:
+                break
+    return clients
+
+
+def summarize(
+    samples: List[Sample], elapsed: float, dropped: int = 0
+) -> Dict[str, Dict[str, float]]:
+    """Groups samples per request name, plus an "all" row, into throughput, percentiles and error rates.
+
+    Scripts dropped at the in-flight cap count as failed requests of the "all"
+    row, so overload shows up as errors instead of vanishing from the report.
+    """
+    groups: Dict[str, List[Sample]] = {"all": samples}
+    for sample in samples:
+        groups.setdefault(sample.name, []).append(sample)
+
+    summary = {}
+    for name, group in groups.items():
+        if not group:
+            continue
+        latencies = sorted(s.latency * 1000 for s in group)
+        errors = sum(1 for s in group if not s.ok)
+        requests = len(group)
+        if name == "all":
+            errors += dropped
+            requests += dropped
+        summary[name] = {
+            "requests": requests,
+            "throughput_rps": len(group) / elapsed if elapsed else 0.0,
+            "errors": errors,
+            "error_rate": errors / requests,
+            "p50_ms": percentile(latencies, 0.50),
+            "p95_ms": percentile(latencies, 0.95),
+            "p99_ms": percentile(latencies, 0.99),
+            "max_ms": latencies[-1],
+        }
+    return summary
+
+
+async def run_load(
+    base_url: str,
+    clients: List[Client],
+    scenarios: List[str],
+    rps: float,
+    duration: float,
+    max_in_flight: int,
+    timeout: float,
+    seed: int,
+) -> Dict[str, object]:
+    """Starts one script every 1/rps seconds for duration seconds, never waiting on earlier ones."""
+    rng = random.Random(seed)
+    limits = httpx.Limits(max_connections=max_in_flight, max_keepalive_connections=100)
+    async with httpx.AsyncClient(
+        base_url=base_url, timeout=timeout, limits=limits
+    ) as http:
+        run = LoadRun(http, clients, rng)
+        scripts: Dict[str, Callable[[float], Awaitable[None]]] = {
+            name: getattr(run, name) for name in scenarios
+        }
+        in_flight: set = set()
+        dropped = 0
+        started = time.perf_counter()
+        total = int(rps * duration)
+
+        for i in range(total):
+            scheduled = started + i / rps
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if len(in_flight) >= max_in_flight:
+                dropped += 1
+                continue
+            task = asyncio.create_task(scripts[rng.choice(scenarios)](scheduled))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+
+        if in_flight:
+            await asyncio.wait(in_flight)
+        elapsed = time.perf_counter() - started
+
+    return {
+        "meta": {
+            "base_url": base_url,
+            "target_rps": rps,
+            "duration_s": duration,
+            "elapsed_s": elapsed,
+            "scripts_started": total - dropped,
+            "scripts_dropped": dropped,
+            "scenarios": scenarios,
+        },
+        "results": summarize(run.samples, elapsed, dropped),
+    }
+
+
+def main() -> int:
+    """Runs the load test and returns a process exit code."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--clients-csv", type=Path, default=Path("data/clientes.csv"))
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS)
+    parser.add_argument(
+        "--rps", type=float, default=10.0, help="scripts started per second"
+    )
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--max-in-flight", type=int, default=500)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    clients = load_clients(args.clients_csv)
+    if not clients:
+        print(f"No clients in {args.clients_csv}")
+        return 1
+
+    report = asyncio.run(
+        run_load(
+            args.base_url,
+            clients,
+            args.scenario or list(SCENARIOS),
+            args.rps,
+            args.duration,
+            args.max_in_flight,
+            args.timeout,
+            args.seed,
+        )
+    )
+
+    print(
+        f"{'request':28} {'n':>7} {'rps':>8} {'err%':>6} {'p50':>8} {'p95':>8} {'p99':>8}"
+    )
+    for name, row in sorted(report["results"].items()):
+        print(
+            f"{name:28} {row['requests']:>7} {row['throughput_rps']:>8.1f} "
+            f"{100 * row['error_rate']:>6.2f} {row['p50_ms']:>8.1f} "
+            f"{row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f}"
+        )
+    if report["meta"]["scripts_dropped"]:
+        print(f"dropped {report['meta']['scripts_dropped']} scripts at --max-in-flight")
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
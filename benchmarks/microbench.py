@@ -0,0 +1,232 @@
+"""Microbenchmarks of the service hot paths with latency percentiles and allocations, written as JSON.
+
+Usage: python -m benchmarks.microbench --clients 100000 --iterations 500 --output bench.json
+       python -m benchmarks.microbench --compare bench-before.json bench.json
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from app.controllers.auth_controller import AuthController
+from app.repositories.client_repository import CsvClientRepository
+from app.repositories.credit_request_repository import CsvCreditRequestRepository
+from app.services.credit_service import CreditService
+from app.services.interview_service import InterviewService
+from app.utils.auth_utils import normalize_birth_date
+from benchmarks.datagen import client_birth_date, client_cpf, generate_dataset
+from frontend.ui.formatting import sanitize_ai_reply
+
+Operation = Callable[[int], object]
+
+SAMPLE_REPLY = (
+    "**Olá!** Seu limite atual é de `R$ 15.000,00`.\n"
+    "- Você pode solicitar um _aumento_ a qualquer momento.\n"
+    '```json\n{"debug": true}\n```\n'
+    "<b>Obrigado</b> por usar o   Banco Ágil."
+)
+BIRTH_DATE_FORMATS = ["%d/%m/%Y", "%Y-%m-%d", "%d%m%Y"]
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Returns the nearest-rank percentile of an ascending list."""
+    index = min(
+        len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1)
+    )
+    return sorted_values[index]
+
+
+def measure(
+    operation: Operation, iterations: int, warmup: int, alloc_iterations: int
+) -> Dict[str, float]:
+    """Times each call and, in a separate traced pass, measures the memory it allocates."""
+    for i in range(warmup):
+        operation(i)
+
+    timings: List[float] = []
+    for i in range(iterations):
+        started = time.perf_counter_ns()
+        operation(warmup + i)
+        timings.append((time.perf_counter_ns() - started) / 1000)
+    timings.sort()
+
+    tracemalloc.start()
+    try:
+        offset = warmup + iterations
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for i in range(alloc_iterations):
+            operation(offset + i)
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "iterations": iterations,
+        "mean_us": sum(timings) / len(timings),
+        "min_us": timings[0],
+        "p50_us": percentile(timings, 0.50),
+        "p90_us": percentile(timings, 0.90),
+        "p95_us": percentile(timings, 0.95),
+        "p99_us": percentile(timings, 0.99),
+        "max_us": timings[-1],
+        "ops_per_second": 1e6 * len(timings) / sum(timings) if sum(timings) else 0.0,
+        "retained_bytes_per_op": (after - before) / max(alloc_iterations, 1),
+        "peak_bytes": peak - before,
+    }
+
+
+def build_operations(
+    data_dir: Path, clients: int, persistence: str, seed: int
+) -> Dict[str, Operation]:
+    """Wires the services to the generated files and returns one callable per benchmarked operation."""
+    clients_csv = str(data_dir / "clientes.csv")
+    client_repository = CsvClientRepository(clients_csv, persistence=persistence)
+    credit = CreditService(
+        clients_csv_path=clients_csv,
+        score_limits_csv_path=str(data_dir / "score_limite.csv"),
+        requests_csv_path=str(data_dir / "solicitacoes_aumento_limite.csv"),
+        clients=client_repository,
+        requests=CsvCreditRequestRepository(
+            str(data_dir / "solicitacoes_aumento_limite.csv")
+        ),
+    )
+    interview = InterviewService(clients_csv, clients=client_repository)
+    auth = AuthController(clients=client_repository)
+
+    rng = random.Random(seed)
+    cpfs = [client_cpf(rng.randrange(clients)) for _ in range(4096)]
+    birth_dates = [
+        datetime.date.fromisoformat(client_birth_date(i)).strftime(
+            BIRTH_DATE_FORMATS[i % len(BIRTH_DATE_FORMATS)]
+        )
+        for i in range(len(cpfs))
+    ]
+
+    def cpf_at(i: int) -> str:
+        return cpfs[i % len(cpfs)]
+
+    def login(i: int) -> object:
+        index = (i * 7919) % clients
+        return auth.login(client_cpf(index), client_birth_date(index))
+
+    return {
+        "credit.get_client_by_cpf": lambda i: credit.get_client_by_cpf(cpf_at(i)),
+        "credit.evaluate_increase_request": lambda i: (
+            credit.evaluate_increase_request(cpf_at(i), rng.randrange(5, 400) * 100.0)
+        ),
+        "credit.update_client_limit": lambda i: credit.update_client_limit(
+            cpf_at(i), rng.randrange(5, 300) * 100.0
+        ),
+        "interview.update_client_score": lambda i: interview.update_client_score(
+            cpf_at(i), rng.randint(0, 1000)
+        ),
+        "auth.login": login,
+        "auth_utils.normalize_birth_date": lambda i: normalize_birth_date(
+            birth_dates[i % len(birth_dates)]
+        ),
+        "formatting.sanitize_ai_reply": lambda i: sanitize_ai_reply(SAMPLE_REPLY),
+    }
+
+
+def git_commit() -> Optional[str]:
+    """Returns the checked-out commit, or None outside a git work tree."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(before_path: Path, after_path: Path) -> int:
+    """Prints the p50/p99 ratios of two result files, after/before, per operation."""
+    before = json.loads(before_path.read_text(encoding="utf-8"))["results"]
+    after = json.loads(after_path.read_text(encoding="utf-8"))["results"]
+    print(f"{'operation':40} {'p50 x':>8} {'p99 x':>8} {'bytes/op x':>11}")
+    for name in sorted(set(before) & set(after)):
+        ratios = []
+        for key in ("p50_us", "p99_us", "retained_bytes_per_op"):
+            old, new = before[name][key], after[name][key]
+            ratios.append(f"{new / old:.2f}" if old else "-")
+        print(f"{name:40} {ratios[0]:>8} {ratios[1]:>8} {ratios[2]:>11}")
+    return 0
+
+
+def main() -> int:
+    """Runs the selected benchmarks and returns a process exit code."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=10000)
+    parser.add_argument("--requests", type=int, default=10000)
+    parser.add_argument("--bands", type=int, default=4)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--alloc-iterations", type=int, default=50)
+    parser.add_argument(
+        "--persistence", choices=["rewrite", "journal"], default="rewrite"
+    )
+    parser.add_argument("--only", action="append", default=[])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--compare", nargs=2, type=Path, metavar=("BEFORE", "AFTER"))
+    args = parser.parse_args()
+
+    if args.compare:
+        return compare(*args.compare)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        generate_dataset(data_dir, args.clients, args.requests, args.bands, args.seed)
+        operations = build_operations(
+            data_dir, args.clients, args.persistence, args.seed
+        )
+        selected = [name for name in operations if not args.only or name in args.only]
+
+        results = {}
+        for name in selected:
+            results[name] = measure(
+                operations[name], args.iterations, args.warmup, args.alloc_iterations
+            )
+            print(
+                f"{name:40} p50 {results[name]['p50_us']:>10.1f}us "
+                f"p99 {results[name]['p99_us']:>10.1f}us "
+                f"{results[name]['retained_bytes_per_op']:>10.0f} B/op",
+                file=sys.stderr,
+            )
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.datetime.utcnow().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "clients": args.clients,
+            "requests": args.requests,
+            "bands": args.bands,
+            "iterations": args.iterations,
+            "persistence": args.persistence,
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
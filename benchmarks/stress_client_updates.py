@@ -0,0 +1,158 @@
+"""Concurrency stress check proving that client updates are not lost across processes and threads.
+
+Usage: python -m benchmarks.stress_client_updates --mode journal --processes 4 --threads 8
+"""
+
+import argparse
+import csv
+import multiprocessing
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import List
+
+from app.repositories.client_repository import CsvClientRepository
+
+FIELDNAMES = ["cpf", "data_nascimento", "nome", "limite_atual", "score"]
+SHARED_CPF = "99999999999"
+
+
+def owned_cpf(process_id: int, thread_id: int, slot: int) -> str:
+    """Returns the CPF updated exclusively by one worker thread."""
+    return f"{process_id:03d}{thread_id:03d}{slot:05d}"
+
+
+def build_clients_csv(path: Path, processes: int, threads: int, slots: int) -> None:
+    """Writes a clients file containing every CPF the workers will update."""
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        writer.writerow(
+            {
+                "cpf": SHARED_CPF,
+                "data_nascimento": "1990-01-01",
+                "nome": "Shared",
+                "limite_atual": "0.00",
+                "score": "0",
+            }
+        )
+        for p in range(processes):
+            for t in range(threads):
+                for s in range(slots):
+                    writer.writerow(
+                        {
+                            "cpf": owned_cpf(p, t, s),
+                            "data_nascimento": "1990-01-01",
+                            "nome": f"Client {p}-{t}-{s}",
+                            "limite_atual": "0.00",
+                            "score": "0",
+                        }
+                    )
+
+
+def run_worker(
+    csv_path: str, mode: str, process_id: int, threads: int, slots: int, rounds: int
+) -> None:
+    """Updates this process's clients and the shared client from several threads."""
+    repository = CsvClientRepository(csv_path, persistence=mode, compact_threshold=50)
+
+    def work(thread_id: int) -> None:
+        for r in range(rounds):
+            for s in range(slots):
+                cpf = owned_cpf(process_id, thread_id, s)
+                repository.update_field(cpf, "limite_atual", f"{r + 1}.00")
+                repository.update_field(cpf, "score", str(r + 1))
+            repository.update_field(SHARED_CPF, "nome", f"{process_id}-{thread_id}")
+
+    workers = [threading.Thread(target=work, args=(t,)) for t in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    if mode == "journal":
+        repository.compact()
+
+
+def verify(
+    csv_path: str, processes: int, threads: int, slots: int, rounds: int
+) -> List[str]:
+    """Returns a description of every update missing from the final CSV."""
+    with open(csv_path, "r", encoding="utf-8", newline="") as f:
+        rows = {row["cpf"]: row for row in csv.DictReader(f)}
+
+    errors = []
+    for p in range(processes):
+        for t in range(threads):
+            for s in range(slots):
+                row = rows.get(owned_cpf(p, t, s))
+                if row is None:
+                    errors.append(f"{owned_cpf(p, t, s)}: row missing")
+                elif row["limite_atual"] != f"{rounds}.00" or row["score"] != str(
+                    rounds
+                ):
+                    errors.append(
+                        f"{owned_cpf(p, t, s)}: limite_atual={row['limite_atual']} "
+                        f"score={row['score']}"
+                    )
+
+    shared = rows.get(SHARED_CPF, {}).get("nome", "")
+    if shared.count("-") != 1:
+        errors.append(f"{SHARED_CPF}: unexpected nome {shared!r}")
+    return errors
+
+
+def main() -> int:
+    """Runs the stress check and returns a process exit code."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mode", choices=["rewrite", "journal"], default="journal")
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--slots", type=int, default=5)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "clientes.csv"
+        build_clients_csv(csv_path, args.processes, args.threads, args.slots)
+
+        procs = [
+            multiprocessing.Process(
+                target=run_worker,
+                args=(
+                    str(csv_path),
+                    args.mode,
+                    p,
+                    args.threads,
+                    args.slots,
+                    args.rounds,
+                ),
+            )
+            for p in range(args.processes)
+        ]
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join()
+            if proc.exitcode != 0:
+                print(f"worker exited with code {proc.exitcode}")
+                return 1
+
+        errors = verify(
+            str(csv_path), args.processes, args.threads, args.slots, args.rounds
+        )
+
+    updates = args.processes * args.threads * (args.slots * 2 + 1) * args.rounds
+    if errors:
+        print(f"LOST UPDATES ({len(errors)} of {updates} checks failed):")
+        for error in errors[:20]:
+            print(" ", error)
+        return 1
+
+    print(f"OK: {updates} updates in {args.mode} mode, none lost")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""Command-line bulk evaluation of credit limit increase requests from a CSV or NDJSON file.
+
+Usage: python bulk_credit.py campaign.csv [--output results.csv] [--replies]
+"""
+
+import argparse
+import asyncio
+import csv
+import os
+import sys
+from collections import Counter
+from pathlib import Path
+
+from app.agents.credit_agent import CreditAgent
+from app.repositories.factory import close_repositories
+from app.services.credit_service import CreditService
+from app.utils.bulk_input import detect_format, parse_increase_requests
+
+RESULT_FIELDNAMES = [
+    "cpf",
+    "current_limit",
+    "requested_limit",
+    "max_allowed_limit",
+    "status",
+    "reply",
+]
+
+
+def main() -> int:
+    """Evaluates the input file, writes one result row per request and prints status counts."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("input", help="CSV or NDJSON file with cpf and requested_limit")
+    parser.add_argument("--format", choices=["csv", "ndjson"])
+    parser.add_argument("--output", help="results CSV path (default: stdout)")
+    parser.add_argument(
+        "--replies",
+        action="store_true",
+        help="add one LLM explanation per decision status",
+    )
+    args = parser.parse_args()
+
+    input_path = Path(args.input)
+    fmt = args.format or detect_format(input_path.suffix)
+    try:
+        increase_requests = parse_increase_requests(
+            input_path.read_text(encoding="utf-8-sig"),
+            fmt,
+            max_rows=int(os.getenv("CREDIT_BULK_MAX_ROWS", "100000")),
+        )
+    except ValueError as exc:
+        print(f"{input_path}: {exc}", file=sys.stderr)
+        return 1
+
+    service = CreditService(
+        clients_csv_path=os.getenv("CLIENTS_CSV_PATH", "data/clientes.csv"),
+        score_limits_csv_path=os.getenv(
+            "SCORE_LIMITS_CSV_PATH", "data/score_limite.csv"
+        ),
+        requests_csv_path=os.getenv(
+            "CREDIT_REQUESTS_CSV_PATH", "data/solicitacoes_aumento_limite.csv"
+        ),
+    )
+    try:
+        results = service.evaluate_increase_requests(increase_requests)
+    finally:
+        close_repositories()
+
+    summary = Counter(result["status"] for result in results)
+    replies = {}
+    if args.replies:
+        agent = CreditAgent()
+        statuses = sorted(set(summary) - {"client_not_found"})
+
+        async def build_replies():
+            return await asyncio.gather(
+                *(agent.build_increase_reply({"status": s}) for s in statuses)
+            )
+
+        replies = dict(zip(statuses, asyncio.run(build_replies())))
+
+    out = open(args.output, "w", encoding="utf-8", newline="") if args.output else None
+    try:
+        writer = csv.DictWriter(out or sys.stdout, fieldnames=RESULT_FIELDNAMES)
+        writer.writeheader()
+        for result in results:
+            writer.writerow({**result, "reply": replies.get(result["status"], "")})
+    finally:
+        if out is not None:
+            out.close()
+
+    for status, count in sorted(summary.items()):
+        print(f"{status}: {count}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,193 @@
+"""Shared HTTP client used by every frontend service to talk to the backend API."""
+
+import json
+import os
+from typing import Any, Dict, Iterator, NamedTuple, Optional, Tuple
+
+import requests
+import streamlit as st
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+Timeout = Tuple[float, float]
+
+DEFAULT_TIMEOUTS: Dict[str, Timeout] = {
+    "screening_chat": (3.0, 30.0),
+    "screening_reset": (3.0, 5.0),
+    "credit_limit": (3.0, 30.0),
+    "credit_increase": (3.0, 30.0),
+    "interview": (3.0, 30.0),
+    "forex_quote": (3.0, 30.0),
+}
+
+
+class ApiResult(NamedTuple):
+    """Decoded JSON body of a successful call, or the chat reply describing why it failed."""
+
+    data: Optional[Dict[str, Any]]
+    error: Optional[str]
+
+
+def connection_error_reply(service_name: str, exc: Exception) -> str:
+    """Describes a failure to reach the API as a chat reply."""
+    return f"❌ Erro ao conectar com a API de {service_name}: {exc}"
+
+
+def status_error_reply(service_name: str, response: requests.Response) -> str:
+    """Describes a non-200 API response as a chat reply."""
+    try:
+        data = response.json()
+        detail = data.get("detail") or data
+    except Exception:
+        detail = response.text
+    return f"❌ Erro da API de {service_name} ({response.status_code}): {detail}"
+
+
+class ReplyStream:
+    """Iterates the reply tokens of an SSE endpoint while recording its meta payload.
+
+    Pass an instance to write_sanitized_stream; after it is exhausted, meta
+    holds the structured result and failed tells whether an error message was
+    yielded.
+    """
+
+    def __init__(
+        self,
+        session: requests.Session,
+        method: str,
+        url: str,
+        service_name: str,
+        timeout: Timeout,
+        **kwargs: Any,
+    ) -> None:
+        self._session = session
+        self._method = method
+        self._url = url
+        self._service_name = service_name
+        self._timeout = timeout
+        self._kwargs = kwargs
+        self.meta: Dict[str, Any] = {}
+        self.failed = False
+
+    def _error(self, message: str) -> Iterator[str]:
+        self.failed = True
+        yield message
+
+    def __iter__(self) -> Iterator[str]:
+        try:
+            response = self._session.request(
+                self._method,
+                self._url,
+                stream=True,
+                timeout=self._timeout,
+                **self._kwargs,
+            )
+        except requests.RequestException as exc:
+            yield from self._error(connection_error_reply(self._service_name, exc))
+            return
+
+        with response:
+            if response.status_code != 200:
+                yield from self._error(status_error_reply(self._service_name, response))
+                return
+
+            event: Optional[str] = None
+            try:
+                for line in response.iter_lines(decode_unicode=True):
+                    if line.startswith("event:"):
+                        event = line[len("event:") :].strip()
+                    elif line.startswith("data:"):
+                        data = json.loads(line[len("data:") :])
+                        if event == "meta":
+                            self.meta = data
+                        elif event == "token":
+                            yield data
+                    elif not line:
+                        event = None
+            except requests.RequestException as exc:
+                yield from self._error(
+                    f"\n❌ Conexão com a API de {self._service_name} interrompida: {exc}"
+                )
+
+
+class ApiClient:
+    """Keeps one keep-alive connection pool to the backend and maps failures to chat replies."""
+
+    def __init__(
+        self,
+        base_url: str,
+        pool_size: int = 20,
+        timeouts: Optional[Dict[str, Timeout]] = None,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.timeouts = {**DEFAULT_TIMEOUTS, **(timeouts or {})}
+
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def request(
+        self, method: str, path: str, service_name: str, endpoint: str, **kwargs: Any
+    ) -> ApiResult:
+        """Calls the API and returns its JSON body, or an error reply for the chat."""
+        try:
+            response = self.session.request(
+                method,
+                f"{self.base_url}{path}",
+                timeout=self.timeouts[endpoint],
+                **kwargs,
+            )
+        except requests.RequestException as exc:
+            return ApiResult(None, connection_error_reply(service_name, exc))
+
+        if response.status_code != 200:
+            return ApiResult(None, status_error_reply(service_name, response))
+
+        try:
+            return ApiResult(response.json(), None)
+        except ValueError:
+            return ApiResult(None, f"❌ Resposta inválida da API de {service_name}.")
+
+    def stream(
+        self, method: str, path: str, service_name: str, endpoint: str, **kwargs: Any
+    ) -> ReplyStream:
+        """Returns a lazy SSE reply stream for the endpoint."""
+        return ReplyStream(
+            self.session,
+            method,
+            f"{self.base_url}{path}",
+            service_name,
+            self.timeouts[endpoint],
+            **kwargs,
+        )
+
+    def close(self) -> None:
+        """Closes every pooled connection."""
+        self.session.close()
+
+
+def _timeouts_from_env() -> Dict[str, Timeout]:
+    """Reads API_TIMEOUT_<ENDPOINT> read-timeout overrides, in seconds."""
+    timeouts = {}
+    for endpoint, (connect, read) in DEFAULT_TIMEOUTS.items():
+        value = os.getenv(f"API_TIMEOUT_{endpoint.upper()}")
+        if value:
+            timeouts[endpoint] = (connect, float(value))
+    return timeouts
+
+
+@st.cache_resource
+def get_api_client() -> ApiClient:
+    """Creates the process-wide API client once and shares it across reruns and sessions."""
+    load_dotenv()
+
+    api_base_url = os.getenv("API_BASE_URL")
+    if not api_base_url:
+        raise RuntimeError("API_BASE_URL is not set.")
+
+    return ApiClient(
+        api_base_url,
+        pool_size=int(os.getenv("API_POOL_SIZE", "20")),
+        timeouts=_timeouts_from_env(),
+    )
@@ -1,80 +1,23 @@
 """Utility functions for communicating with the credit API endpoints."""
 
-import os
-from typing import Dict, Any
-import requests
+from frontend.service.api_client import ReplyStream, get_api_client
 
-from dotenv import load_dotenv
+SERVICE_NAME = "crédito"
 
-load_dotenv()
 
-API_BASE_URL = os.getenv("API_BASE_URL")
-if not API_BASE_URL:
-    raise RuntimeError("API_BASE_URL is not set.")
+def stream_credit_limit(cpf: str) -> ReplyStream:
+    """Streams the credit limit explanation; meta["limit"] holds the limit once exhausted."""
+    return get_api_client().stream(
+        "GET", f"/credit/limit/{cpf}/stream", SERVICE_NAME, "credit_limit"
+    )
 
 
-def get_credit_limit(cpf: str) -> Dict[str, Any]:
-    """Requests the user's current credit limit from the API."""
-    url = f"{API_BASE_URL}/credit/limit/{cpf}"
-
-    try:
-        response = requests.get(url, timeout=30)
-    except requests.RequestException as exc:
-        return {
-            "reply": f"❌ Erro ao conectar com a API de crédito: {exc}",
-            "limit": None,
-        }
-
-    if response.status_code != 200:
-        try:
-            data = response.json()
-            detail = data.get("detail") or data
-        except Exception:
-            detail = response.text
-        return {
-            "reply": f"❌ Erro da API de crédito ({response.status_code}): {detail}",
-            "limit": None,
-        }
-
-    data = response.json()
-    return {
-        "reply": data.get(
-            "reply",
-            "❌ Resposta inesperada da API de crédito ao consultar limite.",
-        ),
-        "limit": data.get("limit"),
-    }
-
-
-def request_credit_increase(cpf: str, requested_limit: float) -> Dict[str, Any]:
-    """Sends a credit limit increase request to the API."""
-    url = f"{API_BASE_URL}/credit/increase"
-    payload = {"cpf": cpf, "requested_limit": requested_limit}
-
-    try:
-        response = requests.post(url, json=payload, timeout=30)
-    except requests.RequestException as exc:
-        return {
-            "reply": f"❌ Erro ao conectar com a API de crédito: {exc}",
-            "data": None,
-        }
-
-    if response.status_code != 200:
-        try:
-            data = response.json()
-            detail = data.get("detail") or data
-        except Exception:
-            detail = response.text
-        return {
-            "reply": f"❌ Erro da API de crédito ({response.status_code}): {detail}",
-            "data": None,
-        }
-
-    data = response.json()
-    return {
-        "reply": data.get(
-            "reply",
-            "❌ Resposta inesperada da API de crédito ao solicitar aumento.",
-        ),
-        "data": data.get("data"),
-    }
+def stream_credit_increase(cpf: str, requested_limit: float) -> ReplyStream:
+    """Streams the limit increase decision; meta["data"] holds the evaluation once exhausted."""
+    return get_api_client().stream(
+        "POST",
+        "/credit/increase/stream",
+        SERVICE_NAME,
+        "credit_increase",
+        json={"cpf": cpf, "requested_limit": requested_limit},
+    )
@@ -1,28 +1,19 @@
 """Utility function for sending credit interview data to the API."""
 
-import os
-from typing import Dict, Any
-import requests
+from frontend.service.api_client import ReplyStream, get_api_client
 
-from dotenv import load_dotenv
+SERVICE_NAME = "entrevista de crédito"
 
-load_dotenv()
 
-API_BASE_URL = os.getenv("API_BASE_URL")
-if not API_BASE_URL:
-    raise RuntimeError("API_BASE_URL is not set.")
-
-
-def run_credit_interview(
+def stream_credit_interview(
     cpf: str,
     monthly_income: float,
     monthly_expenses: float,
     job_type: str,
     dependents_count: int,
     has_debt: bool,
-) -> Dict[str, Any]:
-    """Sends credit interview data to the API and returns the score and response message."""
-    url = f"{API_BASE_URL}/interview"
+) -> ReplyStream:
+    """Streams the credit interview explanation; meta["score"] holds the score once exhausted."""
     payload = {
         "cpf": cpf,
         "monthly_income": monthly_income,
@@ -31,31 +22,6 @@ def run_credit_interview(
         "dependents_count": dependents_count,
         "has_debt": has_debt,
     }
-
-    try:
-        response = requests.post(url, json=payload, timeout=30)
-    except requests.RequestException as exc:
-        return {
-            "reply": f"❌ Erro ao conectar com a API de entrevista de crédito: {exc}",
-            "score": None,
-        }
-
-    if response.status_code != 200:
-        try:
-            data = response.json()
-            detail = data.get("detail") or data
-        except Exception:
-            detail = response.text
-        return {
-            "reply": f"❌ Erro da API de entrevista de crédito ({response.status_code}): {detail}",
-            "score": None,
-        }
-
-    data = response.json()
-    return {
-        "reply": data.get(
-            "reply",
-            "❌ Resposta inesperada da API de entrevista de crédito.",
-        ),
-        "score": data.get("score"),
-    }
+    return get_api_client().stream(
+        "POST", "/interview/stream", SERVICE_NAME, "interview", json=payload
+    )
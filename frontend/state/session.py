@@ -1,5 +1,6 @@
 """Utility functions for initializing and managing Streamlit session state."""
 
+import uuid
 from typing import Optional
 import streamlit as st
 
@@ -24,6 +25,8 @@ def init_session_state() -> None:
         st.session_state.interview_data = {}
     if "awaiting_fx_params" not in st.session_state:
         st.session_state.awaiting_fx_params = False
+    if "screening_session_id" not in st.session_state:
+        st.session_state.screening_session_id = uuid.uuid4().hex
 
 
 def maybe_store_cpf_from_input(user_input: str) -> None:
@@ -0,0 +1,19 @@
+"""Utility function for rendering streamed AI replies as they arrive."""
+
+from typing import Iterable
+
+import streamlit as st
+
+from frontend.ui.formatting import sanitize_ai_reply
+
+
+def write_sanitized_stream(tokens: Iterable[str]) -> str:
+    """Renders streamed tokens as sanitized plain text, matching the stored history, and returns the reply."""
+    placeholder = st.empty()
+    text = ""
+    reply = ""
+    for token in tokens:
+        text += token
+        reply = sanitize_ai_reply(text)
+        placeholder.text(reply)
+    return reply
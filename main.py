@@ -1,16 +1,48 @@
 """TODO"""
 
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+
+from app.infrastructure.middleware.metrics_middleware import MetricsMiddleware
+from app.infrastructure.middleware.profiling_middleware import ProfilingMiddleware
+from app.repositories.factory import close_repositories
+from app.services.forex_service import close_http_session, get_http_session
+from app.utils.llm_client import close_async_client, save_completion_caches
+from app.utils.metrics import metrics_enabled
 from app.routers.screening_router import router as screening_router
 from app.routers.auth_router import router as auth_router
 from app.routers.credit_router import router as credit_router
 from app.routers.forex_router import router as forex_router
 from app.routers.interview_router import router as interview_router
+from app.routers.metrics_router import router as metrics_router
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Opens the pooled forex session, then on shutdown flushes logs, persists LLM caches and closes clients."""
+    get_http_session()
+    yield
+    try:
+        close_repositories()
+    finally:
+        save_completion_caches()
+        await close_async_client()
+        close_http_session()
+
+
+app = FastAPI(lifespan=lifespan)
+
+if metrics_enabled():
+    app.add_middleware(MetricsMiddleware)
 
-app = FastAPI()
+if os.getenv("PROFILING_ADMIN_TOKEN"):
+    app.add_middleware(ProfilingMiddleware)
 
 app.include_router(auth_router)
 app.include_router(screening_router)
 app.include_router(credit_router)
 app.include_router(forex_router)
 app.include_router(interview_router)
+app.include_router(metrics_router)
@@ -3,19 +3,20 @@
 import streamlit as st
 
 from frontend.service.screening_service import (
-    send_message_to_screening,
+    stream_message_to_screening,
     reset_screening_backend,
 )
 from frontend.service.credit_service import (
-    get_credit_limit,
-    request_credit_increase,
+    stream_credit_limit,
+    stream_credit_increase,
 )
-from frontend.service.interview_service import run_credit_interview
-from frontend.service.forex_service import get_fx_quote
+from frontend.service.interview_service import stream_credit_interview
+from frontend.service.forex_service import stream_fx_quote
 
 from frontend.state.session import init_session_state, maybe_store_cpf_from_input
-from frontend.ui.formatting import parse_brl_amount, sanitize_ai_reply
+from frontend.ui.formatting import parse_brl_amount
 from frontend.ui.menu import build_menu_text
+from frontend.ui.streaming import write_sanitized_stream
 
 
 def main() -> None:
@@ -91,15 +92,15 @@ def main() -> None:
             st.rerun()
             return
 
-        result = request_credit_increase(st.session_state.cpf, amount)
-        reply = sanitize_ai_reply(result["reply"])
+        with st.chat_message("assistant"):
+            reply = write_sanitized_stream(
+                stream_credit_increase(st.session_state.cpf, amount)
+            )
         menu_text = build_menu_text()
 
         st.session_state.messages.append(
             {"role": "assistant", "content": reply, "mode": "text"}
         )
-        with st.chat_message("assistant"):
-            st.text(reply)
 
         st.session_state.messages.append(
             {"role": "assistant", "content": menu_text, "mode": "markdown"}
@@ -273,22 +274,22 @@ def main() -> None:
                 st.rerun()
                 return
 
-            result = run_credit_interview(
-                cpf=st.session_state.cpf,
-                monthly_income=data["monthly_income"],
-                monthly_expenses=data["monthly_expenses"],
-                job_type=data["job_type"],
-                dependents_count=data["dependents_count"],
-                has_debt=data["has_debt"],
-            )
-            reply = sanitize_ai_reply(result["reply"])
+            with st.chat_message("assistant"):
+                reply = write_sanitized_stream(
+                    stream_credit_interview(
+                        cpf=st.session_state.cpf,
+                        monthly_income=data["monthly_income"],
+                        monthly_expenses=data["monthly_expenses"],
+                        job_type=data["job_type"],
+                        dependents_count=data["dependents_count"],
+                        has_debt=data["has_debt"],
+                    )
+                )
             menu_text = build_menu_text()
 
             st.session_state.messages.append(
                 {"role": "assistant", "content": reply, "mode": "text"}
             )
-            with st.chat_message("assistant"):
-                st.text(reply)
 
             st.session_state.messages.append(
                 {"role": "assistant", "content": menu_text, "mode": "markdown"}
@@ -338,15 +339,13 @@ def main() -> None:
             st.rerun()
             return
 
-        result = get_fx_quote(base, target, amount)
-        reply = sanitize_ai_reply(result["reply"])
+        with st.chat_message("assistant"):
+            reply = write_sanitized_stream(stream_fx_quote(base, target, amount))
         menu_text = build_menu_text()
 
         st.session_state.messages.append(
             {"role": "assistant", "content": reply, "mode": "text"}
         )
-        with st.chat_message("assistant"):
-            st.text(reply)
 
         st.session_state.messages.append(
             {"role": "assistant", "content": menu_text, "mode": "markdown"}
@@ -373,7 +372,7 @@ def main() -> None:
         with st.chat_message("assistant"):
             st.markdown(goodbye)
 
-        reset_screening_backend()
+        reset_screening_backend(st.session_state.screening_session_id)
         st.session_state.clear()
         st.rerun()
         return
@@ -398,15 +397,15 @@ def main() -> None:
             st.rerun()
             return
 
-        result = get_credit_limit(st.session_state.cpf)
-        credit_reply = sanitize_ai_reply(result["reply"])
+        with st.chat_message("assistant"):
+            credit_reply = write_sanitized_stream(
+                stream_credit_limit(st.session_state.cpf)
+            )
         menu_text = build_menu_text()
 
         st.session_state.messages.append(
             {"role": "assistant", "content": credit_reply, "mode": "text"}
         )
-        with st.chat_message("assistant"):
-            st.text(credit_reply)
 
         st.session_state.messages.append(
             {"role": "assistant", "content": menu_text, "mode": "markdown"}
@@ -495,11 +494,14 @@ def main() -> None:
     with st.chat_message("user"):
         st.markdown(user_input)
 
-    result = send_message_to_screening(user_input)
-    reply = sanitize_ai_reply(result["reply"])
+    stream = stream_message_to_screening(
+        user_input, st.session_state.screening_session_id
+    )
+    with st.chat_message("assistant"):
+        reply = write_sanitized_stream(stream)
 
     if not st.session_state.authenticated and (
-        result.get("authenticated", False)
+        stream.meta.get("authenticated", False)
         or "autenticação realizada com sucesso" in reply.lower()
         or "você já está autenticado" in reply.lower()
     ):
@@ -511,8 +513,6 @@ def main() -> None:
         st.session_state.messages.append(
             {"role": "assistant", "content": reply, "mode": "text"}
         )
-        with st.chat_message("assistant"):
-            st.text(reply)
 
         st.session_state.messages.append(
             {"role": "assistant", "content": menu_text, "mode": "markdown"}
@@ -526,8 +526,6 @@ def main() -> None:
     st.session_state.messages.append(
         {"role": "assistant", "content": reply, "mode": "text"}
     )
-    with st.chat_message("assistant"):
-        st.text(reply)
 
     st.rerun()
 